@@ -6,7 +6,8 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont, QColor
-from PyQt6.QtWebEngineWidgets import QWebEngineView
+
+from render_mathjax import VistaMathJax
 
 # Matplotlib & Venn
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
@@ -17,34 +18,21 @@ except ImportError:
     venn2 = None
 
 # ===============================================================
-#                  PLANTILLA HTML (AZUL)
+#                  ESTILOS HTML (AZUL)
 # ===============================================================
-HTML_TEMPLATE = """
-<!DOCTYPE html>
-<html>
-<head>
-<meta charset="utf-8">
-<script src="https://polyfill.io/v3/polyfill.min.js?features=es6"></script>
-<script id="MathJax-script" async src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>
-<style>
-    body {{ font-family: 'Segoe UI', sans-serif; background-color: #ffffff; color: #333; padding: 10px; }}
-    .card {{ 
+ESTILOS_HTML = """
+    body { font-family: 'Segoe UI', sans-serif; background-color: #ffffff; color: #333; padding: 10px; }
+    .card { 
         background: #f0f7ff; /* Azul muy pálido */
         border-left: 5px solid #1E88E5; /* AZUL PRINCIPAL */
         padding: 15px; 
         margin-bottom: 15px; 
         border-radius: 5px; 
         box-shadow: 0 2px 5px rgba(0,0,0,0.05);
-    }}
-    h3 {{ color: #1565C0; border-bottom: 1px solid #BBDEFB; padding-bottom: 5px; margin-top: 0; }}
-    p {{ font-size: 1.1em; line-height: 1.6; }}
-    .empty {{ color: #999; font-style: italic; }}
-</style>
-</head>
-<body>
-{content}
-</body>
-</html>
+    }
+    h3 { color: #1565C0; border-bottom: 1px solid #BBDEFB; padding-bottom: 5px; margin-top: 0; }
+    p { font-size: 1.1em; line-height: 1.6; }
+    .empty { color: #999; font-style: italic; }
 """
 
 class CalculadoraConjuntos(QWidget):
@@ -155,7 +143,7 @@ class CalculadoraConjuntos(QWidget):
         gl.addWidget(self.canvas)
         
         # 2. Resultados Web (LaTeX)
-        self.web_view = QWebEngineView()
+        self.web_view = VistaMathJax(ESTILOS_HTML)
         self.web_view.setStyleSheet("background: white;")
         self.web_view.page().setBackgroundColor(Qt.GlobalColor.white)
 
@@ -206,7 +194,7 @@ class CalculadoraConjuntos(QWidget):
         return "#90A4AE"
 
     def _set_html(self, content):
-        self.web_view.setHtml(HTML_TEMPLATE.format(content=content))
+        self.web_view.mostrar(content)
 
     # ===============================================================
     #                  LÓGICA MATEMÁTICA
@@ -6,14 +6,66 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtGui import QFont, QTextCursor, QGuiApplication
 from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtWebEngineWidgets import QWebEngineView
+from render_mathjax import VistaMathJax
+from algebra_exacta import FactorizacionExacta, a_enteros, factorizar
+import metricas
 from fractions import Fraction
+from math import comb, prod
 import html
 
+# Hasta este tamaño Cramer muestra la expansión por cofactores de cada A_i;
+# arriba, det(A_i) sale de la factorización de A (det(A_i) = det(A)·x_i)
+CRAMER_PASOS_MAX = 4
+
+# Hasta este tamaño Bareiss muestra la matriz después de cada paso;
+# arriba, solo el resultado
+BAREISS_PASOS_MAX = 8
+
+# La expansión por cofactores se despliega nivel por nivel mientras la
+# cantidad de menores distintos del nivel (C(n, nivel)) no pase de
+# COFACTORES_MENORES_MAX: con 70 se expande completo hasta un 8×8 (un 9×9
+# completo son ~740 KB de LaTeX). Los menores más profundos se resumen con
+# su determinante por Bareiss.
+# Los de más de COFACTORES_LATEX_MAX filas se nombran sin escribir la matriz.
+# El procedimiento va en bloques que la vista compone por separado: cada
+# menor de más de COFACTORES_BLOQUE_FILAS filas, un bloque por término.
+COFACTORES_MENORES_MAX = 70
+COFACTORES_LATEX_MAX = 8
+COFACTORES_BLOQUE_FILAS = 4
+
+
+# Estilos del procedimiento (tarjetas + MathJax)
+ESTILOS_PROCEDIMIENTO = """
+    body {
+        background-color: #F0F4F8;
+        font-family: 'Segoe UI', sans-serif;
+        padding: 10px;
+    }
+    .card {
+        background: #FFFFFF;
+        border-radius: 12px;
+        padding: 16px 20px;
+        box-shadow: 0 2px 6px rgba(0,0,0,0.15);
+        margin-bottom: 10px;
+    }
+    pre {
+        font-family: Consolas, 'Courier New', monospace;
+        font-size: 13px;
+        white-space: pre-wrap;
+    }
+    h3, h4 {
+        margin-top: 0;
+    }
+    .pasos mjx-container[jax="SVG"][display="true"] {
+        text-align: left;
+        margin: 2px 0;
+    }
+"""
 
 class VentanaDeterminantes(QWidget):
     """
     Ventana para cálculo de determinantes:
+      - Eliminación sin fracciones (Bareiss), O(n³)
       - Cofactores (expansión)
       - Regla de Sarrus (3x3)
       - Método de Cramer (Ax = b)
@@ -113,6 +165,7 @@ class VentanaDeterminantes(QWidget):
 
         self.metodo_combo = QComboBox()
         self.metodo_combo.addItems([
+            "Eliminación (Bareiss)",
             "Cofactores (expansión)",
             "Regla de Sarrus (3x3)",
             "Cramer (Ax = b)"
@@ -176,7 +229,7 @@ class VentanaDeterminantes(QWidget):
             "color:transparent; background:transparent; border:none;"
         )
 
-        self.procedimiento_web = QWebEngineView()
+        self.procedimiento_web = VistaMathJax(ESTILOS_PROCEDIMIENTO)
 
         splitter = QSplitter(Qt.Orientation.Vertical)
         splitter.addWidget(self.procedimiento_text)
@@ -219,44 +272,7 @@ class VentanaDeterminantes(QWidget):
         Renderiza body_html dentro de una plantilla HTML con estilos
         tipo tarjeta y soporte MathJax para LaTeX.
         """
-        full_html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8"/>
-            <style>
-                body {{
-                    background-color: #F0F4F8;
-                    font-family: 'Segoe UI', sans-serif;
-                    padding: 10px;
-                }}
-                .card {{
-                    background: #FFFFFF;
-                    border-radius: 12px;
-                    padding: 16px 20px;
-                    box-shadow: 0 2px 6px rgba(0,0,0,0.15);
-                    margin-bottom: 10px;
-                }}
-                pre {{
-                    font-family: Consolas, 'Courier New', monospace;
-                    font-size: 13px;
-                    white-space: pre-wrap;
-                }}
-                h3, h4 {{
-                    margin-top: 0;
-                }}
-            </style>
-            <script src="https://polyfill.io/v3/polyfill.min.js?features=es6"></script>
-            <script id="MathJax-script" async
-                src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js">
-            </script>
-        </head>
-        <body>
-            {body_html}
-        </body>
-        </html>
-        """
-        self.procedimiento_web.setHtml(full_html)
+        self.procedimiento_web.mostrar(body_html)
 
     def _fmt(self, x: Fraction) -> str:
         return str(x.numerator) if x.denominator == 1 else str(x)
@@ -406,7 +422,90 @@ class VentanaDeterminantes(QWidget):
             "<div class='card'>Matrices limpiadas. Vuelve a ingresar datos.</div>"
         )
 
-    
+    # ===============================================================
+    #          ELIMINACIÓN SIN FRACCIONES (BAREISS)
+    # ===============================================================
+    def _latex_bareiss(self, f: FactorizacionExacta) -> str:
+        """
+        F después del último paso de f. Bajo cada pivote F guarda el
+        multiplicador del paso; en pantalla va el 0 que corresponde.
+        """
+        k = len(f.pivotes)
+        filas = []
+        for i, fila in enumerate(f.F):
+            hasta = f.pivotes[i] if i < k else f.pivotes[-1] + 1
+            filas.append([0] * hasta + fila[hasta:])
+        return self._latex_matriz(filas)
+
+    @metricas.medido("bareiss: determinante_bareiss_latex")
+    def determinante_bareiss_latex(self, M):
+        """
+        Calcula el determinante por eliminación sin fracciones (Bareiss):
+        O(n³) operaciones con enteros exactos, sin expandir menores.
+        Devuelve:
+            det  : Fraction
+            latex: str (procedimiento en LaTeX REAL, sin $$)
+        """
+        n = len(M)
+        F0, L = a_enteros(M)
+        pasos = "\\textbf{Eliminación sin fracciones (Bareiss)}\\\\[8pt]"
+
+        if any(l != 1 for l in L):
+            pasos += (
+                "\\text{Cada fila se multiplica por el m.c.m. de sus denominadores: }"
+                "F_i = L_i\\, A_i,\\ L = (" + ", ".join(str(l) for l in L) + ")\\\\[4pt]"
+            )
+        pasos += f"F = {self._latex_matriz(F0)} \\\\[8pt]"
+        pasos += (
+            "\\text{En cada paso } k:\\ "
+            "F_i \\leftarrow \\dfrac{p_k F_i - a_{i,k} F_k}{p_{k-1}}\\ (i > k),"
+            "\\ p_0 = 1 \\text{ (la división es exacta)}\\\\[8pt]"
+        )
+
+        def al_paso(f, sel):
+            nonlocal pasos
+            k = len(f.pivotes)
+            if sel != k - 1:
+                pasos += f"\\text{{Paso {k}: }} F_{{{k}}} \\leftrightarrow F_{{{sel+1}}}\\\\[4pt]"
+            else:
+                pasos += f"\\text{{Paso {k}:}}\\\\[4pt]"
+            pasos += (
+                f"p_{{{k}}} = {f.d[-1]},\\ p_{{{k-1}}} = {f.d[-2]}\\\\[4pt]"
+                f"{self._latex_bareiss(f)} \\\\[8pt]"
+            )
+
+        if n <= BAREISS_PASOS_MAX:
+            f = FactorizacionExacta(M, al_paso)
+        else:
+            f = factorizar(M)
+            pasos += (
+                f"\\text{{({n} filas: se omiten las matrices intermedias)}}\\\\[8pt]"
+            )
+
+        det = f.determinante()
+        if not f.invertible:
+            pasos += (
+                f"\\text{{Solo hay {f.rango} pivotes para {n} columnas: }}"
+                f"\\operatorname{{rango}}(A) = {f.rango} < {n}"
+                " \\Rightarrow \\det(A) = 0"
+            )
+            return det, pasos
+
+        det_F = f.signo * f.d[-1]
+        signo = "" if f.signo == 1 else "-"
+        pasos += (
+            f"\\det(F) = {signo}p_{{{n}}} = {det_F}"
+            + ("" if f.signo == 1 else "\\quad\\text{(número impar de intercambios)}")
+        )
+        escala = prod(L)
+        if escala != 1:
+            pasos += (
+                "\\\\[4pt]\\det(A) = \\dfrac{\\det(F)}{L_1\\cdots L_n}"
+                f" = \\dfrac{{{det_F}}}{{{escala}}}"
+                f" = {self._fmt_frac_latex(det)}"
+            )
+        return det, pasos
+
     # ===============================================================
     #          MÉTODO DE COFACTORES 
     # ===============================================================
@@ -417,8 +516,52 @@ class VentanaDeterminantes(QWidget):
             det  : Fraction
             latex: str (procedimiento en LaTeX REAL, sin $$)
         """
+        det, bloques = self.determinante_cofactores_bloques(M)
+        return det, "".join(bloques)
+
+    @metricas.medido("cofactores: expansión en LaTeX")
+    def determinante_cofactores_bloques(self, M):
+        """
+        Como determinante_cofactores_latex, pero el procedimiento es una
+        lista de bloques para componer cada uno por separado (los términos
+        de los menores de más de COFACTORES_BLOQUE_FILAS filas van aparte).
+        Cada menor se identifica por las filas y columnas de M que se
+        quitaron (máscaras de bits) y se calcula una sola vez; si otra rama
+        lo vuelve a necesitar, se cita su valor. Así hay a lo sumo 2ⁿ
+        menores distintos en vez de n!. Solo se despliegan los niveles con
+        a lo sumo COFACTORES_MENORES_MAX menores distintos; los de más
+        abajo muestran su determinante calculado por Bareiss.
+        """
+        n0 = len(M)
+        niveles = 0
+        while niveles < n0 - 2 and comb(n0, niveles + 1) <= COFACTORES_MENORES_MAX:
+            niveles += 1
+
+        # (filas quitadas, columnas quitadas) -> (det, referencia en LaTeX).
+        # Los menores del primer nivel no se repiten: no se guardan.
+        memo = {}
+
+        def _referencia(filas, cols):
+            quitadas = lambda mascara: ",".join(str(k + 1) for k in range(n0) if mascara >> k & 1)
+            return (
+                f"\\text{{(sin filas }}{quitadas(filas)}"
+                f"\\text{{ y columnas }}{quitadas(cols)}\\text{{ de }}A\\text{{)}}"
+            )
+
+        def _resumen(A, nivel):
+            # Menor que ya no se expande: su determinante sale en O(k³)
+            indent = "\\quad" * nivel
+            k = len(A)
+            det_A = FactorizacionExacta(A).determinante()
+            latex_line = (
+                f"{indent}\\det(M) = {self._fmt_frac_latex(det_A)}"
+                f"\\quad\\text{{(por Bareiss, sin expandir el menor }}{k}\\times{k}\\text{{)}}"
+                "\\\\[10pt]"
+            )
+            return det_A, [latex_line]
 
-        def _det(A, nivel):
+        def _det(A, filas, cols, nivel):
+            metricas.contar("cofactores: llamadas recursivas")
             n = len(A)
             indent = "\\quad" * nivel  # sangría visual en LaTeX
 
@@ -430,7 +573,7 @@ class VentanaDeterminantes(QWidget):
                     f"{indent}\\det([ {self._fmt_frac_latex(a)} ])"
                     f" = {self._fmt_frac_latex(a)}\\\\[10pt]"
                 )
-                return a, latex_line
+                return a, [latex_line]
 
             # ---------- CASO 2x2 ----------
             if n == 2:
@@ -448,59 +591,86 @@ class VentanaDeterminantes(QWidget):
                     f" - {self._fmt_frac_latex(b)}\\cdot{self._fmt_frac_latex(c)}"
                     f" = {self._fmt_frac_latex(det_2)}\\\\[10pt]"
                 )
-                return det_2, latex_line
+                return det_2, [latex_line]
 
             # ---------- CASO GENERAL n×n ----------
             det_total = Fraction(0)
-            pasos = (
+            bloques = [
                 f"{indent}\\textbf{{Expansión por cofactores en la fila 1}}\\\\[8pt]"
-            )
+            ]
+
+            # Fila 1 de este menor y columnas de M que le quedan
+            fila_1 = next(r for r in range(n0) if not filas >> r & 1)
+            columnas = [c for c in range(n0) if not cols >> c & 1]
 
             # Recorremos columnas de la fila 1
-            for j in range(n):
+            for j, col in enumerate(columnas):
                 a_1j = A[0][j]
 
                 # Si el elemento es 0, la contribución es 0
                 if a_1j == 0:
-                    pasos += (
+                    bloques.append(
                         f"{indent}\\text{{a(1,{j+1}) = 0 → contribución 0}}\\\\[6pt]"
                     )
                     continue
 
-                # Construir submatriz M_{1,j+1} eliminando fila 1 y columna j
-                sub = []
-                for r in range(1, n):
-                    fila_sub = []
-                    for c in range(n):
-                        if c == j:
-                            continue
-                        fila_sub.append(A[r][c])
-                    sub.append(fila_sub)
-
-                # Determinante recursivo del menor
-                det_sub, latex_sub = _det(sub, nivel + 1)
-
                 # Signo (-1)^(1+j) → con j de 0 a n-1 es (-1)^j
                 signo = Fraction(-1) ** j
-                contrib = signo * a_1j * det_sub
+                clave = (filas | 1 << fila_1, cols | 1 << col)
+
+                if clave in memo:
+                    # El menor ya apareció en otra rama: se cita su valor
+                    metricas.contar("cofactores: menores reutilizados")
+                    det_sub, referencia = memo[clave]
+                    pasos = (
+                        f"{indent}\\text{{Eliminar fila 1 y columna {j+1}: menor ya calculado }}"
+                        f"{referencia}\\\\[4pt]"
+                        f"{indent}\\det(M_{{1,{j+1}}}) = {self._fmt_frac_latex(det_sub)}\\\\[4pt]"
+                    )
+                else:
+                    # Menor M_{1,j+1}: fila 1 y columna j fuera
+                    sub = [fila[:j] + fila[j + 1:] for fila in A[1:]]
 
-                # Menor en LaTeX (submatriz)
-                M_latex = self._latex_matriz(sub)
-                pasos += (
-                    f"{indent}\\text{{Eliminar fila 1 y columna {j+1}:}}\\\\[4pt]"
-                    f"{indent}M_{{1,{j+1}}} = {M_latex} \\\\[6pt]"
-                )
+                    # Determinante recursivo del menor (o resumido, si es muy profundo)
+                    if nivel + 1 < niveles or len(sub) <= 2:
+                        det_sub, latex_sub = _det(sub, *clave, nivel + 1)
+                    else:
+                        det_sub, latex_sub = _resumen(sub, nivel + 1)
 
-                # Cofactor y determinante del menor
-                pasos += (
-                    f"{indent}C_{{1,{j+1}}} = "
-                    f"(-1)^{{1+{j+1}}}"
-                    f"{self._fmt_frac_latex(a_1j)}"
-                    f"\\det(M_{{1,{j+1}}})\\\\[4pt]"
-                )
+                    # Menor en LaTeX (submatriz); desde el segundo nivel,
+                    # con las filas y columnas de A que se quitaron
+                    if len(sub) <= COFACTORES_LATEX_MAX:
+                        M_latex = self._latex_matriz(sub)
+                    else:
+                        M_latex = f"\\text{{(matriz }}{len(sub)}\\times{len(sub)}\\text{{)}}"
+                    if nivel > 0:
+                        referencia = _referencia(*clave)
+                        memo[clave] = (det_sub, referencia)
+                        M_latex += f"\\quad{referencia}"
+                    pasos = (
+                        f"{indent}\\text{{Eliminar fila 1 y columna {j+1}:}}\\\\[4pt]"
+                        f"{indent}M_{{1,{j+1}}} = {M_latex} \\\\[6pt]"
+                    )
+
+                    # Cofactor y determinante del menor
+                    pasos += (
+                        f"{indent}C_{{1,{j+1}}} = "
+                        f"(-1)^{{1+{j+1}}}"
+                        f"{self._fmt_frac_latex(a_1j)}"
+                        f"\\det(M_{{1,{j+1}}})\\\\[4pt]"
+                    )
 
-                # Pasos internos del determinante del menor (más indentado)
-                pasos += latex_sub + "\\\\[4pt]"
+                    # Pasos internos del determinante del menor (más indentado).
+                    # Los de un menor grande quedan en sus propios bloques
+                    latex_sub[-1] += "\\\\[4pt]"
+                    if len(sub) > COFACTORES_BLOQUE_FILAS:
+                        bloques.append(pasos)
+                        bloques.extend(latex_sub)
+                        pasos = ""
+                    else:
+                        pasos += "".join(latex_sub)
+
+                contrib = signo * a_1j * det_sub
 
                 # Contribución a la suma total
                 pasos += (
@@ -511,17 +681,17 @@ class VentanaDeterminantes(QWidget):
                     f" = {self._fmt_frac_latex(contrib)}\\\\[10pt]"
                 )
 
+                bloques.append(pasos)
                 det_total += contrib
 
-            pasos += (
+            bloques.append(
                 f"{indent}\\textbf{{Suma de contribuciones: }} "
                 f"{self._fmt_frac_latex(det_total)}"
             )
 
-            return det_total, pasos
+            return det_total, bloques
 
-        det, latex = _det(M, nivel=0)
-        return det, latex
+        return _det(M, 0, 0, nivel=0)
 
     # ===============================================================
     #      REGLA DE SARRUS (3x3) — LaTeX REAL (PARTE 3)
@@ -707,7 +877,10 @@ class VentanaDeterminantes(QWidget):
         Devuelve:
             soluciones : lista[Fraction]
             latex      : str (procedimiento completo en LaTeX, sin $$)
-        Usa determinante_cofactores_latex para det(A) y det(A_i).
+        Hasta CRAMER_PASOS_MAX, det(A) y cada det(A_i) se muestran por
+        cofactores. Arriba, det(A) sale por Bareiss, x de la factorización
+        PLU de A (algebra_exacta, reutilizada si ya se calculó) y
+        det(A_i) = det(A)·x_i.
         """
         n = len(A)
         if n == 0 or len(A[0]) != n:
@@ -719,10 +892,20 @@ class VentanaDeterminantes(QWidget):
             if len(fila) != 1:
                 raise ValueError("B debe ser un vector columna (una sola columna).")
 
+        # Un sistema singular se descarta en O(n³) antes de expandir cofactores
+        factorizacion = factorizar(A)
+        if not factorizacion.invertible:
+            raise ValueError("det(A) = 0 → el sistema no tiene solución única (Cramer no aplica).")
+        # Sin pasos por cofactores de cada A_i, x sale directo de la factorización
+        x = None if n <= CRAMER_PASOS_MAX else [fila[0] for fila in factorizacion.resolver(B)]
+
         # =======================
         # 1) Determinante de A
         # =======================
-        detA, latex_detA_pasos = self.determinante_cofactores_latex(A)
+        if x is None:
+            detA, latex_detA_pasos = self.determinante_cofactores_latex(A)
+        else:
+            detA, latex_detA_pasos = self.determinante_bareiss_latex(A)
         if detA == 0:
             raise ValueError("det(A) = 0 → el sistema no tiene solución única (Cramer no aplica).")
 
@@ -761,16 +944,24 @@ class VentanaDeterminantes(QWidget):
                         fila_mod.append(A[r][c])
                 A_mod.append(fila_mod)
 
-            # Determinante de A_i por cofactores (con LaTeX)
-            detAi, latex_detAi_pasos = self.determinante_cofactores_latex(A_mod)
+            if x is None:
+                # Determinante de A_i por cofactores (con LaTeX)
+                detAi, latex_detAi_pasos = self.determinante_cofactores_latex(A_mod)
+                xi = detAi / detA
+            else:
+                # det(A_i) = det(A)·x_i: no hace falta otro determinante
+                xi = x[i]
+                detAi = detA * xi
+                latex_detAi_pasos = (
+                    "\\text{Con la factorización PLU de } A:\\ "
+                    "\\det(A_{" + str(i+1) + "}) = \\det(A)\\, x_{" + str(i+1) + "}"
+                )
+
             det_mods.append(detAi)
+            soluciones.append(xi)
 
             latex_Ai = self._latex_matriz(A_mod)
             latex_detAi = self._fmt_frac_latex(detAi)
-
-            # x_i = det(A_i) / det(A)
-            xi = detAi / detA
-            soluciones.append(xi)
             latex_xi = self._fmt_frac_latex(xi)
 
             latex_global += (
@@ -826,24 +1017,22 @@ class VentanaDeterminantes(QWidget):
             latex_A = self._latex_matriz(A)
 
             # --------------------------------------------------------
-            #   1) MÉTODO: COFACTORES (EXPANSIÓN)
+            #   0) MÉTODO: ELIMINACIÓN SIN FRACCIONES (BAREISS)
             # --------------------------------------------------------
-            if metodo == "Cofactores (expansión)":
-                det, latex_pasos = self.determinante_cofactores_latex(A)
+            if metodo == "Eliminación (Bareiss)":
+                det, latex_pasos = self.determinante_bareiss_latex(A)
                 latex_det = self._fmt_frac_latex(det)
 
-                # Guardamos LaTeX crudo en el QTextEdit oculto
                 latex_crudo = (
-                    "\\textbf{Método de cofactores (expansión)}\n"
+                    "\\textbf{Eliminación sin fracciones (Bareiss)}\n"
                     f"A = {latex_A}\n"
                     f"{latex_pasos}\n"
                     f"\\det(A) = {latex_det}"
                 )
                 self.procedimiento_text.setPlainText(latex_crudo)
 
-                # Tarjeta HTML con MathJax (ahora en vertical con aligned)
                 body = "<div class='card'>"
-                body += "<h3>Método de cofactores (expansión)</h3>"
+                body += "<h3>Eliminación sin fracciones (Bareiss)</h3>"
                 body += f"$$ A = {latex_A} $$"
                 body += "<h4>Procedimiento paso a paso:</h4>"
                 body += f"$$ \\begin{{aligned}} {latex_pasos} \\end{{aligned}} $$"
@@ -854,6 +1043,41 @@ class VentanaDeterminantes(QWidget):
                 self._set_html_content(body)
                 return
 
+            # --------------------------------------------------------
+            #   1) MÉTODO: COFACTORES (EXPANSIÓN)
+            # --------------------------------------------------------
+            elif metodo == "Cofactores (expansión)":
+                det, bloques = self.determinante_cofactores_bloques(A)
+                latex_pasos = "".join(bloques)
+                latex_det = self._fmt_frac_latex(det)
+
+                # Guardamos LaTeX crudo en el QTextEdit oculto
+                latex_crudo = (
+                    "\\textbf{Método de cofactores (expansión)}\n"
+                    f"A = {latex_A}\n"
+                    f"{latex_pasos}\n"
+                    f"\\det(A) = {latex_det}"
+                )
+                self.procedimiento_text.setPlainText(latex_crudo)
+
+                # Tarjeta HTML con MathJax (ahora en vertical con aligned).
+                # Un aligned por bloque (ver COFACTORES_BLOQUE_FILAS): la
+                # vista compone cada bloque cuando entra en pantalla
+                body = "<div class='card' data-bloques>"
+                body += "<h3>Método de cofactores (expansión)</h3>"
+                body += f"<div>$$ A = {latex_A} $$</div>"
+                body += "<h4>Procedimiento paso a paso:</h4>"
+                body += "<div class='pasos' data-bloques>"
+                for bloque in bloques:
+                    body += f"<div>$$ \\begin{{aligned}} {bloque} \\end{{aligned}} $$</div>"
+                body += "</div>"
+                body += "<h4>Resultado:</h4>"
+                body += f"<div>$$ \\det(A) = {latex_det} $$</div>"
+                body += "</div>"
+
+                self._set_html_content(body)
+                return
+
             # --------------------------------------------------------
             #   2) MÉTODO: REGLA DE SARRUS (3x3)
             # --------------------------------------------------------
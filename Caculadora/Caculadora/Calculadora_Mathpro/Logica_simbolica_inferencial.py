@@ -48,6 +48,24 @@ class MotorLogico:
         except:
             return -1
 
+    @staticmethod
+    def tabla_verdad(variables, py_prems, py_conc):
+        """
+        Recorre todas las combinaciones de valores (V primero).
+        Devuelve (filas, valido, contraejemplo), con
+        filas = [(valores de las variables, de las premisas, de la conclusión)].
+        """
+        filas = []
+        valido, contra = True, None
+        for vals in itertools.product([1, 0], repeat=len(variables)):
+            env = dict(zip(variables, vals))
+            rps = [MotorLogico.evaluar(p, env) for p in py_prems]
+            rc = MotorLogico.evaluar(py_conc, env)
+            if all(r == 1 for r in rps) and rc != 1:
+                valido, contra = False, env
+            filas.append((env, rps, rc))
+        return filas, valido, contra
+
 # =============================================================================
 #  HOJA DE ESTILOS (CSS PROFESIONAL)
 # =============================================================================
@@ -256,9 +274,8 @@ class VentanaLogica(QWidget):
             QMessageBox.critical(self, "Error", "Error traduciendo fórmulas.")
             return
 
-        n = len(vars_list)
-        combs = list(itertools.product([1, 0], repeat=n))
-        
+        filas, valid, contra = MotorLogico.tabla_verdad(vars_list, py_prems, py_conc)
+
         # HTML Construction (Estilo Tabla de Excel Bonita)
         html = """
         <style>
@@ -286,27 +303,13 @@ class VentanaLogica(QWidget):
         for i in range(len(raw_prems)): html += f"<th>P{i+1}</th>"
         html += "<th>Conclusión</th></tr>"
 
-        valid = True
-        contra = None
-
-        for vals in combs:
-            env = dict(zip(vars_list, vals))
-            try:
-                rps = [MotorLogico.evaluar(p, env) for p in py_prems]
-                rc = MotorLogico.evaluar(py_conc, env)
-            except:
-                self.viewer.setHtml("<h3 style='color:red'>Error de sintaxis en fórmulas</h3>")
-                return
-
+        for env, rps, rc in filas:
             all_p = all(r==1 for r in rps)
             
             cls = ""
             if all_p:
                 if rc == 1: cls = "class='crit'" # Fila crítica válida
-                else:
-                    cls = "class='fail'" # Contraejemplo
-                    valid = False
-                    contra = env
+                else: cls = "class='fail'" # Contraejemplo
             
             html += f"<tr {cls}>"
             for v in vars_list: html += f"<td>{'V' if env[v] else 'F'}</td>"
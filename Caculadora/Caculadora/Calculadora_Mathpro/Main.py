@@ -1,16 +1,22 @@
 import sys
 import os
 
+# Primero, para que el perfil de arranque (MATHPRO_PERFIL) cuente desde aquí
+import perfil_arranque
+from perfil_arranque import tramo
+
 os.environ["QT_OPENGL"] = "software"
 os.environ["QTWEBENGINE_CHROMIUM_FLAGS"] = "--disable-gpu"
 os.environ["QTWEBENGINE_DISABLE_SANDBOX"] = "1"
 
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QIcon
+with tramo("import PyQt6", "import"):
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtGui import QIcon
 
 # Importamos la clase MainWindow desde tu archivo MenuPrincipal.py
 try:
-    from MenuPrincipal import MainWindow
+    with tramo("import MenuPrincipal", "import"):
+        from MenuPrincipal import MainWindow
 except ImportError:
     print("Error: No se encontró el archivo 'MenuPrincipal.py'.")
     print("Asegúrate de que el código del menú esté guardado con ese nombre en esta carpeta.")
@@ -20,10 +26,12 @@ except ImportError:
 #  EJECUCIÓN brutal que lanza la aplicación
 # =============================================================================
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
+    with tramo("QApplication"):
+        app = QApplication(sys.argv)
     
   
     window = MainWindow()
+    perfil_arranque.al_primer_pintado(window, salir=os.environ.get("MATHPRO_PERFIL_SALIR") == "1")
     window.show()
     
 
@@ -2,70 +2,84 @@
 #jorge la bestia 
 import re
 import copy
+import math
 from fractions import Fraction
 
+import numpy as np
+
 from PyQt6.QtCore import Qt
 
 from PyQt6.QtWidgets import (
     QWidget, QLabel, QLineEdit, QPushButton, QVBoxLayout, QHBoxLayout,
     QComboBox, QTableWidget, QTableWidgetItem, QTextEdit, QDialog,
-    QPlainTextEdit, QHeaderView, QSplitter, QSizePolicy 
+    QPlainTextEdit, QHeaderView, QSplitter, QSizePolicy, QCheckBox
 )
-from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 
+from render_mathjax import VistaMathJax
+from algebra_exacta import (
+    EliminacionExacta, escalonada_reducida, factorizar,
+    inversa as inversa_exacta, producto as producto_exacto,
+)
+import algebra_rapida
+import metricas
+
 
 # ===============================================================
-#                  MATHJAX TEMPLATE (Material Design)
+#                  ESTILOS MATHJAX (Material Design)
 # ===============================================================
 
-HTML_MATHJAX_TEMPLATE = """
-<!DOCTYPE html>
-<html>
-<head>
-<meta charset="utf-8">
-
-<script src="https://polyfill.io/v3/polyfill.min.js?features=es6"></script>
-<script id="MathJax-script" async
-    src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>
-
-<style>
-body {{
+ESTILOS_MATHJAX = """
+body {
     font-family: 'Segoe UI', sans-serif;
     background: #FAFAFA;
     margin: 12px;
-}}
+}
 
-.card {{
+.card {
     padding: 16px;
     background: white;
     border-radius: 12px;
     box-shadow: 0px 3px 8px rgba(0,0,0,0.15);
     margin-top: 14px;
-}}
+}
 
-.step {{
+.step {
     padding: 10px;
     margin-top: 14px;
     background: #F0F7FF;
     border-left: 5px solid #1E88E5;
     border-radius: 6px;
-}}
+}
 
-h2 {{
+h2 {
     margin-top: 6px;
     color: #1565C0;
-}}
-</style>
-
-</head>
-<body>
-{content}
-</body>
-</html>
+}
+
+table.num {
+    border-collapse: collapse;
+    font-family: Consolas, monospace;
+    font-size: 13px;
+}
+
+table.num td {
+    padding: 2px 8px;
+    text-align: right;
+    border-bottom: 1px solid #ECEFF1;
+}
 """
 
+# Más filas o columnas que esto se muestran como tabla HTML y no con MathJax
+MAX_LATEX = 12
+
+# Operaciones con camino en decimales (algebra_rapida)
+OPERACIONES_RAPIDAS = {
+    "Suma", "Resta", "Multiplicacion", "Traspuesta",
+    "Gauss", "Gauss-Jordan", "Inversa", "Modelo Leontief",
+}
+
 
 # ===============================================================
 #                  CLASE PRINCIPAL
@@ -221,8 +235,26 @@ class VentanaMatrices(QWidget):
         """)
         self.btn_ejecutar.clicked.connect(self.ejecutar_operacion)
 
+        # Modo rápido: NumPy en decimales, con verificación exacta opcional
+        self.chk_rapido = QCheckBox("Decimales (rápido)")
+        self.chk_rapido.setFont(font_btn)
+        self.chk_rapido.setToolTip(
+            "Calcula con NumPy en punto flotante, sin procedimiento.\n"
+            "Pensado para matrices grandes cuando no hacen falta fracciones."
+        )
+        self.chk_verificar = QCheckBox("Verificar exacto si está mal condicionada")
+        self.chk_verificar.setChecked(True)
+        self.chk_verificar.setEnabled(False)
+        self.chk_verificar.setToolTip(
+            f"Si el número de condición pasa de {algebra_rapida.COND_MAX:.0e}, "
+            "repite la operación con fracciones exactas."
+        )
+        self.chk_rapido.toggled.connect(self.chk_verificar.setEnabled)
+
         acciones = QHBoxLayout()
         acciones.addWidget(self.operacion_combo)
+        acciones.addWidget(self.chk_rapido)
+        acciones.addWidget(self.chk_verificar)
         acciones.addStretch()
         acciones.addWidget(self.btn_limpiar)
         acciones.addWidget(self.btn_ejecutar)
@@ -238,7 +270,7 @@ class VentanaMatrices(QWidget):
             "color:transparent; background:transparent; border:none;"
         )
 
-        self.procedimiento_web = QWebEngineView()
+        self.procedimiento_web = VistaMathJax(ESTILOS_MATHJAX)
 
         splitter = QSplitter(Qt.Orientation.Vertical)
         splitter.addWidget(self.procedimiento_text)
@@ -347,6 +379,8 @@ class VentanaMatrices(QWidget):
                 return str(x.numerator)
             else:
                 return r"\frac{" + str(x.numerator) + "}{" + str(x.denominator) + "}"
+        elif isinstance(x, float):
+            return f"{x + 0.0:.10g}"   # + 0.0: sin "-0"
         else:
             return str(x)
 
@@ -376,6 +410,22 @@ class VentanaMatrices(QWidget):
         cuerpo = r" \\ ".join(filas)
         return r"\begin{bmatrix}" + cuerpo + r"\end{bmatrix}"
 
+    def _fila_latex(self, fila):
+        return " & ".join(
+            str(x.numerator) if x.denominator == 1
+            else r"\frac{" + str(x.numerator) + "}{" + str(x.denominator) + "}"
+            for x in fila
+        )
+
+    def _eliminacion_a_latex(self, E):
+        """
+        Igual que _matriz_a_latex, para una EliminacionExacta: solo se
+        vuelven a formatear las filas que cambiaron desde el paso anterior.
+        """
+        if not E.filas:
+            return r"\begin{bmatrix}\end{bmatrix}"
+        return r"\begin{bmatrix}" + r" \\ ".join(E.textos(self._fila_latex)) + r"\end{bmatrix}"
+
    
    
    # ===============================================================
@@ -469,15 +519,16 @@ class VentanaMatrices(QWidget):
 
         partes.append("<p>Elementos de \\(C\\):</p>")
 
+        # Cada elemento se formatea una sola vez (no m·p veces)
+        fa = [[self._fmt_latex(a) for a in fila] for fila in A]
+        fb = [[self._fmt_latex(B[k][j]) for k in range(n)] for j in range(p)]
+
         pasos = []
         for i in range(m):
             for j in range(p):
-                sumandos = []
-                for k in range(n):
-                    a = A[i][k]
-                    b = B[k][j]
-                    sumandos.append(f"{self._fmt_latex(a)} \\times {self._fmt_latex(b)}")
-                suma_str = " + ".join(sumandos)
+                suma_str = " + ".join(
+                    f"{a} \\times {b}" for a, b in zip(fa[i], fb[j])
+                )
                 c = C[i][j]
                 pasos.append(
                     f"\\(c_{{{i+1},{j+1}}} = {suma_str} = {self._fmt_latex(c)}\\)"
@@ -540,7 +591,7 @@ class VentanaMatrices(QWidget):
         
 
     def _set_html_content(self, html):
-        self.procedimiento_web.setHtml(HTML_MATHJAX_TEMPLATE.format(content=html))
+        self.procedimiento_web.mostrar(html)
 
     def mostrar_procedimiento(self, _ignored=None, latex=None):
         if latex is None:
@@ -558,6 +609,28 @@ class VentanaMatrices(QWidget):
                     fila.append(Fraction(0))
             M.append(fila)
         return M
+
+    def leer_tabla_flotante(self, t):
+        """Como leer_tabla, pero a un ndarray float64 (modo rápido)."""
+        textos = [
+            [item.text() if item is not None else "" for item in (t.item(i, j) for j in range(t.columnCount()))]
+            for i in range(t.rowCount())
+        ]
+        try:
+            return np.array(textos, dtype=float)   # todo decimal: lo convierte NumPy
+        except ValueError:
+            pass
+        M = np.zeros((t.rowCount(), t.columnCount()))
+        for i, fila in enumerate(textos):
+            for j, texto in enumerate(fila):
+                try:
+                    M[i, j] = float(texto)
+                except ValueError:
+                    try:
+                        M[i, j] = float(Fraction(texto))   # "1/3"
+                    except (ValueError, ZeroDivisionError):
+                        pass
+        return M
     # ===============================================================
     #             ACTUALIZAR DIMENSIONES DE LAS TABLAS
     # ===============================================================
@@ -858,15 +931,17 @@ class VentanaMatrices(QWidget):
     #                          GAUSS
     # ===============================================================
     
+    @metricas.medido("gauss: _gauss_detallado")
     def _gauss_detallado(self, M):
         """
-        Eliminación hacia adelante (Gauss) usando Fraction.
+        Eliminación hacia adelante (Gauss), exacta y sin fracciones
+        intermedias (algebra_exacta); los pasos se muestran con Fraction.
         Intenta mantener números enteros/humanos antes de normalizar.
         """
 
-        # Trabajar siempre con fracciones exactas
-        A = self._a_fracciones(M)
-        n, m = len(A), len(A[0])
+        # Filas enteras por un factor: Fraction solo al mostrar
+        A = EliminacionExacta(M)
+        n, m = len(A.filas), len(A.filas[0])
         row = 0
         pivots = []
         pasos = []
@@ -881,7 +956,7 @@ class VentanaMatrices(QWidget):
             pasos.append(
                 "<div class='step' style='margin-bottom:14px;'>"
                 f"<p style='margin:0; padding:6px 0; font-size:17px;'>{linea}</p>"
-                f"<div class='card' style='margin-top:6px;'>$${self._matriz_a_latex(A)}$$</div>"
+                f"<div class='card' style='margin-top:6px;'>$${self._eliminacion_a_latex(A)}$$</div>"
                 "</div>"
             )
 
@@ -895,7 +970,7 @@ class VentanaMatrices(QWidget):
             # 1. Buscar pivote diferente de 0
             sel = None
             for r in range(row, n):
-                if A[r][col] != 0:
+                if not A.es_cero(r, col):
                     sel = r
                     break
 
@@ -904,18 +979,14 @@ class VentanaMatrices(QWidget):
 
             # Intercambio
             if sel != row:
-                A[row], A[sel] = A[sel], A[row]
+                A.intercambiar(row, sel)
                 snap(f"Intercambiar F{row+1} ↔ F{sel+1}")
 
             # 2. Eliminar filas debajo (Primero eliminamos, luego normalizamos para que se vea el paso "humano")
             #    Esto permite ver números como el '5' en 0=5 antes de que se convierta en 1.
             for r in range(row + 1, n):
-                curr_val = A[r][col]
-                piv_val = A[row][col]
-                
-                if curr_val != 0:
-                    factor = curr_val / piv_val  # Factor calculado dinámicamente
-                    A[r] = [A[r][j] - factor * A[row][j] for j in range(m)]
+                if not A.es_cero(r, col):
+                    factor = A.eliminar(r, row, col)  # Factor calculado dinámicamente
                     snap(
                         f"F{r+1} → F{r+1} -",
                         f"({self._fmt_latex(factor)}) \\cdot F{row+1}"
@@ -927,20 +998,20 @@ class VentanaMatrices(QWidget):
             es_contradiccion = False
             is_all_zeros = True
             for c_idx in range(m - 1): 
-                if A[row][c_idx] != 0:
+                if not A.es_cero(row, c_idx):
                     is_all_zeros = False
                     break
             
             # Si todo son ceros a la izquierda y el último NO es cero -> Contradicción (ej: 0=5)
             # En ese caso, NO normalizamos para que el usuario vea el '5'.
-            if is_all_zeros and A[row][-1] != 0:
+            if is_all_zeros and not A.es_cero(row, m - 1):
                 es_contradiccion = True
 
             # Si NO es contradicción, procedemos a normalizar normalmente
             if not es_contradiccion:
-                piv = A[row][col]
+                piv = A.valor(row, col)
                 if piv != 1:
-                    A[row] = [x / piv for x in A[row]]
+                    A.normalizar(row, col)
                     snap(
                         f"Normalizar F{row+1} dividiendo por",
                         self._fmt_latex(piv)
@@ -951,7 +1022,8 @@ class VentanaMatrices(QWidget):
             if row == n:
                 break
 
-        return pasos, A, pivots
+        metricas.contar("gauss: pasos", len(pasos))
+        return pasos, A.fracciones(), pivots
 
 
     # ===============================================================
@@ -961,10 +1033,9 @@ class VentanaMatrices(QWidget):
         """
         Fase hacia atrás (Gauss-Jordan).
         """
-        # Copia segura
-        R = self._a_fracciones(A)
+        # Copia segura (exacta, sin fracciones intermedias)
+        R = EliminacionExacta(A)
         pasos = []
-        n, m = len(R), len(R[0])
 
         def snap(texto, latex=None):
             if latex:
@@ -975,7 +1046,7 @@ class VentanaMatrices(QWidget):
             pasos.append(
                 "<div class='step' style='margin-bottom:14px;'>"
                 f"<p style='margin:0; padding:6px 0; font-size:17px;'>{linea}</p>"
-                f"<div class='card' style='margin-top:6px;'>$${self._matriz_a_latex(R)}$$</div>"
+                f"<div class='card' style='margin-top:6px;'>$${self._eliminacion_a_latex(R)}$$</div>"
                 "</div>"
             )
 
@@ -983,11 +1054,11 @@ class VentanaMatrices(QWidget):
 
         for r in reversed(range(len(pivots))):
             c = pivots[r]
-            piv = R[r][c]
+            piv = R.valor(r, c)
 
             # Asegurar que pivote = 1 (Por si venía "sucio" de la fase Gauss "humana")
             if piv != 0 and piv != 1:
-                R[r] = [x / piv for x in R[r]]
+                R.normalizar(r, c)
                 snap(
                     f"Normalizar F{r+1} (para Gauss-Jordan) dividiendo por",
                     self._fmt_latex(piv)
@@ -995,15 +1066,14 @@ class VentanaMatrices(QWidget):
 
             # Eliminar por encima
             for up in range(r):
-                factor = R[up][c]
-                if factor != 0:
-                    R[up] = [R[up][j] - factor * R[r][j] for j in range(m)]
+                if not R.es_cero(up, c):
+                    factor = R.eliminar(up, r, c)
                     snap(
                         f"F{up+1} → F{up+1} -",
                         f"{self._fmt_latex(factor)} \\cdot F{r+1}"
                     )
 
-        return pasos, R
+        return pasos, R.fracciones()
 
 
     def _a_fracciones(self, M):
@@ -1154,6 +1224,13 @@ class VentanaMatrices(QWidget):
     # ===============================================================
     def ejecutar_operacion(self):
         op = self.operacion_combo.currentText()
+        if self.chk_rapido.isChecked() and op in OPERACIONES_RAPIDAS:
+            try:
+                self.mostrar_procedimiento(latex=self._ejecutar_rapido(op))
+            except Exception as e:
+                self.mostrar_procedimiento("", f"<div class='card'>Error: {e}</div>")
+            return
+
         A = self.leer_tabla(self.tabla_A)
         B = self.leer_tabla(self.tabla_B)
 
@@ -1174,11 +1251,7 @@ class VentanaMatrices(QWidget):
             elif op == "Multiplicacion":
                 if len(A[0]) != len(B):
                     raise ValueError(" Número de columnas de A debe ser igual a número de filas de B.")
-                C = [
-                    [sum(A[i][k] * B[k][j] for k in range(len(B)))
-                     for j in range(len(B[0]))]
-                    for i in range(len(A))
-                ]
+                C = producto_exacto(A, B)
                 latex = self._procedimiento_multiplicacion(A, B, C)
                 self.mostrar_procedimiento("", latex)
 
@@ -1220,12 +1293,136 @@ class VentanaMatrices(QWidget):
 
         except Exception as e:
             self.mostrar_procedimiento("", f"<div class='card'>Error: {e}</div>")
+
+    # ===============================================================
+    #              MODO RÁPIDO (DECIMALES, NUMPY)
+    # ===============================================================
+    @metricas.medido("matrices: modo rápido")
+    def _ejecutar_rapido(self, op):
+        """
+        La operación en float64 (algebra_rapida), sin procedimiento.
+        Si depende de una matriz mal condicionada y "Verificar exacto"
+        está marcado, el resultado se rehace con fracciones exactas.
+        """
+        A = self.leer_tabla_flotante(self.tabla_A)
+        verificar = self.chk_verificar.isChecked()
+        html = f"<h2>{op} (decimales)</h2>"
+
+        # ---------------- SUMA / RESTA / MULTIPLICACIÓN / TRASPUESTA ----------------
+        if op in ("Suma", "Resta", "Multiplicacion"):
+            B = self.leer_tabla_flotante(self.tabla_B)
+            operar = {
+                "Suma": algebra_rapida.suma,
+                "Resta": algebra_rapida.resta,
+                "Multiplicacion": algebra_rapida.producto,
+            }[op]
+            return html + self._matriz_a_html(operar(A, B).tolist(), "C")
+
+        if op == "Traspuesta":
+            return html + self._matriz_a_html(algebra_rapida.traspuesta(A).tolist(), "A^{T}")
+
+        # ---------------- INVERSA ----------------
+        if op == "Inversa":
+            try:
+                inv, cond = algebra_rapida.inversa(A)
+            except ValueError:
+                if not verificar:
+                    raise
+                inv, cond = None, math.inf
+            if algebra_rapida.mal_condicionada(cond) and verificar:
+                exacta = self._inversa(self.leer_tabla(self.tabla_A))
+                return html + self._aviso_condicion(cond, True) + self._matriz_a_html(exacta, "A^{-1}")
+            if algebra_rapida.mal_condicionada(cond):
+                html += self._aviso_condicion(cond, False)
+            return html + self._matriz_a_html(inv.tolist(), "A^{-1}")
+
+        # ---------------- MODELO LEONTIEF ----------------
+        if op == "Modelo Leontief":
+            B = self.leer_tabla_flotante(self.tabla_B)
+            try:
+                x, inv, cond = algebra_rapida.leontief(A, B)
+            except ValueError:
+                if not verificar:
+                    raise
+                x, inv, cond = None, None, math.inf
+            if algebra_rapida.mal_condicionada(cond) and verificar:
+                exacto = self._modelo_leontief(self.leer_tabla(self.tabla_A), self.leer_tabla(self.tabla_B))
+                return html + self._aviso_condicion(cond, True) + exacto
+            if algebra_rapida.mal_condicionada(cond):
+                html += self._aviso_condicion(cond, False)
+            html += "<h3>Inversa de Leontief \\((\\mathbf{I} - \\mathbf{A})^{-1}\\)</h3>"
+            html += self._matriz_a_html(inv.tolist())
+            html += "<h3>Producción Total Requerida (\\(\\mathbf{x}\\))</h3>"
+            return html + self._matriz_a_html(x.tolist(), "\\mathbf{x}")
+
+        # ---------------- GAUSS / GAUSS-JORDAN ----------------
+        reducida = op == "Gauss-Jordan"
+        R, pivotes, cond = algebra_rapida.escalonada(A, reducida)
+        if algebra_rapida.mal_condicionada(cond) and verificar:
+            A_exacta = self.leer_tabla(self.tabla_A)
+            if reducida:
+                exacta, pivotes_exactos = escalonada_reducida(A_exacta)
+            else:
+                # Gauss pide la escalonada: la misma eliminación hacia adelante
+                # que el modo exacto (los pasos no se muestran)
+                _, exacta, pivotes_exactos = self._gauss_detallado(A_exacta)
+            html += self._aviso_condicion(cond, True)
+            if len(pivotes_exactos) != len(pivotes):
+                html += (
+                    "<div class='card'>En decimales el rango salía "
+                    f"{len(pivotes)}; con fracciones exactas es {len(pivotes_exactos)}.</div>"
+                )
+            titulo = "Resultado RREF" if reducida else "Resultado Escalonada"
+            html += f"<h3>{titulo} (exacto)</h3>" + self._matriz_a_html(exacta)
+            return html + self._diagnostico(exacta)
+
+        if algebra_rapida.mal_condicionada(cond):
+            html += self._aviso_condicion(cond, False)
+        titulo = "Resultado RREF" if reducida else "Resultado Escalonada"
+        html += f"<h3>{titulo}</h3>" + self._matriz_a_html(R.tolist())
+        # El diagnóstico lee la solución de la forma reducida
+        rref = R if reducida else algebra_rapida.escalonada(A, True)[0]
+        return html + self._diagnostico(rref.tolist())
+
+    def _aviso_condicion(self, cond, verificado):
+        if math.isfinite(cond):
+            estado = f"mal condicionada (número de condición ≈ {cond:.2e})"
+        else:
+            estado = "singular o casi singular"
+        if verificado:
+            detalle = "El resultado se recalculó con fracciones exactas."
+        else:
+            detalle = ("Los decimales pueden no ser confiables: marca "
+                       "«Verificar exacto» o desactiva el modo rápido.")
+        return f"<div class='card'>⚠️ La matriz está {estado}. {detalle}</div>"
+
+    def _matriz_a_html(self, M, nombre=None):
+        """
+        Matriz de Fraction o float: bmatrix si es chica, tabla HTML si es
+        grande (MathJax tardaría segundos en componer cientos de celdas).
+        """
+        if len(M) <= MAX_LATEX and all(len(fila) <= MAX_LATEX for fila in M):
+            latex = self._matriz_a_latex([[self._fmt_latex(x) for x in fila] for fila in M])
+            igual = f"{nombre} = " if nombre else ""
+            return f"<div class='card'>$${igual}{latex}$$</div>"
+
+        def celda(x):
+            return self._fmt(x) if isinstance(x, Fraction) else f"{x + 0.0:.6g}"
+
+        filas = "".join(
+            "<tr>" + "".join(f"<td>{celda(x)}</td>" for x in fila) + "</tr>"
+            for fila in M
+        )
+        titulo = f"<p>\\({nombre}\\) ({len(M)}×{len(M[0])}):</p>" if nombre else ""
+        return f"<div class='card'>{titulo}<table class='num'>{filas}</table></div>"
+
     # ===============================================================
     #        INVERSA DE A (GAUSS–JORDAN SOBRE [A | I])
     # ===============================================================
     def _inversa(self, A):
         """
-        Calcula la inversa de A usando Gauss–Jordan sobre la matriz aumentada [A | I].
+        Calcula la inversa de A usando Gauss–Jordan sin fracciones (Bareiss)
+        sobre la matriz aumentada [A | I].
         Devuelve la matriz inversa A^{-1} como lista de listas de Fraction.
         """
         n = len(A)
@@ -1234,43 +1431,7 @@ class VentanaMatrices(QWidget):
         if n != len(A[0]):
             raise ValueError("La matriz no es cuadrada; no tiene inversa.")
 
-        # Construir [A | I]
-        AI = [
-            A[i][:] + [Fraction(int(i == j)) for j in range(n)]
-            for i in range(n)
-        ]
-
-        # Gauss–Jordan sobre la aumentada
-        for i in range(n):
-
-            # Si el pivote es 0, buscar fila abajo
-            if AI[i][i] == 0:
-                swap = None
-                for k in range(i + 1, n):
-                    if AI[k][i] != 0:
-                        swap = k
-                        break
-                if swap is None:
-                    raise ValueError("La matriz no es invertible (det = 0).")
-                AI[i], AI[swap] = AI[swap], AI[i]
-
-            # Normalizar fila pivote
-            piv = AI[i][i]
-            if piv == 0:
-                raise ValueError("La matriz no es invertible (pivote nulo).")
-            AI[i] = [x / piv for x in AI[i]]
-
-            # Hacer ceros arriba y abajo
-            for r in range(n):
-                if r == i:
-                    continue
-                factor = AI[r][i]
-                if factor != 0:
-                    AI[r] = [AI[r][j] - factor * AI[i][j] for j in range(2 * n)]
-
-        # Extraer la parte derecha (I transformada en A^{-1})
-        inv = [fila[n:] for fila in AI]
-        return inv
+        return inversa_exacta(A)
     def _inversa_detallada(self, A):
         """
         Calcula la inversa de A usando Gauss–Jordan y genera
@@ -1283,13 +1444,15 @@ class VentanaMatrices(QWidget):
             raise ValueError("La matriz A está vacía.")
         if n != len(A[0]):
             raise ValueError("La matriz no es cuadrada; no tiene inversa.")
+        # Singular: se sabe por la factorización (guardada) antes de armar pasos
+        if not factorizar(A).invertible:
+            raise ValueError("La matriz no es invertible (det = 0).")
 
-        # Construir [A | I] con Fraction
-        AI = [
-            [Fraction(x) for x in A[i]] +
-            [Fraction(int(i == j)) for j in range(n)]
+        # Construir [A | I] (filas enteras por un factor: Fraction solo al mostrar)
+        AI = EliminacionExacta([
+            list(A[i]) + [int(i == j) for j in range(n)]
             for i in range(n)
-        ]
+        ])
 
         pasos = []
 
@@ -1297,7 +1460,7 @@ class VentanaMatrices(QWidget):
             pasos.append(f"<div class='step'><b>{descripcion}</b></div>")
             pasos.append(
                 "<div class='card'>$$" +
-                self._matriz_a_latex(AI) +
+                self._eliminacion_a_latex(AI) +
                 "$$</div>"
             )
 
@@ -1314,35 +1477,31 @@ class VentanaMatrices(QWidget):
         for i in range(n):
 
             # Si el pivote es 0, buscar fila abajo
-            if AI[i][i] == 0:
+            if AI.es_cero(i, i):
                 swap = None
                 for k in range(i + 1, n):
-                    if AI[k][i] != 0:
+                    if not AI.es_cero(k, i):
                         swap = k
                         break
                 if swap is None:
                     raise ValueError("La matriz no es invertible (det = 0).")
-                AI[i], AI[swap] = AI[swap], AI[i]
+                AI.intercambiar(i, swap)
                 snap(f"Intercambiamos fila {i+1} con fila {swap+1} para obtener pivote distinto de 0")
 
             # Normalizar fila pivote
-            piv = AI[i][i]
-            if piv == 0:
-                raise ValueError("La matriz no es invertible (pivote nulo).")
-            AI[i] = [x / piv for x in AI[i]]
+            piv = AI.normalizar(i, i)
             snap(f"Normalizamos la fila {i+1} dividiendo por el pivote {self._fmt_latex(piv)}")
 
             # Hacer ceros arriba y abajo
             for r in range(n):
                 if r == i:
                     continue
-                factor = AI[r][i]
-                if factor != 0:
-                    AI[r] = [AI[r][j] - factor * AI[i][j] for j in range(2 * n)]
+                if not AI.es_cero(r, i):
+                    AI.eliminar(r, i, i)
             snap(f"Anulamos los elementos de la columna {i+1} por encima y por debajo del pivote")
 
         # Extraer la parte derecha (I transformada en A^{-1})
-        inv = [fila[n:] for fila in AI]
+        inv = [fila[n:] for fila in AI.fracciones()]
 
         latex += "".join(pasos)
 
@@ -1394,13 +1553,7 @@ class VentanaMatrices(QWidget):
 
         # 3. Multiplicar Inversa * d
         # Inversa es (n x n), d es (n x 1) -> x es (n x 1)
-        x = []
-        for i in range(n):
-            suma = Fraction(0)
-            for k in range(n):
-                # d[k][0] porque d es lista de listas
-                suma += inversa[i][k] * d[k][0]
-            x.append([suma])
+        x = producto_exacto(inversa, d)
 
         # Generar reporte en LaTeX
         latex = "<h2>Modelo de Leontief (Input-Output)</h2>"
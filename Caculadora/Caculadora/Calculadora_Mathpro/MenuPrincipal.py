@@ -5,15 +5,32 @@ import os
 os.environ["QT_OPENGL"] = "software"
 os.environ["QTWEBENGINE_CHROMIUM_FLAGS"] = "--disable-gpu --no-sandbox"
 
-from PyQt6.QtCore import Qt, QSize, QUrl
-from PyQt6.QtGui import QFont, QColor
+import importlib
+from collections import OrderedDict
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+from PyQt6.QtCore import Qt, QSize, QUrl, QCoreApplication, QTimer
+from PyQt6.QtGui import QFont, QColor, QKeySequence, QShortcut
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QLabel, QPushButton, QFrame, QGridLayout, QScrollArea, 
     QLineEdit, QGraphicsDropShadowEffect, QStackedWidget, QMessageBox, 
-    QDialog, QSlider, QComboBox, QButtonGroup, QRadioButton
+    QDialog, QSlider, QComboBox, QButtonGroup, QRadioButton,
+    QCheckBox, QTableWidget, QTableWidgetItem, QHeaderView, QFileDialog
 )
-from PyQt6.QtWebEngineWidgets import QWebEngineView
+
+from perfil_arranque import tramo, tramo_medido
+import metricas
+from cache_latex import CACHE as CACHE_LATEX
+
+# QtWebEngine se importa al abrir la primera vista web (no al arrancar);
+# Qt lo permite si los contextos OpenGL se comparten desde antes de crear la app.
+if QCoreApplication.instance() is None:
+    QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
 
 # =============================================================================
 #  TRADUCCIONES
@@ -81,54 +98,137 @@ TRANSLATIONS = {
 CURRENT_LANG = "ES"
 
 # =============================================================================
-#  IMPORTACIÓN SEGURA
+#  IMPORTACIÓN SEGURA (PEREZOSA)
 # =============================================================================
-MODULES = {}
-
-def safe_import():
-    global MODULES
-    try: 
-        from Metodo_biseccion import VentanaBiseccion
-        MODULES['Biseccion'] = VentanaBiseccion
-    except: pass
-    try: 
-        from Metodo_newton_raphson import VentanaNewton
-        MODULES['Newton'] = VentanaNewton
-    except: pass
-    try: 
-        from Metodo_secante import VentanaSecante
-        MODULES['Secante'] = VentanaSecante
-    except: pass
-    try: 
-        from Metodo_Falsa_Posición import VentanaFalsaPosicion
-        MODULES['Falsa'] = VentanaFalsaPosicion
-    except: pass
-    try: 
-        from Matrices import VentanaMatrices
-        MODULES['Matrices'] = VentanaMatrices
-    except: pass
-    try: 
-        from Determinantes import VentanaDeterminantes
-        MODULES['Determinantes'] = VentanaDeterminantes
-    except: pass
-    try: 
-        from Multiplicacion_escalar import VentanaMultiplicacionEscalar
-        MODULES['Escalar'] = VentanaMultiplicacionEscalar
-    except: pass
-    try: 
-        from derivadas import ManimDerivadaApp
-        MODULES['Derivadas'] = ManimDerivadaApp
-    except: pass
-    try: 
-        from Conjuntos import CalculadoraConjuntos
-        MODULES['Conjuntos'] = CalculadoraConjuntos
-    except: pass
-    try: 
-        from Logica_simbolica_inferencial import VentanaLogica
-        MODULES['Logica'] = VentanaLogica
-    except: pass
-
-safe_import()
+# Solo se registra dónde está cada herramienta; el módulo (y con él SymPy,
+# matplotlib, NumPy, QtMultimedia, QtWebEngine...) se importa la primera vez
+# que se abre. Tras mostrar el menú se precargan de a uno en los ratos libres
+# del hilo de la interfaz (matplotlib, QtWebEngine y QtMultimedia no deben
+# importarse desde otro hilo).
+MODULES = {
+    'Biseccion': ('Metodo_biseccion', 'VentanaBiseccion'),
+    'Newton': ('Metodo_newton_raphson', 'VentanaNewton'),
+    'Secante': ('Metodo_secante', 'VentanaSecante'),
+    'Falsa': ('Metodo_Falsa_Posición', 'VentanaFalsaPosicion'),
+    'Matrices': ('Matrices', 'VentanaMatrices'),
+    'Determinantes': ('Determinantes', 'VentanaDeterminantes'),
+    'Escalar': ('Multiplicacion_escalar', 'VentanaMultiplicacionEscalar'),
+    'Derivadas': ('derivadas', 'ManimDerivadaApp'),
+    'Conjuntos': ('Conjuntos', 'CalculadoraConjuntos'),
+    'Logica': ('Logica_simbolica_inferencial', 'VentanaLogica'),
+}
+CLASES = {}       # clave -> clase ya importada
+ERRORES = {}      # clave -> excepción al importar
+
+# Pausa antes de precargar (ms) para no competir con el primer pintado.
+# MATHPRO_PRECARGA=0 la desactiva.
+PRECARGA_MS = 500
+PRECARGA = os.environ.get("MATHPRO_PRECARGA", "1") != "0"
+
+def safe_import(key):
+    """Clase de la herramienta `key`, importándola si hace falta (None si falla)."""
+    if key in CLASES:
+        return CLASES[key]
+    if key not in MODULES:
+        return None
+    modulo, clase = MODULES[key]
+    try:
+        with tramo(f"import {modulo}", "import"):
+            C = getattr(importlib.import_module(modulo), clase)
+    except Exception as e:
+        ERRORES[key] = e
+        return None
+    ERRORES.pop(key, None)
+    CLASES[key] = C
+    return C
+
+# =============================================================================
+#  HERRAMIENTAS ABIERTAS (POOL LRU)
+# =============================================================================
+# Las últimas herramientas usadas siguen vivas en el QStackedWidget de la
+# página de módulos: volver a una es instantáneo y conserva su estado.
+# MATHPRO_MAX_MODULOS cambia cuántas se conservan (si no es un entero, 4).
+def _max_modulos(defecto=4):
+    try:
+        return max(1, int(os.environ.get("MATHPRO_MAX_MODULOS", defecto)))
+    except ValueError:
+        return defecto
+
+MAX_MODULOS_ABIERTOS = _max_modulos()
+
+def rss_actual():
+    """Memoria residente del proceso (y sus hijos, p. ej. QtWebEngine) en bytes, o None."""
+    if psutil is not None:
+        proc = psutil.Process()
+        total = proc.memory_info().rss
+        for hijo in proc.children(recursive=True):
+            try:
+                total += hijo.memory_info().rss
+            except psutil.Error:
+                pass
+        return total
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+class PoolModulos:
+    """
+    Widgets de herramientas por clave, dentro de `stack`, con expulsión LRU.
+    memoria[clave] es lo que creció el RSS al construir la herramienta
+    (aproximado; None si no se puede medir).
+    """
+    def __init__(self, stack, maximo=MAX_MODULOS_ABIERTOS):
+        self.stack = stack
+        self.maximo = max(1, maximo)
+        self.widgets = OrderedDict()
+        self.memoria = {}
+
+    def __contains__(self, key):
+        return key in self.widgets
+
+    def __len__(self):
+        return len(self.widgets)
+
+    def activar(self, key):
+        """Muestra la herramienta ya abierta (None si no está en el pool)."""
+        w = self.widgets.get(key)
+        if w is not None:
+            self.widgets.move_to_end(key)
+            self.stack.setCurrentWidget(w)
+        return w
+
+    def agregar(self, key, widget, memoria=None):
+        self.widgets[key] = widget
+        self.memoria[key] = memoria
+        self.stack.addWidget(widget)
+        self.stack.setCurrentWidget(widget)
+        self._expulsar()
+
+    def _expulsar(self):
+        # La más antigua que no esté a la vista ni calculando en segundo plano
+        while len(self.widgets) > self.maximo:
+            actual = self.stack.currentWidget()
+            libre = next((k for k, w in self.widgets.items()
+                          if w is not actual and not self._ocupado(w)), None)
+            if libre is None:
+                return
+            self.quitar(libre)
+
+    def quitar(self, key):
+        w = self.widgets.pop(key)
+        self.memoria.pop(key, None)
+        self.stack.removeWidget(w)
+        w.deleteLater()
+
+    @staticmethod
+    def _ocupado(w):
+        herramienta = getattr(w, "herramienta", w)
+        return getattr(herramienta, "trabajador", None) is not None
+
+    def memoria_total(self):
+        return sum(m for m in self.memoria.values() if m)
 
 # =============================================================================
 #  ESTILOS CSS (SIN BORDES EN TEXTOS)
@@ -238,7 +338,10 @@ class YoutubeViewer(QDialog):
         self.setWindowTitle(f"YouTube: {query}")
         self.resize(1100, 650)
         l = QVBoxLayout(self); l.setContentsMargins(0,0,0,0)
-        self.web = QWebEngineView()
+        with tramo("import QtWebEngineWidgets", "import"):
+            from PyQt6.QtWebEngineWidgets import QWebEngineView
+        with tramo("QWebEngineView()", "web"):
+            self.web = QWebEngineView()
         self.web.setUrl(QUrl(f"https://www.youtube.com/results?search_query={query}"))
         l.addWidget(self.web)
 
@@ -293,6 +396,7 @@ class ModuleCard(QFrame):
 #  PÁGINAS
 # =============================================================================
 class DashboardPage(QWidget):
+    @tramo_medido("DashboardPage")
     def __init__(self, main):
         super().__init__()
         self.main = main; self.cards = []
@@ -361,6 +465,7 @@ class DashboardPage(QWidget):
         for c in self.cards: c.refresh()
 
 class SettingsPage(QWidget):
+    @tramo_medido("SettingsPage")
     def __init__(self, main):
         super().__init__()
         self.main = main
@@ -420,6 +525,7 @@ class SettingsPage(QWidget):
         self.btn.setText(TRANSLATIONS[CURRENT_LANG]["btn_apply"])
 
 class DevelopersPage(QWidget):
+    @tramo_medido("DevelopersPage")
     def __init__(self):
         super().__init__()
         l = QVBoxLayout(self); l.setContentsMargins(0,0,0,0)
@@ -450,10 +556,89 @@ class DevelopersPage(QWidget):
         self.t.setText(TRANSLATIONS[CURRENT_LANG]["devs_title"])
         self.s.setText(TRANSLATIONS[CURRENT_LANG]["devs_sub"])
 
+class DiagnosticsPage(QWidget):
+    """
+    Página oculta (Ctrl+Shift+D): métricas de cálculo y render, caché de
+    fórmulas y memoria de las herramientas abiertas. Exporta todo a JSON.
+    """
+    INTERVALO_MS = 1000
+
+    def __init__(self, main):
+        super().__init__()
+        self.main = main
+        l = QVBoxLayout(self); l.setContentsMargins(60, 30, 60, 30); l.setSpacing(15)
+
+        tit = QLabel("Diagnóstico"); tit.setProperty("class", "SectionTitle")
+        l.addWidget(tit)
+
+        h = QHBoxLayout()
+        self.chk = QCheckBox("Registrar métricas"); self.chk.setChecked(metricas.activo)
+        self.chk.toggled.connect(metricas.activar)
+        b_reset = QPushButton("Reiniciar"); b_reset.clicked.connect(self.reiniciar)
+        b_json = QPushButton("Exportar JSON"); b_json.clicked.connect(self.exportar)
+        h.addWidget(self.chk); h.addStretch(); h.addWidget(b_reset); h.addWidget(b_json)
+        l.addLayout(h)
+
+        self.tabla = QTableWidget(0, 5)
+        self.tabla.setHorizontalHeaderLabels(["Métrica", "Llamadas", "Total (ms)", "Media (ms)", "Máx (ms)"])
+        self.tabla.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.tabla.verticalHeader().setVisible(False)
+        self.tabla.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        l.addWidget(self.tabla, 1)
+
+        self.lbl_cache = QLabel(); self.lbl_cache.setWordWrap(True)
+        self.lbl_pool = QLabel(); self.lbl_pool.setWordWrap(True)
+        l.addWidget(self.lbl_cache); l.addWidget(self.lbl_pool)
+
+        self.timer = QTimer(self); self.timer.setInterval(self.INTERVALO_MS)
+        self.timer.timeout.connect(self.actualizar)
+
+    def showEvent(self, e):
+        self.actualizar(); self.timer.start()
+        super().showEvent(e)
+
+    def hideEvent(self, e):
+        self.timer.stop()
+        super().hideEvent(e)
+
+    def _extra(self):
+        return {"cache_latex": CACHE_LATEX.estadisticas(),
+                "memoria_herramientas": dict(self.main.pool.memoria)}
+
+    def actualizar(self):
+        d = metricas.datos()
+        filas = [(n, str(m["llamadas"]), f"{m['total_ms']:.1f}", f"{m['media_ms']:.3f}", f"{m['max_ms']:.1f}")
+                 for n, m in d["tiempos"].items()]
+        filas += [(n, str(c), "", "", "") for n, c in d["contadores"].items()]
+        self.tabla.setRowCount(len(filas))
+        for r, fila in enumerate(filas):
+            for c, txt in enumerate(fila):
+                self.tabla.setItem(r, c, QTableWidgetItem(txt))
+
+        e = CACHE_LATEX.estadisticas()
+        self.lbl_cache.setText(
+            f"Caché LaTeX: {e['entradas']} fórmulas, {e['bytes'] / 2**20:.1f} MB, "
+            f"aciertos {e['aciertos']} (+{e['aciertos_disco']} de disco), fallos {e['fallos']}, "
+            f"tasa {e['tasa_aciertos']:.0%}, expulsiones {e['expulsiones']}")
+        mem = self.main.pool.memoria
+        partes = [f"{k}: {m / 2**20:.1f} MB" if m is not None else f"{k}: ?" for k, m in mem.items()]
+        self.lbl_pool.setText(f"Herramientas abiertas ({len(mem)}/{self.main.pool.maximo}): "
+                              + (", ".join(partes) or "ninguna"))
+
+    def reiniciar(self):
+        metricas.reiniciar()
+        self.actualizar()
+
+    def exportar(self):
+        ruta, _ = QFileDialog.getSaveFileName(self, "Exportar métricas", "metricas_mathpro.json", "JSON (*.json)")
+        if ruta:
+            metricas.exportar(ruta, self._extra())
+
 # =============================================================================
 #  MAIN WINDOW
 # =============================================================================
 class MainWindow(QMainWindow):
+    @tramo_medido("MainWindow.__init__")
     def __init__(self):
         super().__init__()
         self.setWindowTitle("MathPro - Ultimate Suite")
@@ -469,17 +654,35 @@ class MainWindow(QMainWindow):
         self.layout.addWidget(self.stack)
 
         self.p_dash = DashboardPage(self)
-        self.p_mod = QWidget(); self.ml = QVBoxLayout(self.p_mod); self.ml.setContentsMargins(0,0,0,0)
+        self.p_mod = QStackedWidget()
+        self.p_mod.addWidget(QWidget())   # vacío, si una herramienta no se pudo abrir
+        self.pool = PoolModulos(self.p_mod)
         self.p_set = SettingsPage(self)
         self.p_dev = DevelopersPage()
+        self.p_diag = DiagnosticsPage(self)
 
         self.stack.addWidget(self.p_dash)
         self.stack.addWidget(self.p_mod)
         self.stack.addWidget(self.p_set)
         self.stack.addWidget(self.p_dev)
+        self.stack.addWidget(self.p_diag)
+
+        # Página de diagnóstico: sin tarjeta en el menú
+        QShortcut(QKeySequence("Ctrl+Shift+D"), self, activated=lambda: self.switch_page(4))
 
         self.set_theme(False)
 
+        if PRECARGA:
+            QTimer.singleShot(PRECARGA_MS, self._precargar)
+
+    def _precargar(self):
+        # Un módulo por vuelta del bucle de eventos: entre import e import
+        # la interfaz atiende clics y repintados.
+        pendientes = [k for k in MODULES if k not in CLASES and k not in ERRORES]
+        if pendientes:
+            safe_import(pendientes[0])
+            QTimer.singleShot(0, self._precargar)
+
     def _init_header(self):
         h = QFrame(); h.setObjectName("Header"); h.setFixedHeight(85)
         hl = QHBoxLayout(h); hl.setContentsMargins(30,0,30,0); hl.setSpacing(15)
@@ -512,22 +715,28 @@ class MainWindow(QMainWindow):
         self.btn_b.setVisible(idx != 0)
 
     def load_module(self, key):
-        if self.ml.count(): 
-            widget = self.ml.takeAt(0).widget()
-            if widget: widget.deleteLater()
+        if self.pool.activar(key) is not None:
+            return
+        self.p_mod.setCurrentIndex(0)
 
-        C = MODULES.get(key)
+        C = safe_import(key)
         if C:
             try:
+                antes = rss_actual()
                 w = C()
                 if isinstance(w, QMainWindow):
                     w.setWindowFlags(Qt.WindowType.Widget)
                     cw = QWidget(); cv = QVBoxLayout(cw); cv.setContentsMargins(0,0,0,0); cv.addWidget(w)
-                    self.ml.addWidget(cw)
+                    cw.herramienta = w
                 else:
-                    self.ml.addWidget(w)
+                    cw = w
+                despues = rss_actual()
+                memoria = despues - antes if antes is not None and despues is not None else None
+                self.pool.agregar(key, cw, memoria)
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Error al cargar '{key}':\n{str(e)}")
+        elif key in ERRORES:
+            QMessageBox.critical(self, "Error", f"Error al importar '{key}':\n{ERRORES[key]}")
         else:
             QMessageBox.warning(self, "No Encontrado", f"Módulo '{key}' no encontrado.")
 
@@ -1,26 +1,22 @@
 import sys
-import re
 import numpy as np
 import warnings
 warnings.filterwarnings("ignore", category=RuntimeWarning)
 
-from sympy import sympify, latex
-
 # Intentamos importar pandas para exportar (opcional)
 try:
     import pandas as pd
 except ImportError:
     pd = None
 
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QThreadPool
 from PyQt6.QtGui import QColor, QCursor
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QLabel, QLineEdit, QPushButton, QVBoxLayout,
     QHBoxLayout, QGridLayout, QFrame, QSplitter, QTabWidget,
-    QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox,
+    QTableView, QHeaderView, QMessageBox,
     QFileDialog, QGraphicsDropShadowEffect, QSizePolicy
 )
-from PyQt6.QtWebEngineWidgets import QWebEngineView
 
 # Matplotlib - Configuración
 import matplotlib
@@ -29,153 +25,27 @@ from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg, NavigationToolb
 from matplotlib.figure import Figure
 
 # =============================================================================
-#  MOTOR MATEMÁTICO (IDÉNTICO A TU BASE)
+#  MOTOR MATEMÁTICO
 # =============================================================================
 
-CHAR_MAP = {
-    '0': '⁰', '1': '¹', '2': '²', '3': '³', '4': '⁴',
-    '5': '⁵', '6': '⁶', '7': '⁷', '8': '⁸', '9': '⁹',
-    '+': '⁺', '-': '⁻', '/': '⁄', '=': '⁼',
-    '(': '⁽', ')': '⁾',
-    'a': 'ᵃ', 'b': 'ᵇ', 'c': 'ᶜ', 'd': 'ᵈ', 'e': 'ᵉ', 
-    'f': 'ᶠ', 'g': 'ᵍ', 'h': 'ʰ', 'i': 'ⁱ', 'j': 'ʲ', 
-    'k': 'ᵏ', 'l': 'ˡ', 'm': 'ᵐ', 'n': 'ⁿ', 'o': 'ᵒ', 
-    'p': 'ᵖ', 'r': 'ʳ', 's': 'ˢ', 't': 'ᵗ', 'u': 'ᵘ', 
-    'v': 'ᵛ', 'w': 'ʷ', 'x': 'ˣ', 'y': 'ʸ', 'z': 'ᶻ',
-    'π': 'pi' 
-}
-
-REVERSE_MAP = {v: k for k, v in CHAR_MAP.items()}
-SUP_CHARS = "".join(CHAR_MAP.values())
-
-
-def _transform_sup_de_python(sup_norm: str) -> str:
-    sup_norm = sup_norm.strip()
-    if "(" in sup_norm or ")" in sup_norm:
-        return sup_norm
-    if "/" not in sup_norm:
-        return sup_norm
-    num, den = sup_norm.split("/", 1)
-    num, den = num.strip(), den.strip()
-    leading = num.startswith("-")
-    trailing = num.endswith("-")
-    core = num.strip("-").strip()
-    if leading and trailing:
-        return f"-(-{core})/{den}"
-    elif leading:
-        return f"-({core})/{den}"
-    elif trailing:
-        return f"(-{core})/{den}"
-    else:
-        return f"{core}/{den}"
-
-
-def normalizar_python(expr: str) -> str:
-    s = expr.strip().lower()
-    if not s: 
-        return ""
-    s = s.replace("π", "pi").replace("√", "sqrt")
-    s = re.sub(r'\be\b', 'e_val', s)
-
-    pattern = f"(?P<base>[a-zA-Z0-9_\\)\\]])(?P<sup>[{re.escape(SUP_CHARS)}]+)"
-
-    def repl(m):
-        base = m.group('base')
-        sup_raw = m.group('sup')
-        sup_norm = "".join(REVERSE_MAP.get(ch, ch) for ch in sup_raw)
-        sup_expr = _transform_sup_de_python(sup_norm)
-        return f"{base}**({sup_expr})"
-
-    s = re.sub(pattern, repl, s)
-    s = re.sub(r'(\d)([a-z\(])', r'\1*\2', s)
-    s = re.sub(r'(\))([a-z0-9\(])', r'\1*\2', s)
-
-    replacements = {r"\bsen\b": "sin", r"\bln\b": "log", r"\btg\b": "tan"}
-    for esp, eng in replacements.items():
-        s = re.sub(esp, eng, s)
-
-    return s.replace("^", "**").replace("⁄", "/")
-
-
-def generar_latex_previsualizacion(expr_visual: str) -> str:
-    if not expr_visual:
-        return ""
-    tex = expr_visual
-    tex = tex.replace("sen", "\\sin").replace("cos", "\\cos").replace("tan", "\\tan")
-    tex = tex.replace("ln", "\\ln").replace("log", "\\ln")
-    tex = tex.replace("sqrt", "\\sqrt").replace("pi", "\\pi")
-
-    pattern = f"([{re.escape(SUP_CHARS)}]+)"
-
-    def repl_latex(m):
-        norm_txt = "".join(REVERSE_MAP.get(c, c) for c in m.group(1)).strip()
-        if "(" in norm_txt and ")" in norm_txt:
-            try:
-                return f"^{{ {latex(sympify(norm_txt))} }}"
-            except:
-                return f"^{{ {norm_txt} }}"
-        if "/" in norm_txt:
-            num, den = norm_txt.split("/", 1)
-            num, den = num.strip(), den.strip()
-            leading = num.startswith("-")
-            trailing = num.endswith("-")
-            core = num.strip("-").strip()
-
-            if leading and not trailing: 
-                return f"^{{ -\\frac{{{core}}}{{{den}}} }}"
-            if trailing and not leading: 
-                return f"^{{ \\frac{{-{core}}}{{{den}}} }}"
-            if leading and trailing: 
-                return f"^{{ -\\frac{{-{core}}}{{{den}}} }}"
-
-            return f"^{{ \\frac{{{num}}}{{{den}}} }}"
-        return f"^{{{norm_txt}}}"
-
-    tex = re.sub(pattern, repl_latex, tex)
-    tex = tex.replace("*", " \\cdot ").replace("exp", "\\exp")
-    return tex
-
-
-def contexto_mat():
-    ctx = {k: v for k, v in np.__dict__.items() if callable(v) or isinstance(v, float)}
-    ctx.update({"x": 0, "e_val": np.e, "pi": np.pi, "log": np.log})
-    return ctx
-
-
-def evaluar(expr, x_val):
-    try:
-        norm = normalizar_python(expr)
-        ctx = contexto_mat()
-        ctx["x"] = x_val
-        val = eval(compile(norm, "<string>", "eval"), ctx)
-        return float(val)
-    except Exception:
-        return np.nan
+from motor_expresiones import CHAR_MAP, evaluar, generar_latex_previsualizacion
+from canvas_geogebra import (CurvaIncremental, CapaCursor, ArrastreLigero, cuadricula_acotada,
+                             buscar_todas_en_vista)
+from solucionadores import biseccion, ErrorBolzano, CANCELADO
+from trabajador_raices import TrabajadorRaiz
+from modelo_iteraciones import ModeloIteraciones
+from reporte_paginado import Reporte, PuenteReporte
+from render_mathjax import VistaMathJax
+from metricas import medido
 
 
 # =============================================================================
 #  COMPONENTES UI
 # =============================================================================
 
-class VisorLatex(QWebEngineView):
-    def __init__(self):
-        super().__init__()
-        self.setFixedHeight(80)
-        self.page().setBackgroundColor(Qt.GlobalColor.transparent)
-        self.setHtml(self._wrap(""))
-
-    def actualizar(self, txt):
-        latex_code = generar_latex_previsualizacion(txt) if txt else "\\text{Escribe tu función...}"
-        self.setHtml(self._wrap(latex_code))
-
-    def _wrap(self, formula):
-        return f"""
-        <html><head>
-        <script src="https://polyfill.io/v3/polyfill.min.js?features=es6"></script>
-        <script id="MathJax-script" async 
-        src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>
-        <style>
-        body {{
+class VisorLatex(VistaMathJax):
+    ESTILOS = """
+        body {
             font-family:'Segoe UI'; 
             color:#1565c0;
             display:flex; 
@@ -184,10 +54,17 @@ class VisorLatex(QWebEngineView):
             height:100%; 
             margin:0; 
             font-size:22px;
-        }}
-        </style>
-        </head><body>$$ {formula} $$</body></html>
-        """
+        }
+    """
+
+    def __init__(self):
+        super().__init__(self.ESTILOS)
+        self.setFixedHeight(80)
+        self.page().setBackgroundColor(Qt.GlobalColor.transparent)
+
+    def actualizar(self, txt):
+        latex_code = generar_latex_previsualizacion(txt) if txt else "\\text{Escribe tu función...}"
+        self.mostrar(f"$$ {latex_code} $$")
 
 
 class CampoMatematico(QLineEdit):
@@ -240,17 +117,23 @@ class VentanaBiseccion(QWidget):
 
         self.sel_a = False
         self.sel_b = False
-        self.linea_mouse = None
 
         self.timer = QTimer()
         self.timer.setInterval(400)
         self.timer.setSingleShot(True)
         self.timer.timeout.connect(self.graficar)
 
+        # Los cálculos corren en segundo plano (la ventana no se congela)
+        self.threadpool = QThreadPool()
+        self.trabajador = None
+
         self.setup_ui()
         self.aplicar_estilos()
         
         self.inicializar_plano_fijo()
+        self.curva = CurvaIncremental(self.ax, self.canvas)
+        self.cursor = CapaCursor(self.ax, self.canvas)
+        self.arrastre = ArrastreLigero(self.ax, self.canvas)
         self.conectar_grafica()
 
     def setup_ui(self):
@@ -334,6 +217,11 @@ class VentanaBiseccion(QWidget):
         hbtn.addWidget(self.b_clr, 1)
         vizq.addLayout(hbtn)
 
+        self.b_todas = QPushButton("Buscar todas las raíces en la vista")
+        self.b_todas.setFixedHeight(34)
+        self.b_todas.clicked.connect(self.buscar_todas)
+        vizq.addWidget(self.b_todas)
+
         # Resultados
         self.c_res = QFrame()
         self.c_res.setObjectName("CardRes")
@@ -385,9 +273,10 @@ class VentanaBiseccion(QWidget):
         t2 = QWidget()
         v2 = QVBoxLayout(t2)
 
-        self.tab = QTableWidget(0, 6)
+        self.modelo = ModeloIteraciones(["Iter", "a", "b", "c (Media)", "f(c)", "Error %"])
+        self.tab = QTableView()
+        self.tab.setModel(self.modelo)
         # Encabezados ajustados (c es el punto medio xr)
-        self.tab.setHorizontalHeaderLabels(["Iter", "a", "b", "c (Media)", "f(c)", "Error %"])
         self.tab.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.tab.setAlternatingRowColors(True)
         v2.addWidget(self.tab)
@@ -402,7 +291,8 @@ class VentanaBiseccion(QWidget):
         t3 = QWidget()
         v3 = QVBoxLayout(t3)
 
-        self.web = QWebEngineView()
+        self.web = VistaMathJax(self.ESTILOS_REPORTE)
+        self.puente_reporte = PuenteReporte(self.web)
         v3.addWidget(self.web)
         self.tabs.addTab(t3, "📝 Procedimiento")
 
@@ -441,9 +331,8 @@ class VentanaBiseccion(QWidget):
         self.ax.grid(which="major", linestyle="-", linewidth=0.45, color="#d5d5d5")
         self.ax.minorticks_on()
         
-        # Grid y Ticks idénticos a tu base mejorada
-        self.ax.set_xticks(np.arange(-50, 51, 0.5), minor=True)
-        self.ax.set_yticks(np.arange(-50, 51, 0.5), minor=True)
+        # Marcas cada 1 y 0.5 a esta escala, acotadas al alejar el zoom
+        cuadricula_acotada(self.ax)
         self.ax.grid(which="minor", linestyle="-", linewidth=0.25, color="#efefef")
 
         axis_color = "#333333"
@@ -456,8 +345,6 @@ class VentanaBiseccion(QWidget):
         self.ax.spines["top"].set_color("none")
         self.ax.spines["right"].set_color("none")
 
-        self.ax.set_xticks(np.arange(-50, 51, 1))
-        self.ax.set_yticks(np.arange(-50, 51, 1))
         self.ax.tick_params(axis="both", which="major", length=6, width=0.8, color="#333333", pad=6, labelsize=4)
         self.ax.tick_params(axis="both", which="minor", length=1, width=0.3, color="#aaaaaa")
         self.ax.set_xlim(-9, 9)
@@ -481,25 +368,21 @@ class VentanaBiseccion(QWidget):
     def _hover(self, e):
         if e.inaxes != self.ax: return
         if not (self.sel_a or self.sel_b): return
-        color_linea = "#d32f2f"
         if self.sel_a:
-            color_linea = "#2e7d32"
-        elif self.sel_b:
-            try:
-                a_val = float(self.ia.text())
-                b_val = e.xdata
-                txt = self.inp_f.text()
-                fa = evaluar(txt, a_val)
-                fb = evaluar(txt, b_val)
-                if fa * fb < 0: color_linea = "#2e7d32" 
-                else: color_linea = "#d32f2f"
-            except: color_linea = "#d32f2f"
-
-        if self.linea_mouse:
-            try: self.linea_mouse.remove()
-            except: pass
-        self.linea_mouse = self.ax.axvline(e.xdata, color=color_linea, linestyle="--", linewidth=2)
-        self.canvas.draw_idle()
+            self.cursor.mover(e.xdata, "#2e7d32")
+        else:
+            # f(a)·f(b) se evalúa solo para el movimiento que se pinta
+            self.cursor.mover(e.xdata, self._color_b)
+
+    def _color_b(self, b_val):
+        try:
+            a_val = float(self.ia.text())
+            txt = self.inp_f.text()
+            fa = evaluar(txt, a_val)
+            fb = evaluar(txt, b_val)
+            if fa * fb < 0: return "#2e7d32"
+            else: return "#d32f2f"
+        except: return "#d32f2f"
 
     def _click(self, e):
         if e.inaxes != self.ax: return
@@ -514,37 +397,26 @@ class VentanaBiseccion(QWidget):
             self.sel_b = False
             self.canvas.setCursor(Qt.CursorShape.ArrowCursor)
             self.graficar()
-        if self.linea_mouse:
-            try: self.linea_mouse.remove()
-            except: pass
-            self.linea_mouse = None
-            self.canvas.draw_idle()
+        self.cursor.ocultar()
 
+    @medido("graficar (Bisección)")
     def graficar(self):
         xlim = self.ax.get_xlim()
         ylim = self.ax.get_ylim()
         for artist in self.ax.lines + self.ax.collections + self.ax.texts:
+            if self.curva.es_propio(artist) or self.cursor.es_propio(artist): continue
             try: artist.remove()
             except: pass
         
         txt = self.inp_f.text()
         if not txt:
+            self.curva.actualizar("")
             self.canvas.draw()
             return
 
         try:
-            x_calc = np.linspace(xlim[0], xlim[1], 2000)
-            ys = np.array([evaluar(txt, x) for x in x_calc])
-            y_span = ylim[1] - ylim[0]
-            ys[np.abs(ys) > ylim[1] + y_span * 2] = np.nan 
-
-            self.ax.plot(x_calc, ys, color="#007a78", linewidth=1.1, solid_capstyle="round", zorder=4)
-
-            dy = np.gradient(ys, x_calc)
-            critical = np.where(np.diff(np.sign(dy)) != 0)[0]
-            crit_x = x_calc[critical]
-            crit_y = ys[critical]
-            self.ax.scatter(crit_x, crit_y, color="#555555", s=25, zorder=4, edgecolors="white", linewidths=1.1)
+            # Curva y puntos críticos: se actualizan en sitio desde la caché de tejas
+            self.curva.actualizar(txt)
 
             if self.ia.text():
                 try:
@@ -560,8 +432,12 @@ class VentanaBiseccion(QWidget):
                     self.ax.plot(b, 0, "o", color="#c62828", markersize=5, markeredgecolor="white", markeredgewidth=1.2, zorder=6)
                 except: pass
 
-            self.ax.set_xlim(xlim)
-            self.ax.set_ylim(ylim)
+            # Solo si cambiaron: set_xlim/set_ylim avisan a la curva
+            # (xlim_changed) y la volverían a calcular y dibujar
+            if self.ax.get_xlim() != xlim:
+                self.ax.set_xlim(xlim)
+            if self.ax.get_ylim() != ylim:
+                self.ax.set_ylim(ylim)
             self.canvas.draw()
         except Exception: pass
 
@@ -569,7 +445,12 @@ class VentanaBiseccion(QWidget):
     #  MÉTODO DE BISECCIÓN (LÓGICA ACTUALIZADA)
     # =========================================================
     def resolver_biseccion(self):
-        self.tab.setRowCount(0)
+        # Si ya hay un cálculo en curso, el botón funciona como "Detener"
+        if self.trabajador is not None:
+            self.trabajador.cancelar()
+            return
+
+        self.modelo.limpiar()
         self.lbl_raiz.setText("--")
         self.lbl_iter.setText("--")
 
@@ -581,160 +462,152 @@ class VentanaBiseccion(QWidget):
             b = float(self.ib.text())
             tol = float(self.itol.text())
             imax = int(self.iter.text())
+        except Exception as e:
+            QMessageBox.critical(self, "Error", str(e))
+            return
 
-            fa = evaluar(expr_txt, a)
-            fb = evaluar(expr_txt, b)
+        w = TrabajadorRaiz(biseccion, expr_txt, a, b, tol, imax, reporte=self._reporte)
+        w.signals.filas.connect(lambda hist, n, w=w: self._agregar_filas(w, hist, n))
+        w.signals.result.connect(lambda r, w=w: self._mostrar_resultado(w, *r))
+        w.signals.error.connect(lambda e, w=w: self._error_trabajador(w, e))
+        w.signals.finished.connect(lambda w=w: self._fin_trabajador(w))
+        self.trabajador = w
+        self.b_calc.setText("DETENER")
+        self.threadpool.start(w)
+
+    def _agregar_filas(self, w, historial, n):
+        if w is not self.trabajador:
+            return
+        self.modelo.mostrar(historial, n)
+        self.lbl_iter.setText(str(n))
 
-            if fa * fb > 0:
-                QMessageBox.critical(self, "Error de Bolzano", "f(a) y f(b) deben tener signos opuestos para iniciar el método de bisección.")
-                return
+    def _error_trabajador(self, w, e):
+        if w is not self.trabajador:
+            return
+        if isinstance(e, ErrorBolzano):
+            QMessageBox.critical(self, "Error de Bolzano", "f(a) y f(b) deben tener signos opuestos para iniciar el método de bisección.")
+        else:
+            QMessageBox.critical(self, "Error", str(e))
 
-            found = False
-            root = None
-            last_c = 0
-            
-            # Encabezado HTML Bisección
-            html = """
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <script src="https://polyfill.io/v3/polyfill.min.js?features=es6"></script>
-                <script id="MathJax-script" async src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>
-                <style>
-                    body { font-family: 'Segoe UI', sans-serif; padding: 20px; color: #333; line-height: 1.6; }
-                    h2 { color: #1565c0; border-bottom: 2px solid #1565c0; padding-bottom: 10px; }
-                    .iter-box { 
-                        border-left: 5px solid #1565c0; 
-                        padding: 10px 15px; 
-                        margin-bottom: 20px; 
-                        background-color: #f9f9f9;
-                        border-radius: 0 8px 8px 0;
-                    }
-                    .final-box { 
-                        background-color: #e8f5e9; 
-                        padding: 20px; 
-                        border-radius: 8px; 
-                        text-align: center; 
-                        color: #2e7d32; 
-                        border: 1px solid #c8e6c9;
-                    }
-                    .error-box { 
-                        background-color: #ffebee; 
-                        padding: 20px; 
-                        border-radius: 8px; 
-                        text-align: center; 
-                        color: #c62828; 
-                        border: 1px solid #ffcdd2;
-                    }
-                </style>
-            </head>
-            <body>
-            <h2>Procedimiento - Método de Bisección</h2>
-            <p>Usando el punto medio del intervalo:</p>
-            <p>$$ c = \\frac{a + b}{2} $$</p>
+    def _fin_trabajador(self, w):
+        if w is self.trabajador:
+            self.trabajador = None
+            self.b_calc.setText("CALCULAR RAÍZ")
+
+    # Estilos del procedimiento (Bisección)
+    ESTILOS_REPORTE = """
+        body { font-family: 'Segoe UI', sans-serif; padding: 20px; color: #333; line-height: 1.6; }
+        h2 { color: #1565c0; border-bottom: 2px solid #1565c0; padding-bottom: 10px; }
+        .iter-box { 
+            border-left: 5px solid #1565c0; 
+            padding: 10px 15px; 
+            margin-bottom: 20px; 
+            background-color: #f9f9f9;
+            border-radius: 0 8px 8px 0;
+        }
+        .final-box { 
+            background-color: #e8f5e9; 
+            padding: 20px; 
+            border-radius: 8px; 
+            text-align: center; 
+            color: #2e7d32; 
+            border: 1px solid #c8e6c9;
+        }
+        .error-box { 
+            background-color: #ffebee; 
+            padding: 20px; 
+            border-radius: 8px; 
+            text-align: center; 
+            color: #c62828; 
+            border: 1px solid #ffcdd2;
+        }
+    """
+
+    @staticmethod
+    def _paso_html(paso):
+        i, a, b, c, fc, err_p = paso.fila()
+
+        # Reporte LaTeX
+        if paso.fa * fc < 0:
+            cambio_signo = f"f(a) \\cdot f(c) < 0 \\Rightarrow b = c"
+        else:
+            cambio_signo = f"f(a) \\cdot f(c) > 0 \\Rightarrow a = c"
+
+        return f"""
+            <div class='iter-box'>
+                <strong>Iteración {i}</strong><br>
+                Intervalo: [{a:.5f}, {b:.5f}]<br>
+                $$ c_{{{i}}} = \\frac{{{a:.5f} + {b:.5f}}}{{2}} = \\mathbf{{{c:.6f}}} $$
+                $$ f(c_{{{i}}}) = {fc:.6f} $$
+                <small>Criterio de cambio: $$ {cambio_signo} $$</small><br>
+                Error: {err_p:.6f}%
+            </div>
             """
 
-            for i in range(1, imax + 1):
-                # FÓRMULA BISECCIÓN
-                c = (a + b) / 2.0
-                fc = evaluar(expr_txt, c)
-
-                # Error estimado
-                if i > 1 and c != 0:
-                    err_p = abs((c - last_c) / c) * 100
-                else:
-                    err_p = 100.0
-
-                # Tabla
-                r = self.tab.rowCount()
-                self.tab.insertRow(r)
-                row_data = [i, a, b, c, fc, err_p]
-                for j, val in enumerate(row_data):
-                    it = QTableWidgetItem(f"{val:.6f}" if j > 0 else str(int(val)))
-                    it.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    self.tab.setItem(r, j, it)
-
-                # Reporte LaTeX
-                cambio_signo = ""
-                if fa * fc < 0:
-                    cambio_signo = f"f(a) \\cdot f(c) < 0 \\Rightarrow b = c"
-                else:
-                    cambio_signo = f"f(a) \\cdot f(c) > 0 \\Rightarrow a = c"
-
-                html += f"""
-                <div class='iter-box'>
-                    <strong>Iteración {i}</strong><br>
-                    Intervalo: [{a:.5f}, {b:.5f}]<br>
-                    $$ c_{{{i}}} = \\frac{{{a:.5f} + {b:.5f}}}{{2}} = \\mathbf{{{c:.6f}}} $$
-                    $$ f(c_{{{i}}}) = {fc:.6f} $$
-                    <small>Criterio de cambio: $$ {cambio_signo} $$</small><br>
-                    Error: {err_p:.6f}%
-                </div>
-                """
-
-                # Criterio de parada
-                if abs(fc) < 1e-15 or err_p < tol:
-                    root = c
-                    found = True
-                    break
-
-                # Actualización de intervalo
-                if fa * fc < 0:
-                    b = c
-                    fb = fc # f(b) nuevo es f(c)
-                else:
-                    a = c
-                    fa = fc # f(a) nuevo es f(c)
-                
-                last_c = c
+    @classmethod
+    def _reporte(cls, res):
+        """Procedimiento paginado (las iteraciones se formatean al pedir cada página)."""
+        # Encabezado HTML Bisección
+        cabecera = """
+        <h2>Procedimiento - Método de Bisección</h2>
+        <p>Usando el punto medio del intervalo:</p>
+        <p>$$ c = \\frac{a + b}{2} $$</p>
+        """
+
+        if res.convergio:
+            final = f"""
+            <div class='final-box'>
+                <h3>✅ Convergencia alcanzada</h3>
+                $$ x \\approx {res.raiz:.6f} $$
+                <p>Iteraciones totales: {res.iteraciones}</p>
+            </div>
+            """
+        else:
+            titulo = "⏹ Cálculo detenido" if res.motivo == CANCELADO else "⚠️ No se alcanzó la tolerancia"
+            final = f"""
+            <div class='error-box'>
+                <h3>{titulo}</h3>
+                Último valor calculado: $$ c = {res.raiz:.6f} $$
+            </div>
+            """
+        return Reporte(res.historial, cls._paso_html, cabecera, final)
 
-            self.graficar()
+    def _mostrar_resultado(self, w, res, reporte):
+        if w is not self.trabajador:
+            return
+        self.modelo.mostrar(res.historial)
+        self.graficar()
+        root, a, b, i = res.raiz, res.a, res.b, res.iteraciones
 
-            if found:
-                self.ax.axvline(root, color='#2e7d32', linestyle='-', linewidth=2.5)
-                self.ax.plot(root, 0, 'o', color='#2e7d32', markersize=10, markeredgecolor='white', markeredgewidth=2, zorder=10)
-                
-                # Líneas punteadas mostrando el último intervalo
-                self.ax.axvline(a, color="#2e7d32", linestyle=":", alpha=0.5)
-                self.ax.axvline(b, color="#c62828", linestyle=":", alpha=0.5)
-
-                self.lbl_raiz.setText(f"{root:.6f}")
-                self.lbl_iter.setText(str(i))
-
-                html += f"""
-                <div class='final-box'>
-                    <h3>✅ Convergencia alcanzada</h3>
-                    $$ x \\approx {root:.6f} $$
-                    <p>Iteraciones totales: {i}</p>
-                </div>
-                </body></html>
-                """
-            else:
-                self.ax.axvline(c, color='#d32f2f', linestyle='-', linewidth=2.5)
-                self.lbl_raiz.setText(f"{c:.6f}")
-                self.lbl_iter.setText(str(imax))
-
-                html += f"""
-                <div class='error-box'>
-                    <h3>⚠️ No se alcanzó la tolerancia</h3>
-                    Último valor calculado: $$ c = {c:.6f} $$
-                </div>
-                </body></html>
-                """
+        if res.convergio:
+            self.ax.axvline(root, color='#2e7d32', linestyle='-', linewidth=2.5)
+            self.ax.plot(root, 0, 'o', color='#2e7d32', markersize=10, markeredgecolor='white', markeredgewidth=2, zorder=10)
+            
+            # Líneas punteadas mostrando el último intervalo
+            self.ax.axvline(a, color="#2e7d32", linestyle=":", alpha=0.5)
+            self.ax.axvline(b, color="#c62828", linestyle=":", alpha=0.5)
+        else:
+            self.ax.axvline(root, color='#d32f2f', linestyle='-', linewidth=2.5)
 
-            self.canvas.draw()
-            self.web.setHtml(html)
-            self.tabs.setCurrentIndex(2)
+        self.lbl_raiz.setText(f"{root:.6f}")
+        self.lbl_iter.setText(str(i))
 
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
+        self.canvas.draw()
+        self.puente_reporte.mostrar(reporte)
+        self.tabs.setCurrentIndex(2)
             
+    def buscar_todas(self):
+        buscar_todas_en_vista(self)
+
     def limpiar(self):
+        if self.trabajador is not None:
+            self.trabajador.cancelar()
+            self._fin_trabajador(self.trabajador)
         self.inp_f.clear()
         self.ia.setText("-1.0")
         self.ib.setText("1.0")
-        self.tab.setRowCount(0)
-        self.web.setHtml("")
+        self.modelo.limpiar()
+        self.puente_reporte.limpiar()
         self.lbl_raiz.setText("--")
         self.lbl_iter.setText("--")
         self.graficar()
@@ -743,14 +616,19 @@ class VentanaBiseccion(QWidget):
         if not pd:
             QMessageBox.warning(self, "Error", "Pandas no está instalado.")
             return
-        if self.tab.rowCount() == 0:
+        if self.modelo.rowCount() == 0:
             return
         path, _ = QFileDialog.getSaveFileName(self, "Guardar", "biseccion.xlsx", "Excel (*.xlsx)")
         if path:
-            d = [[self.tab.item(r, c).text() for c in range(6)] for r in range(self.tab.rowCount())]
+            d = self.modelo.filas_texto()
             pd.DataFrame(d, columns=["Iter", "a", "b", "c", "f(c)", "Err"]).to_excel(path, index=False)
             QMessageBox.information(self, "Exportado", "Archivo exportado correctamente.")
 
+    def closeEvent(self, e):
+        if self.trabajador is not None:
+            self.trabajador.cancelar()
+        super().closeEvent(e)
+
     def on_change(self, text):
         self.visor.actualizar(text)
         self.trigger()
@@ -1,10 +1,10 @@
 import sys
-import re
+from functools import partial
 import numpy as np
 import warnings
 warnings.filterwarnings("ignore", category=RuntimeWarning)
 
-from sympy import sympify, diff, Symbol, latex
+from sympy import diff, Symbol, latex
 
 # Intentamos importar pandas para exportar (opcional)
 try:
@@ -13,15 +13,14 @@ except ImportError:
     pd = None
     
 
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QThreadPool
 from PyQt6.QtGui import QColor
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QLabel, QLineEdit, QPushButton, QVBoxLayout,
     QHBoxLayout, QGridLayout, QFrame, QSplitter, QTabWidget,
-    QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox,
+    QTableView, QHeaderView, QMessageBox,
     QFileDialog, QGraphicsDropShadowEffect,QSizePolicy
 )
-from PyQt6.QtWebEngineWidgets import QWebEngineView
 
 # Matplotlib - Configuración
 import matplotlib
@@ -33,220 +32,38 @@ from matplotlib.figure import Figure
 #  MOTOR MATEMÁTICO
 # =============================================================================
 
-# Busca esta sección en tu código y reemplázala completa:
+from motor_expresiones import CHAR_MAP, a_sympy, generar_latex_previsualizacion
+from canvas_geogebra import (CurvaIncremental, CapaCursor, ArrastreLigero, cuadricula_acotada,
+                             buscar_todas_en_vista)
+from solucionadores import newton_raphson, VALOR_NAN, DERIVADA_CERO, CANCELADO
+from trabajador_raices import TrabajadorRaiz
+from modelo_iteraciones import ModeloIteraciones
+from reporte_paginado import Reporte, PuenteReporte
+from render_mathjax import VistaMathJax
+from metricas import medido
 
-CHAR_MAP = {
-    '0': '⁰', '1': '¹', '2': '²', '3': '³', '4': '⁴',
-    '5': '⁵', '6': '⁶', '7': '⁷', '8': '⁸', '9': '⁹',
-    '+': '⁺', '-': '⁻', '/': '⁄', '=': '⁼',
-    '(': '⁽', ')': '⁾',
-    
-    # Variables y letras para funciones (ln, sen, cos, tan, log, exp, pi)
-    'a': 'ᵃ', 'b': 'ᵇ', 'c': 'ᶜ', 'd': 'ᵈ', 'e': 'ᵉ', 
-    'f': 'ᶠ', 'g': 'ᵍ', 'h': 'ʰ', 'i': 'ⁱ', 'j': 'ʲ', 
-    'k': 'ᵏ', 'l': 'ˡ', 'm': 'ᵐ', 'n': 'ⁿ', 'o': 'ᵒ', 
-    'p': 'ᵖ', 'r': 'ʳ', 's': 'ˢ', 't': 'ᵗ', 'u': 'ᵘ', 
-    'v': 'ᵛ', 'w': 'ʷ', 'x': 'ˣ', 'y': 'ʸ', 'z': 'ᶻ',
-    
-    # Mapeo especial para pi si quisieras escribirlo directo
-    'π': 'pi' # Nota: no existe pi superíndice real en todas las fuentes, 
-               # pero puedes usar 'ᴾ' si prefieres visualmente.
-}
-
-# (El resto de REVERSE_MAP y SUP_CHARS se actualiza solo porque dependen de este diccionario)
-REVERSE_MAP = {v: k for k, v in CHAR_MAP.items()}
-SUP_CHARS = "".join(CHAR_MAP.values())
-
-
-def _transform_sup_de_python(sup_norm: str) -> str:
-    """
-    Interpreta el texto del exponente ya 'normalizado' desde superíndices.
-    Soporta las variantes:
-      - "-1/2"   -> -1/2        (signo fuera)
-      - "1-/2"   -> (-1)/2      (signo dentro)
-      - "-1-/2"  -> -(-1/2)     (dos signos)
-      - con paréntesis: "-(-1/2)" se deja tal cual
-    """
-    sup_norm = sup_norm.strip()
-
-    # Si tiene paréntesis, dejamos que SymPy lo entienda tal cual
-    if "(" in sup_norm or ")" in sup_norm:
-        return sup_norm
-
-    if "/" not in sup_norm:
-        return sup_norm
-
-    num, den = sup_norm.split("/", 1)
-    num = num.strip()
-    den = den.strip()
-
-    leading = num.startswith("-")
-    trailing = num.endswith("-")
-    core = num.strip("-").strip()
-
-    if leading and trailing:
-        # -1-  -> -(-1/den)
-        return f"-(-{core})/{den}"
-    elif leading:
-        # -1   -> -(1/den)
-        return f"-({core})/{den}"
-    elif trailing:
-        # 1-   -> (-1)/den
-        return f"(-{core})/{den}"
-    else:
-        return f"{core}/{den}"
-
-
-def normalizar_python(expr: str) -> str:
-    """Convierte entrada visual (con superíndices unicode) a sintaxis Python ejecutable."""
-    s = expr.strip().lower()
-    if not s:
-        return ""
-
-    # Reemplazos básicos
-    s = s.replace("π", "pi").replace("√", "sqrt")
-
-    # Reemplazar 'e' por 'e_val' solo si es una palabra aislada
-    s = re.sub(r'\be\b', 'e_val', s)
-
-    # Manejo de superíndices (x² -> x**(2), x⁻¹⁄² -> x**(-1/2), x⁻¹⁻⁄² -> x**(-(-1/2)))
-    pattern = f"(?P<base>[a-zA-Z0-9_\\)\\]])(?P<sup>[{re.escape(SUP_CHARS)}]+)"
-
-    def repl(m):
-        base = m.group('base')
-        sup_raw = m.group('sup')
-        sup_norm = "".join(REVERSE_MAP.get(ch, ch) for ch in sup_raw)
-        sup_expr = _transform_sup_de_python(sup_norm)
-        return f"{base}**({sup_expr})"
-
-    s = re.sub(pattern, repl, s)
-
-    # Multiplicación implícita: 2x -> 2*x, (x+1)2 -> (x+1)*2, etc
-    s = re.sub(r'(\d)([a-z\(])', r'\1*\2', s)
-    s = re.sub(r'(\))([a-z0-9\(])', r'\1*\2', s)
-
-    # funciones trig / log en español
-    replacements = {
-        r"\bsen\b": "sin",
-        r"\bln\b": "log",
-        r"\btg\b": "tan"
-    }
-    for esp, eng in replacements.items():
-        s = re.sub(esp, eng, s)
-
-    return s.replace("^", "**").replace("⁄", "/")
-
-
-def generar_latex_previsualizacion(expr_visual: str) -> str:
-    """
-    Generador de LaTeX para la vista previa.
-    Soporta:
-      x⁻¹⁄²    -> x^{-\frac{1}{2}}
-      x¹⁻⁄²    -> x^{\frac{-1}{2}}
-      x⁻¹⁻⁄²   -> x^{-\frac{-1}{2}}
-      x⁻(⁻¹⁄²) -> x^{-( -1/2 )} -> x^{-\left(\frac{-1}{2}\right)}
-    """
-    if not expr_visual:
-        return ""
-
-    tex = expr_visual
-    tex = tex.replace("sen", "\\sin").replace("cos", "\\cos").replace("tan", "\\tan")
-    tex = tex.replace("ln", "\\ln").replace("log", "\\ln")
-    tex = tex.replace("sqrt", "\\sqrt").replace("pi", "\\pi")
-
-    pattern = f"([{re.escape(SUP_CHARS)}]+)"
-
-    def repl_latex(m):
-        # Convertimos superíndices unicode a texto "normal"
-        norm_txt = "".join(REVERSE_MAP.get(c, c) for c in m.group(1)).strip()
-
-        # Caso: exponente con paréntesis, lo pasa por SymPy para LaTeX bonito
-        if "(" in norm_txt and ")" in norm_txt:
-            try:
-                expr_sym = sympify(norm_txt)
-                return f"^{{ {latex(expr_sym)} }}"
-            except Exception:
-                return f"^{{ {norm_txt} }}"
-
-        # Caso: fracción tipo (combinaciones con signos)
-        if "/" in norm_txt:
-            num, den = norm_txt.split("/", 1)
-            num = num.strip()
-            den = den.strip()
-
-            leading = num.startswith("-")
-            trailing = num.endswith("-")
-            core = num.strip("-").strip()
-
-            # x⁻¹⁄² -> "-1/2" -> fuera
-            if leading and not trailing:
-                return f"^{{ -\\frac{{{core}}}{{{den}}} }}"
-
-            # x¹⁻⁄² -> "1-" -> dentro
-            if trailing and not leading:
-                return f"^{{ \\frac{{-{core}}}{{{den}}} }}"
-
-            # x⁻¹⁻⁄² -> "-1-" -> dos signos
-            if leading and trailing:
-                return f"^{{ -\\frac{{-{core}}}{{{den}}} }}"
-
-            # sin signos
-            return f"^{{ \\frac{{{num}}}{{{den}}} }}"
-
-        # resto de exponentes normales
-        return f"^{{{norm_txt}}}"
-
-    tex = re.sub(pattern, repl_latex, tex)
-    tex = tex.replace("*", " \\cdot ").replace("exp", "\\exp")
-    return tex
-
-
-def contexto_mat():
-    """Contexto seguro para evaluar expresiones numéricas."""
-    ctx = {k: v for k, v in np.__dict__.items() if callable(v) or isinstance(v, float)}
-    ctx.update({"x": 0, "e_val": np.e, "pi": np.pi, "log": np.log})
-    return ctx
-
-
-def evaluar(expr, x_val):
-    """Evalúa una expresión matemática en un punto x."""
-    try:
-        norm = normalizar_python(expr)
-        ctx = contexto_mat()
-        ctx['x'] = x_val
-        val = eval(compile(norm, "<string>", "eval"), ctx)
-        return float(val)
-    except Exception:
-        return np.nan
 
 # =============================================================================
 #  COMPONENTES UI
 # =============================================================================
 
-class VisorLatex(QWebEngineView):
+class VisorLatex(VistaMathJax):
+    ESTILOS = """
+        body {
+            font-family:'Segoe UI'; color:#1565c0;
+            display:flex; justify-content:center; align-items:center;
+            height:100%; margin:0; font-size:22px;
+        }
+    """
+
     def __init__(self):
-        super().__init__()
+        super().__init__(self.ESTILOS)
         self.setFixedHeight(80)
         self.page().setBackgroundColor(Qt.GlobalColor.transparent)
-        self.setHtml(self._wrap(""))
 
     def actualizar(self, txt):
         latex_code = generar_latex_previsualizacion(txt) if txt else "\\text{Escribe tu función...}"
-        self.setHtml(self._wrap(latex_code))
-
-    def _wrap(self, formula):
-        return f"""<html><head>
-        <script src="https://polyfill.io/v3/polyfill.min.js?features=es6"></script>
-        <script id="MathJax-script" async
-                src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>
-        <style>
-        body {{
-            font-family:'Segoe UI'; color:#1565c0;
-            display:flex; justify-content:center; align-items:center;
-            height:100%; margin:0; font-size:22px;
-        }}
-        </style>
-        </head><body>$$ {formula} $$</body></html>"""
+        self.mostrar(f"$$ {latex_code} $$")
 
 
 class CampoMatematico(QLineEdit):
@@ -319,17 +136,23 @@ class VentanaNewton(QWidget):
         self.resize(1100, 750)
 
         self.sel_x0 = False
-        self.linea_mouse = None
 
         self.timer = QTimer()
         self.timer.setInterval(400)
         self.timer.setSingleShot(True)
         self.timer.timeout.connect(self.graficar)
 
+        # Los cálculos corren en segundo plano (la ventana no se congela)
+        self.threadpool = QThreadPool()
+        self.trabajador = None
+
         self.setup_ui()
         self.aplicar_estilos()
 
         self.inicializar_plano_fijo()
+        self.curva = CurvaIncremental(self.ax, self.canvas)
+        self.cursor = CapaCursor(self.ax, self.canvas)
+        self.arrastre = ArrastreLigero(self.ax, self.canvas)
         self.conectar_grafica()
 
     def setup_ui(self):
@@ -410,6 +233,11 @@ class VentanaNewton(QWidget):
         hbtn.addWidget(self.b_clr, 1)
         vizq.addLayout(hbtn)
 
+        self.b_todas = QPushButton("Buscar todas las raíces en la vista")
+        self.b_todas.setFixedHeight(34)
+        self.b_todas.clicked.connect(self.buscar_todas)
+        vizq.addWidget(self.b_todas)
+
         # Card resultados
         self.c_res = QFrame()
         self.c_res.setObjectName("CardRes")
@@ -479,11 +307,12 @@ class VentanaNewton(QWidget):
         # Tab 2: Tabla
         t2 = QWidget()
         v2 = QVBoxLayout(t2)
-        self.tab = QTableWidget(0, 5)
+        self.modelo = ModeloIteraciones(["Iter", "x_n", "f(x_n)", "f'(x_n)", "Error %"])
+        self.tab = QTableView()
+        self.tab.setModel(self.modelo)
         self.tab.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        self.tab.setStyleSheet("QTableWidget::item { color: #000000; }")
+        self.tab.setStyleSheet("QTableView::item { color: #000000; }")
 
-        self.tab.setHorizontalHeaderLabels(["Iter", "x_n", "f(x_n)", "f'(x_n)", "Error %"])
         self.tab.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.tab.verticalHeader().setDefaultSectionSize(35)
         self.tab.setAlternatingRowColors(True)
@@ -496,7 +325,8 @@ class VentanaNewton(QWidget):
         # Tab 3: Procedimiento
         t3 = QWidget()
         v3 = QVBoxLayout(t3)
-        self.web = QWebEngineView()
+        self.web = VistaMathJax(self.ESTILOS_REPORTE)
+        self.puente_reporte = PuenteReporte(self.web)
         v3.addWidget(self.web)
         self.tabs.addTab(t3, "📝 Procedimiento")
 
@@ -579,9 +409,9 @@ class VentanaNewton(QWidget):
         )
 
         # === GRID MENOR: aún más suave ===
+        # (marcas cada 1 y 0.5 a esta escala, acotadas al alejar el zoom)
         self.ax.minorticks_on()
-        self.ax.set_xticks(np.arange(-50, 51, 0.5), minor=True)
-        self.ax.set_yticks(np.arange(-50, 51, 0.5), minor=True)
+        cuadricula_acotada(self.ax)
 
         self.ax.grid(
             which="minor",
@@ -604,14 +434,6 @@ class VentanaNewton(QWidget):
         self.ax.spines["top"].set_color("none")
         self.ax.spines["right"].set_color("none")
 
-        # === Ticks principales (cada 1) ===
-        self.ax.set_xticks(np.arange(-50, 51, 1))
-        self.ax.set_yticks(np.arange(-50, 51, 1))
-
-        # === Ticks menores (cada 0.5) ===
-        self.ax.set_xticks(np.arange(-50, 51, 0.5), minor=True)
-        self.ax.set_yticks(np.arange(-50, 51, 0.5), minor=True)
-
         # === Estilo de ticks (más finos y números pequeños) ===
         self.ax.tick_params(
             axis="both",
@@ -658,13 +480,7 @@ class VentanaNewton(QWidget):
             return
         if not self.sel_x0:
             return
-        if self.linea_mouse:
-            try:
-                self.linea_mouse.remove()
-            except Exception:
-                pass
-        self.linea_mouse = self.ax.axvline(e.xdata, color='#ff9800', linestyle='--', linewidth=2)
-        self.canvas.draw_idle()
+        self.cursor.mover(e.xdata, '#ff9800')
 
     def _click(self, e):
         if e.inaxes != self.ax:
@@ -674,8 +490,14 @@ class VentanaNewton(QWidget):
             self.ix0.setText(val)
             self.sel_x0 = False
             self.canvas.setCursor(Qt.CursorShape.ArrowCursor)
+            self.cursor.ocultar()
             self.graficar()
 
+    def closeEvent(self, e):
+        if self.trabajador is not None:
+            self.trabajador.cancelar()
+        super().closeEvent(e)
+
     def on_change(self, t):
         self.visor.actualizar(t)
         self.trigger()
@@ -683,57 +505,24 @@ class VentanaNewton(QWidget):
     def trigger(self):
         self.timer.start()
 
+    @medido("graficar (Newton)")
     def graficar(self):
         xlim = self.ax.get_xlim()
         ylim = self.ax.get_ylim()
 
         for artist in self.ax.lines + self.ax.collections + self.ax.texts:
+            if self.curva.es_propio(artist) or self.cursor.es_propio(artist): continue
             artist.remove()
 
         txt = self.inp_f.text()
         if not txt:
+            self.curva.actualizar("")
             self.canvas.draw()
             return
 
         try:
-            # Muchísimos puntos para una curva super suave
-            x_calc = np.linspace(xlim[0], xlim[1], 2000)
-            ys = np.array([evaluar(txt, x) for x in x_calc])
-
-            # Evitar blow-up a ±infinito
-            y_span = ylim[1] - ylim[0]
-            ys[np.abs(ys) > ylim[1] + y_span * 2] = np.nan
-
-            # ===================== CURVA PRINCIPAL =====================
-            self.ax.plot(
-                x_calc,
-                ys,
-                color="#007a78",        # color verde azulado
-                linewidth=1.1,         # aqui se controla el grosor
-                solid_capstyle="round",
-                zorder=4 # capa superior del gráfico
-            )
-
-            # ===================== DETECCIÓN DE MÁXIMOS Y MÍNIMOS =====================
-            dy = np.gradient(ys, x_calc)
-            ddy = np.gradient(dy, x_calc)
-
-            # índices donde dy cambia de signo (picos y valles)
-            critical = np.where(np.diff(np.sign(dy)) != 0)[0]
-
-            crit_x = x_calc[critical]
-            crit_y = ys[critical]
-
-            # ===================== PUNTOS TIPO GEOGEBRA =====================
-            self.ax.scatter( # este es el punto gris de los máximos y mínimos
-                crit_x, # coordenadas x de los puntos críticos
-                crit_y, # coordenadas y de los puntos críticos
-                color="#555555", # color gris oscuro
-                s=25, # tamaño de los puntos
-                zorder=4, # capa superior del gráfico
-                edgecolors="white", # borde blanco
-                linewidths=1.1
-            )
+            # Curva y puntos críticos: se actualizan en sitio desde la caché de tejas
+            self.curva.actualizar(txt)
 
             # ================= MARCAR x0 =================
             if self.ix0.text():
@@ -752,8 +541,12 @@ class VentanaNewton(QWidget):
                 except Exception:
                     pass
 
-            self.ax.set_xlim(xlim)
-            self.ax.set_ylim(ylim)
+            # Solo si cambiaron: set_xlim/set_ylim avisan a la curva
+            # (xlim_changed) y la volverían a calcular y dibujar
+            if self.ax.get_xlim() != xlim:
+                self.ax.set_xlim(xlim)
+            if self.ax.get_ylim() != ylim:
+                self.ax.set_ylim(ylim)
             self.canvas.draw()
 
         except Exception:
@@ -761,11 +554,14 @@ class VentanaNewton(QWidget):
 
     # ================= CÁLCULO NEWTON-RAPHSON =================
 
-        # ================= CÁLCULO NEWTON-RAPHSON =================
-
     def resolver(self):
+        # Si ya hay un cálculo en curso, el botón funciona como "Detener"
+        if self.trabajador is not None:
+            self.trabajador.cancelar()
+            return
+
         # Reset visual
-        self.tab.setRowCount(0)
+        self.modelo.limpiar()
         self.lbl_raiz.setText("--")
         self.lbl_iter.setText("--")
 
@@ -777,8 +573,7 @@ class VentanaNewton(QWidget):
             # --------- Derivación simbólica ---------
             try:
                 x_sym = Symbol('x')
-                expr_limpia = normalizar_python(expr_txt)
-                expr_sym = sympify(expr_limpia.replace("e_val", "E"))
+                expr_sym = a_sympy(expr_txt)
                 f_sym = expr_sym
                 df_sym = diff(f_sym, x_sym)
 
@@ -795,114 +590,127 @@ class VentanaNewton(QWidget):
             tol = float(self.itol.text())
             imax = int(self.iter.text())
 
-            html = f"""
-            <html><body style='font-family:Segoe UI; padding:20px; color:#333; line-height:1.5'>
-            <h2 style='color:#1565c0; border-bottom:2px solid #1565c0; padding-bottom:10px'>
-                Procedimiento Newton-Raphson
-            </h2>
-            <p><b>Función:</b> $$f(x) = {f_latex}$$</p>
-            <p><b>Derivada:</b> $$f'(x) = {df_latex}$$</p>
-            <p><b>Fórmula:</b> $$x_{{n+1}} = x_n - \\frac{{f(x_n)}}{{f'(x_n)}}$$</p>
-            <hr>
-            """
+        except Exception as e:
+            QMessageBox.critical(self, "Error", str(e))
+            return
 
-            found = False
-
-            for i in range(1, imax + 1):
-                fx = evaluar(expr_txt, x_n)
-                dfx = evaluar(df_txt_eval, x_n)
-
-                if np.isnan(fx) or np.isnan(dfx):
-                    html += "<div style='background:#ffebee; color:#c62828; padding:15px;'>⚠️ Error: Valor indefinido (NaN).</div>"
-                    break
-
-                if abs(dfx) < 1e-15:
-                    html += "<div style='background:#ffebee; color:#c62828; padding:15px;'>⚠️ Derivada ≈ 0 (división por cero).</div>"
-                    break
-
-                x_next = x_n - (fx / dfx)
-                err = abs((x_next - x_n) / x_next) * 100 if x_next != 0 else 100
-
-                # ----------------- Tabla -----------------
-                r = self.tab.rowCount()
-                self.tab.insertRow(r)
-                for j, val in enumerate([i, x_n, fx, dfx, err]):
-                    item_text = f"{val:.6f}" if j > 0 else str(int(val))
-                    it = QTableWidgetItem(item_text)
-                    it.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    self.tab.setItem(r, j, it)
-
-                # ----------------- Paso a paso HTML -----------------
-                html += f"""
-                <div style='background:#fff; border:1px solid #e0e0e0; padding:15px;
-                            margin-bottom:15px; border-radius:8px; border-left:5px solid #1565c0;'>
-                    <b>Iteración {i}</b> (xₙ = {x_n:.5f})<br>
-                    $$f({x_n:.4f}) = {fx:.4f}, \quad f'({x_n:.4f}) = {dfx:.4f}$$<br>
-                    $$x_{{{i+1}}} = {x_n:.5f} - \\frac{{{fx:.4f}}}{{{dfx:.4f}}}
-                    = \\mathbf{{{x_next:.6f}}}$$<br>
-                    <small style='color:#666'>Error: {err:.5f}%</small>
-                </div>
-                """
-
-                # Actualizamos x_n al nuevo valor
-                x_n = x_next
-
-                # ¿Convergencia?
-                if abs(fx) < 1e-15 or err < tol:
-                    root = x_n  # este es nuestro x*
-                    html += f"""
-                    <div style='background:#e8f5e9; color:#2e7d32; padding:20px;
-                                border-radius:8px; text-align:center;'>
-                       <h3>✅ Raíz: {root:.6f}</h3>
-                    </div>
-                    """
-
-                    # ===>>> ACTUALIZAMOS LOS LABELS DEL PANEL IZQUIERDO
-                    self.lbl_raiz.setText(f"{root:.6f}")
-                    self.lbl_iter.setText(str(i))
-
-                    # Redibujar gráfica y marcar raíz exacta sobre el eje x
-                    self.graficar()
-                    self.ax.plot(
-                        root, 0,
-                        'o',
-                        color='#d32f2f',
-                        markersize=6,
-                        markeredgecolor='white',
-                        markeredgewidth=1.1,
-                        zorder=10
-                    )
-                    self.canvas.draw()
-
-                    found = True
-                    break
-
-            # Si no convergió, al menos mostramos el último x_n como aproximación
-            if not found:
-                html += "<div style='color:#d32f2f; text-align:center;'>⚠️ No convergió dentro del número máximo de iteraciones.</div>"
-                # Mostramos la última aproximación igual
-                self.lbl_raiz.setText(f"{x_n:.6f}")
-                self.lbl_iter.setText(str(imax))
-
-            html += """
-            <script src="https://polyfill.io/v3/polyfill.min.js?features=es6"></script>
-            <script id="MathJax-script" async
-                    src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>
-            </body></html>
+        w = TrabajadorRaiz(newton_raphson, expr_txt, x_n, tol, imax, derivada=df_txt_eval,
+                           reporte=partial(self._reporte, f_latex, df_latex))
+        w.signals.filas.connect(lambda hist, n, w=w: self._agregar_filas(w, hist, n))
+        w.signals.result.connect(lambda r, w=w: self._mostrar_resultado(w, *r))
+        w.signals.error.connect(lambda e, w=w: self._error_trabajador(w, e))
+        w.signals.finished.connect(lambda w=w: self._fin_trabajador(w))
+        self.trabajador = w
+        self.b_calc.setText("DETENER")
+        self.threadpool.start(w)
+
+    def _agregar_filas(self, w, historial, n):
+        if w is not self.trabajador:
+            return
+        self.modelo.mostrar(historial, n)
+        self.lbl_iter.setText(str(n))
+
+    def _error_trabajador(self, w, e):
+        if w is self.trabajador:
+            QMessageBox.critical(self, "Error", str(e))
+
+    def _fin_trabajador(self, w):
+        if w is self.trabajador:
+            self.trabajador = None
+            self.b_calc.setText("CALCULAR RAÍZ")
+
+    # Estilos del procedimiento
+    ESTILOS_REPORTE = "body { font-family:Segoe UI; padding:20px; color:#333; line-height:1.5; }"
+
+    @staticmethod
+    def _paso_html(paso):
+        i, x_n, fx, dfx, x_next, err = paso.i, paso.x, paso.fx, paso.dfx, paso.x_sig, paso.error
+
+        # ----------------- Paso a paso HTML -----------------
+        return f"""
+            <div style='background:#fff; border:1px solid #e0e0e0; padding:15px;
+                        margin-bottom:15px; border-radius:8px; border-left:5px solid #1565c0;'>
+                <b>Iteración {i}</b> (xₙ = {x_n:.5f})<br>
+                $$f({x_n:.4f}) = {fx:.4f}, \quad f'({x_n:.4f}) = {dfx:.4f}$$<br>
+                $$x_{{{i+1}}} = {x_n:.5f} - \\frac{{{fx:.4f}}}{{{dfx:.4f}}}
+                = \\mathbf{{{x_next:.6f}}}$$<br>
+                <small style='color:#666'>Error: {err:.5f}%</small>
+            </div>
             """
 
-            self.web.setHtml(html)
-            self.tabs.setCurrentIndex(2)
+    @classmethod
+    def _reporte(cls, f_latex, df_latex, res):
+        """Procedimiento paginado (las iteraciones se formatean al pedir cada página)."""
+        cabecera = f"""
+        <h2 style='color:#1565c0; border-bottom:2px solid #1565c0; padding-bottom:10px'>
+            Procedimiento Newton-Raphson
+        </h2>
+        <p><b>Función:</b> $$f(x) = {f_latex}$$</p>
+        <p><b>Derivada:</b> $$f'(x) = {df_latex}$$</p>
+        <p><b>Fórmula:</b> $$x_{{n+1}} = x_n - \\frac{{f(x_n)}}{{f'(x_n)}}$$</p>
+        <hr>
+        """
+
+        partes = []
+        if res.motivo == VALOR_NAN:
+            partes.append("<div style='background:#ffebee; color:#c62828; padding:15px;'>⚠️ Error: Valor indefinido (NaN).</div>")
+        elif res.motivo == DERIVADA_CERO:
+            partes.append("<div style='background:#ffebee; color:#c62828; padding:15px;'>⚠️ Derivada ≈ 0 (división por cero).</div>")
+
+        if res.convergio:
+            partes.append(f"""
+            <div style='background:#e8f5e9; color:#2e7d32; padding:20px;
+                        border-radius:8px; text-align:center;'>
+               <h3>✅ Raíz: {res.raiz:.6f}</h3>
+            </div>
+            """)
+        elif res.motivo == CANCELADO:
+            partes.append("<div style='color:#d32f2f; text-align:center;'>⏹ Cálculo detenido por el usuario.</div>")
+        else:
+            partes.append("<div style='color:#d32f2f; text-align:center;'>⚠️ No convergió dentro del número máximo de iteraciones.</div>")
+
+        return Reporte(res.historial, cls._paso_html, cabecera, "".join(partes))
+
+    def _mostrar_resultado(self, w, res, reporte):
+        if w is not self.trabajador:
+            return
+        self.modelo.mostrar(res.historial)
 
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
+        # ===>>> ACTUALIZAMOS LOS LABELS DEL PANEL IZQUIERDO
+        # (si no convergió, al menos mostramos el último x_n como aproximación)
+        self.lbl_raiz.setText(f"{res.raiz:.6f}")
+        self.lbl_iter.setText(str(res.iteraciones))
+
+        if res.convergio:
+            root = res.raiz  # este es nuestro x*
+
+            # Redibujar gráfica y marcar raíz exacta sobre el eje x
+            self.graficar()
+            self.ax.plot(
+                root, 0,
+                'o',
+                color='#d32f2f',
+                markersize=6,
+                markeredgecolor='white',
+                markeredgewidth=1.1,
+                zorder=10
+            )
+            self.canvas.draw()
+
+        self.puente_reporte.mostrar(reporte)
+        self.tabs.setCurrentIndex(2)
 
+    def buscar_todas(self):
+        buscar_todas_en_vista(self)
 
     def limpiar(self):
+        if self.trabajador is not None:
+            self.trabajador.cancelar()
+            self._fin_trabajador(self.trabajador)
         self.inp_f.clear()
         self.ix0.setText("0.5")
-        self.tab.setRowCount(0)
-        self.web.setHtml("")
+        self.modelo.limpiar()
+        self.puente_reporte.limpiar()
         self.lbl_raiz.setText("--")
         self.lbl_iter.setText("--")
         self.graficar()
@@ -911,11 +719,11 @@ class VentanaNewton(QWidget):
         if not pd:
             QMessageBox.warning(self, "X", "Pandas no instalado")
             return
-        if self.tab.rowCount() == 0:
+        if self.modelo.rowCount() == 0:
             return
         path, _ = QFileDialog.getSaveFileName(self, "Guardar", "newton.xlsx", "Excel (*.xlsx)")
         if path:
-            d = [[self.tab.item(r, c).text() for c in range(5)] for r in range(self.tab.rowCount())]
+            d = self.modelo.filas_texto()
             pd.DataFrame(d, columns=["Iter", "xn", "f(xn)", "f'(xn)", "Err"]).to_excel(path, index=False)
             QMessageBox.information(self, "Ok", "Exportado correctamente")
 
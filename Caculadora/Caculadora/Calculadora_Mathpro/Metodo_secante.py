@@ -1,10 +1,10 @@
 import sys
-import re
+from functools import partial
 import numpy as np
 import warnings
 warnings.filterwarnings("ignore", category=RuntimeWarning)
 
-from sympy import sympify, Symbol, latex
+from sympy import latex
 
 # Intentamos importar pandas para exportar (opcional)
 try:
@@ -13,15 +13,14 @@ except ImportError:
     pd = None
     
 
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QThreadPool
 from PyQt6.QtGui import QColor
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QLabel, QLineEdit, QPushButton, QVBoxLayout,
     QHBoxLayout, QGridLayout, QFrame, QSplitter, QTabWidget,
-    QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox,
+    QTableView, QHeaderView, QMessageBox,
     QFileDialog, QGraphicsDropShadowEffect, QSizePolicy
 )
-from PyQt6.QtWebEngineWidgets import QWebEngineView
 
 # Matplotlib - Configuración
 import matplotlib
@@ -33,147 +32,38 @@ from matplotlib.figure import Figure
 #  MOTOR MATEMÁTICO
 # =============================================================================
 
-CHAR_MAP = {
-    '0': '⁰', '1': '¹', '2': '²', '3': '³', '4': '⁴',
-    '5': '⁵', '6': '⁶', '7': '⁷', '8': '⁸', '9': '⁹',
-    '+': '⁺', '-': '⁻', '/': '⁄', '=': '⁼',
-    '(': '⁽', ')': '⁾',
-    'a': 'ᵃ', 'b': 'ᵇ', 'c': 'ᶜ', 'd': 'ᵈ', 'e': 'ᵉ', 
-    'f': 'ᶠ', 'g': 'ᵍ', 'h': 'ʰ', 'i': 'ⁱ', 'j': 'ʲ', 
-    'k': 'ᵏ', 'l': 'ˡ', 'm': 'ᵐ', 'n': 'ⁿ', 'o': 'ᵒ', 
-    'p': 'ᵖ', 'r': 'ʳ', 's': 'ˢ', 't': 'ᵗ', 'u': 'ᵘ', 
-    'v': 'ᵛ', 'w': 'ʷ', 'x': 'ˣ', 'y': 'ʸ', 'z': 'ᶻ',
-    'π': 'pi' 
-}
-
-REVERSE_MAP = {v: k for k, v in CHAR_MAP.items()}
-SUP_CHARS = "".join(CHAR_MAP.values())
-
-
-def _transform_sup_de_python(sup_norm: str) -> str:
-    sup_norm = sup_norm.strip()
-    if "(" in sup_norm or ")" in sup_norm:
-        return sup_norm
-    if "/" not in sup_norm:
-        return sup_norm
-    num, den = sup_norm.split("/", 1)
-    num = num.strip()
-    den = den.strip()
-    leading = num.startswith("-")
-    trailing = num.endswith("-")
-    core = num.strip("-").strip()
-    if leading and trailing:
-        return f"-(-{core})/{den}"
-    elif leading:
-        return f"-({core})/{den}"
-    elif trailing:
-        return f"(-{core})/{den}"
-    else:
-        return f"{core}/{den}"
-
-
-def normalizar_python(expr: str) -> str:
-    s = expr.strip().lower()
-    if not s:
-        return ""
-    s = s.replace("π", "pi").replace("√", "sqrt")
-    s = re.sub(r'\be\b', 'e_val', s)
-    pattern = f"(?P<base>[a-zA-Z0-9_\\)\\]])(?P<sup>[{re.escape(SUP_CHARS)}]+)"
-    def repl(m):
-        base = m.group('base')
-        sup_raw = m.group('sup')
-        sup_norm = "".join(REVERSE_MAP.get(ch, ch) for ch in sup_raw)
-        sup_expr = _transform_sup_de_python(sup_norm)
-        return f"{base}**({sup_expr})"
-    s = re.sub(pattern, repl, s)
-    s = re.sub(r'(\d)([a-z\(])', r'\1*\2', s)
-    s = re.sub(r'(\))([a-z0-9\(])', r'\1*\2', s)
-    replacements = {r"\bsen\b": "sin", r"\bln\b": "log", r"\btg\b": "tan"}
-    for esp, eng in replacements.items():
-        s = re.sub(esp, eng, s)
-    return s.replace("^", "**").replace("⁄", "/")
-
-
-def generar_latex_previsualizacion(expr_visual: str) -> str:
-    if not expr_visual:
-        return ""
-    tex = expr_visual
-    tex = tex.replace("sen", "\\sin").replace("cos", "\\cos").replace("tan", "\\tan")
-    tex = tex.replace("ln", "\\ln").replace("log", "\\ln")
-    tex = tex.replace("sqrt", "\\sqrt").replace("pi", "\\pi")
-    pattern = f"([{re.escape(SUP_CHARS)}]+)"
-    def repl_latex(m):
-        norm_txt = "".join(REVERSE_MAP.get(c, c) for c in m.group(1)).strip()
-        if "(" in norm_txt and ")" in norm_txt:
-            try:
-                expr_sym = sympify(norm_txt)
-                return f"^{{ {latex(expr_sym)} }}"
-            except Exception:
-                return f"^{{ {norm_txt} }}"
-        if "/" in norm_txt:
-            num, den = norm_txt.split("/", 1)
-            num = num.strip()
-            den = den.strip()
-            leading = num.startswith("-")
-            trailing = num.endswith("-")
-            core = num.strip("-").strip()
-            if leading and not trailing:
-                return f"^{{ -\\frac{{{core}}}{{{den}}} }}"
-            if trailing and not leading:
-                return f"^{{ \\frac{{-{core}}}{{{den}}} }}"
-            if leading and trailing:
-                return f"^{{ -\\frac{{-{core}}}{{{den}}} }}"
-            return f"^{{ \\frac{{{num}}}{{{den}}} }}"
-        return f"^{{{norm_txt}}}"
-    tex = re.sub(pattern, repl_latex, tex)
-    tex = tex.replace("*", " \\cdot ").replace("exp", "\\exp")
-    return tex
-
-
-def contexto_mat():
-    ctx = {k: v for k, v in np.__dict__.items() if callable(v) or isinstance(v, float)}
-    ctx.update({"x": 0, "e_val": np.e, "pi": np.pi, "log": np.log})
-    return ctx
-
-
-def evaluar(expr, x_val):
-    try:
-        norm = normalizar_python(expr)
-        ctx = contexto_mat()
-        ctx['x'] = x_val
-        val = eval(compile(norm, "<string>", "eval"), ctx)
-        return float(val)
-    except Exception:
-        return np.nan
+from motor_expresiones import CHAR_MAP, a_sympy, generar_latex_previsualizacion
+from canvas_geogebra import (CurvaIncremental, CapaCursor, ArrastreLigero, cuadricula_acotada,
+                             buscar_todas_en_vista)
+from solucionadores import secante, VALOR_NAN, DIVISION_CERO, CANCELADO
+from trabajador_raices import TrabajadorRaiz
+from modelo_iteraciones import ModeloIteraciones
+from reporte_paginado import Reporte, PuenteReporte
+from render_mathjax import VistaMathJax
+from metricas import medido
+
 
 # =============================================================================
 #  COMPONENTES UI
 # =============================================================================
 
-class VisorLatex(QWebEngineView):
+class VisorLatex(VistaMathJax):
+    ESTILOS = """
+        body {
+            font-family:'Segoe UI'; color:#1565c0;
+            display:flex; justify-content:center; align-items:center;
+            height:100%; margin:0; font-size:22px;
+        }
+    """
+
     def __init__(self):
-        super().__init__()
+        super().__init__(self.ESTILOS)
         self.setFixedHeight(80)
         self.page().setBackgroundColor(Qt.GlobalColor.transparent)
-        self.setHtml(self._wrap(""))
 
     def actualizar(self, txt):
         latex_code = generar_latex_previsualizacion(txt) if txt else "\\text{Escribe tu función...}"
-        self.setHtml(self._wrap(latex_code))
-
-    def _wrap(self, formula):
-        return f"""<html><head>
-        <script src="https://polyfill.io/v3/polyfill.min.js?features=es6"></script>
-        <script id="MathJax-script" async
-                src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>
-        <style>
-        body {{
-            font-family:'Segoe UI'; color:#1565c0;
-            display:flex; justify-content:center; align-items:center;
-            height:100%; margin:0; font-size:22px;
-        }}
-        </style>
-        </head><body>$$ {formula} $$</body></html>"""
+        self.mostrar(f"$$ {latex_code} $$")
 
 
 class CampoMatematico(QLineEdit):
@@ -220,17 +110,23 @@ class VentanaSecante(QWidget):
         self.resize(1100, 750)
 
         self.sel_x0 = False
-        self.linea_mouse = None
 
         self.timer = QTimer()
         self.timer.setInterval(400)
         self.timer.setSingleShot(True)
         self.timer.timeout.connect(self.graficar)
 
+        # Los cálculos corren en segundo plano (la ventana no se congela)
+        self.threadpool = QThreadPool()
+        self.trabajador = None
+
         self.setup_ui()
         self.aplicar_estilos()
 
         self.inicializar_plano_fijo()
+        self.curva = CurvaIncremental(self.ax, self.canvas)
+        self.cursor = CapaCursor(self.ax, self.canvas)
+        self.arrastre = ArrastreLigero(self.ax, self.canvas)
         self.conectar_grafica()
 
     def setup_ui(self):
@@ -322,6 +218,11 @@ class VentanaSecante(QWidget):
         hbtn.addWidget(self.b_clr, 1)
         vizq.addLayout(hbtn)
 
+        self.b_todas = QPushButton("Buscar todas las raíces en la vista")
+        self.b_todas.setFixedHeight(34)
+        self.b_todas.clicked.connect(self.buscar_todas)
+        vizq.addWidget(self.b_todas)
+
         # Card resultados
         self.c_res = QFrame()
         self.c_res.setObjectName("CardRes")
@@ -379,12 +280,13 @@ class VentanaSecante(QWidget):
         # Tab 2: Tabla
         t2 = QWidget()
         v2 = QVBoxLayout(t2)
-        self.tab = QTableWidget(0, 6) # Una columna más para Secante
+        self.modelo = ModeloIteraciones(["Iter", "x_{n-1}", "x_n", "f(x_n)", "x_{n+1}", "Error %"])
+        self.tab = QTableView() # Una columna más para Secante
+        self.tab.setModel(self.modelo)
         self.tab.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        self.tab.setStyleSheet("QTableWidget::item { color: #000000; }")
+        self.tab.setStyleSheet("QTableView::item { color: #000000; }")
         
         # Columnas ajustadas para Secante
-        self.tab.setHorizontalHeaderLabels(["Iter", "x_{n-1}", "x_n", "f(x_n)", "x_{n+1}", "Error %"])
         self.tab.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.tab.verticalHeader().setDefaultSectionSize(35)
         self.tab.setAlternatingRowColors(True)
@@ -397,7 +299,8 @@ class VentanaSecante(QWidget):
         # Tab 3: Procedimiento
         t3 = QWidget()
         v3 = QVBoxLayout(t3)
-        self.web = QWebEngineView()
+        self.web = VistaMathJax(self.ESTILOS_REPORTE)
+        self.puente_reporte = PuenteReporte(self.web)
         v3.addWidget(self.web)
         self.tabs.addTab(t3, "📝 Procedimiento")
 
@@ -454,8 +357,7 @@ class VentanaSecante(QWidget):
 
         self.ax.grid(which="major", linestyle="-", linewidth=0.45, color="#d5d5d5")
         self.ax.minorticks_on()
-        self.ax.set_xticks(np.arange(-50, 51, 0.5), minor=True)
-        self.ax.set_yticks(np.arange(-50, 51, 0.5), minor=True)
+        cuadricula_acotada(self.ax)
         self.ax.grid(which="minor", linestyle="-", linewidth=0.25, color="#efefef")
 
         axis_color = "#333333"
@@ -468,8 +370,6 @@ class VentanaSecante(QWidget):
         self.ax.spines["top"].set_color("none")
         self.ax.spines["right"].set_color("none")
 
-        self.ax.set_xticks(np.arange(-50, 51, 1))
-        self.ax.set_yticks(np.arange(-50, 51, 1))
         self.ax.tick_params(axis="both", which="major", length=6, width=0.8, color="#333", pad=6, labelsize=8)
         self.ax.tick_params(axis="both", which="minor", length=1, width=0.3, color="#aaa")
 
@@ -490,13 +390,7 @@ class VentanaSecante(QWidget):
             return
         if not self.sel_x0:
             return
-        if self.linea_mouse:
-            try:
-                self.linea_mouse.remove()
-            except Exception:
-                pass
-        self.linea_mouse = self.ax.axvline(e.xdata, color='#ff9800', linestyle='--', linewidth=2)
-        self.canvas.draw_idle()
+        self.cursor.mover(e.xdata, '#ff9800')
 
     def _click(self, e):
         if e.inaxes != self.ax:
@@ -506,8 +400,14 @@ class VentanaSecante(QWidget):
             self.ix0.setText(val)
             self.sel_x0 = False
             self.canvas.setCursor(Qt.CursorShape.ArrowCursor)
+            self.cursor.ocultar()
             self.graficar()
 
+    def closeEvent(self, e):
+        if self.trabajador is not None:
+            self.trabajador.cancelar()
+        super().closeEvent(e)
+
     def on_change(self, t):
         self.visor.actualizar(t)
         self.trigger()
@@ -515,35 +415,24 @@ class VentanaSecante(QWidget):
     def trigger(self):
         self.timer.start()
 
+    @medido("graficar (Secante)")
     def graficar(self):
         xlim = self.ax.get_xlim()
         ylim = self.ax.get_ylim()
 
         for artist in self.ax.lines + self.ax.collections + self.ax.texts:
+            if self.curva.es_propio(artist) or self.cursor.es_propio(artist): continue
             artist.remove()
 
         txt = self.inp_f.text()
         if not txt:
+            self.curva.actualizar("")
             self.canvas.draw()
             return
 
         try:
-            x_calc = np.linspace(xlim[0], xlim[1], 2000)
-            ys = np.array([evaluar(txt, x) for x in x_calc])
-            y_span = ylim[1] - ylim[0]
-            ys[np.abs(ys) > ylim[1] + y_span * 2] = np.nan
-
-            self.ax.plot(
-                x_calc, ys, color="#007a78", linewidth=1.1,
-                solid_capstyle="round", zorder=4
-            )
-
-            # Puntos críticos (max/min)
-            dy = np.gradient(ys, x_calc)
-            critical = np.where(np.diff(np.sign(dy)) != 0)[0]
-            crit_x = x_calc[critical]
-            crit_y = ys[critical]
-            self.ax.scatter(crit_x, crit_y, color="#555555", s=25, zorder=4, edgecolors="white", linewidths=1.1)
+            # Curva y puntos críticos: se actualizan en sitio desde la caché de tejas
+            self.curva.actualizar(txt)
 
             # === MARCAR x0 ===
             if self.ix0.text():
@@ -563,8 +452,12 @@ class VentanaSecante(QWidget):
                     self.ax.axvline(x1, color='#e65100', linestyle='--', alpha=0.5)
                 except Exception: pass
 
-            self.ax.set_xlim(xlim)
-            self.ax.set_ylim(ylim)
+            # Solo si cambiaron: set_xlim/set_ylim avisan a la curva
+            # (xlim_changed) y la volverían a calcular y dibujar
+            if self.ax.get_xlim() != xlim:
+                self.ax.set_xlim(xlim)
+            if self.ax.get_ylim() != ylim:
+                self.ax.set_ylim(ylim)
             self.canvas.draw()
 
         except Exception:
@@ -573,143 +466,148 @@ class VentanaSecante(QWidget):
     # ================= CÁLCULO SECANTE =================
 
     def resolver(self):
+        # Si ya hay un cálculo en curso, el botón funciona como "Detener"
+        if self.trabajador is not None:
+            self.trabajador.cancelar()
+            return
+
         # Reset visual
-        self.tab.setRowCount(0)
+        self.modelo.limpiar()
         self.lbl_raiz.setText("--")
         self.lbl_iter.setText("--")
 
+        expr_txt = self.inp_f.text()
+        if not expr_txt:
+            return
+
+        # Para mostrar bonito en LaTeX
         try:
-            expr_txt = self.inp_f.text()
-            if not expr_txt:
-                return
+            f_sym = a_sympy(expr_txt)
+            f_latex = latex(f_sym)
+        except Exception:
+            f_latex = expr_txt
 
-            # Para mostrar bonito en LaTeX
-            try:
-                expr_limpia = normalizar_python(expr_txt)
-                f_sym = sympify(expr_limpia.replace("e_val", "E"))
-                f_latex = latex(f_sym)
-            except Exception:
-                f_latex = expr_txt
-
-            # Parámetros iniciales
-            try:
-                x_prev = float(self.ix0.text()) # x0 (i-1)
-                x_curr = float(self.ix1.text()) # x1 (i)
-                tol = float(self.itol.text())
-                imax = int(self.iter.text())
-            except ValueError:
-                QMessageBox.warning(self, "Error", "Verifica que los valores numéricos sean correctos")
-                return
+        # Parámetros iniciales
+        try:
+            x_prev = float(self.ix0.text()) # x0 (i-1)
+            x_curr = float(self.ix1.text()) # x1 (i)
+            tol = float(self.itol.text())
+            imax = int(self.iter.text())
+        except ValueError:
+            QMessageBox.warning(self, "Error", "Verifica que los valores numéricos sean correctos")
+            return
 
-            html = f"""
-            <html><body style='font-family:Segoe UI; padding:20px; color:#333; line-height:1.5'>
-            <h2 style='color:#1565c0; border-bottom:2px solid #1565c0; padding-bottom:10px'>
-                Procedimiento: Método de la Secante
-            </h2>
-            <p><b>Función:</b> $$f(x) = {f_latex}$$</p>
-            <p><b>Valores iniciales:</b> $x_0 = {x_prev}, \quad x_1 = {x_curr}$</p>
-            <p><b>Fórmula Recurrente:</b> 
-               $$x_{{n+1}} = x_n - \\frac{{f(x_n)(x_n - x_{{n-1}})}}{{f(x_n) - f(x_{{n-1}})}}$$
-            </p>
-            <hr>
-            """
+        w = TrabajadorRaiz(secante, expr_txt, x_prev, x_curr, tol, imax,
+                           reporte=partial(self._reporte, f_latex, x_prev, x_curr))
+        w.signals.filas.connect(lambda hist, n, w=w: self._agregar_filas(w, hist, n))
+        w.signals.result.connect(lambda r, w=w: self._mostrar_resultado(w, *r))
+        w.signals.error.connect(lambda e, w=w: self._error_trabajador(w, e))
+        w.signals.finished.connect(lambda w=w: self._fin_trabajador(w))
+        self.trabajador = w
+        self.b_calc.setText("DETENER")
+        self.threadpool.start(w)
+
+    def _agregar_filas(self, w, historial, n):
+        if w is not self.trabajador:
+            return
+        self.modelo.mostrar(historial, n)
+        self.lbl_iter.setText(str(n))
+
+    def _error_trabajador(self, w, e):
+        if w is self.trabajador:
+            QMessageBox.critical(self, "Error", str(e))
 
-            found = False
-
-            # Evaluar funciones iniciales
-            f_prev = evaluar(expr_txt, x_prev)
-            
-            for i in range(1, imax + 1):
-                f_curr = evaluar(expr_txt, x_curr)
-
-                if np.isnan(f_curr) or np.isnan(f_prev):
-                    html += "<div style='background:#ffebee; color:#c62828; padding:15px;'>⚠️ Error: Valor indefinido (NaN).</div>"
-                    break
-
-                denom = f_curr - f_prev
-                if abs(denom) < 1e-15:
-                    html += "<div style='background:#ffebee; color:#c62828; padding:15px;'>⚠️ División por cero (f(xn) ≈ f(xn-1)).</div>"
-                    break
-
-                # Fórmula de la Secante
-                x_next = x_curr - (f_curr * (x_curr - x_prev) / denom)
-                
-                err = abs((x_next - x_curr) / x_next) * 100 if x_next != 0 else 100
-
-                # ----------------- Tabla -----------------
-                r = self.tab.rowCount()
-                self.tab.insertRow(r)
-                # Cols: Iter, x_{n-1}, x_n, f(x_n), x_{n+1}, Error
-                datos_fila = [i, x_prev, x_curr, f_curr, x_next, err]
-                
-                for j, val in enumerate(datos_fila):
-                    item_text = f"{val:.6f}" if j > 0 else str(int(val))
-                    it = QTableWidgetItem(item_text)
-                    it.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    self.tab.setItem(r, j, it)
-
-                # ----------------- Paso a paso HTML -----------------
-                html += f"""
-                <div style='background:#fff; border:1px solid #e0e0e0; padding:15px;
-                            margin-bottom:15px; border-radius:8px; border-left:5px solid #1565c0;'>
-                    <b>Iteración {i}</b><br>
-                    $x_{{n-1}} = {x_prev:.5f}, \quad f(x_{{n-1}}) = {f_prev:.5f}$<br>
-                    $x_n = {x_curr:.5f}, \quad f(x_n) = {f_curr:.5f}$<br>
-                    $$x_{{{i+1}}} = {x_curr:.5f} - \\frac{{{f_curr:.4f}({x_curr:.4f} - {x_prev:.4f})}}{{{f_curr:.4f} - {f_prev:.4f}}} 
-                    = \\mathbf{{{x_next:.6f}}}$$<br>
-                    <small style='color:#666'>Error Relativo: {err:.5f}%</small>
-                </div>
-                """
-
-                # Actualizar variables para siguiente iteración
-                x_prev = x_curr
-                f_prev = f_curr
-                x_curr = x_next # El nuevo calculado pasa a ser el actual
-
-                # ¿Convergencia?
-                if abs(f_curr) < 1e-15 or err < tol:
-                    root = x_next
-                    html += f"""
-                    <div style='background:#e8f5e9; color:#2e7d32; padding:20px;
-                                border-radius:8px; text-align:center;'>
-                       <h3>✅ Raíz Aproximada: {root:.6f}</h3>
-                    </div>
-                    """
-                    self.lbl_raiz.setText(f"{root:.6f}")
-                    self.lbl_iter.setText(str(i))
-
-                    # Graficar punto final
-                    self.graficar()
-                    self.ax.plot(root, 0, 'o', color='#d32f2f', markersize=6, 
-                                 markeredgecolor='white', markeredgewidth=1.1, zorder=10)
-                    self.canvas.draw()
-                    found = True
-                    break
-
-            if not found:
-                html += "<div style='color:#d32f2f; text-align:center;'>⚠️ No convergió o límite de iteraciones alcanzado.</div>"
-                self.lbl_raiz.setText(f"{x_curr:.6f}")
-                self.lbl_iter.setText(str(imax))
-
-            html += """
-            <script src="https://polyfill.io/v3/polyfill.min.js?features=es6"></script>
-            <script id="MathJax-script" async
-                    src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>
-            </body></html>
+    def _fin_trabajador(self, w):
+        if w is self.trabajador:
+            self.trabajador = None
+            self.b_calc.setText("CALCULAR RAÍZ")
+
+    # Estilos del procedimiento
+    ESTILOS_REPORTE = "body { font-family:Segoe UI; padding:20px; color:#333; line-height:1.5; }"
+
+    @staticmethod
+    def _paso_html(paso):
+        i, x_prev, x_curr, f_curr, x_next, err = paso.fila()
+        f_prev = paso.f_ant
+
+        # ----------------- Paso a paso HTML -----------------
+        return f"""
+            <div style='background:#fff; border:1px solid #e0e0e0; padding:15px;
+                        margin-bottom:15px; border-radius:8px; border-left:5px solid #1565c0;'>
+                <b>Iteración {i}</b><br>
+                $x_{{n-1}} = {x_prev:.5f}, \quad f(x_{{n-1}}) = {f_prev:.5f}$<br>
+                $x_n = {x_curr:.5f}, \quad f(x_n) = {f_curr:.5f}$<br>
+                $$x_{{{i+1}}} = {x_curr:.5f} - \\frac{{{f_curr:.4f}({x_curr:.4f} - {x_prev:.4f})}}{{{f_curr:.4f} - {f_prev:.4f}}} 
+                = \\mathbf{{{x_next:.6f}}}$$<br>
+                <small style='color:#666'>Error Relativo: {err:.5f}%</small>
+            </div>
             """
-            self.web.setHtml(html)
-            self.tabs.setCurrentIndex(2)
 
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
+    @classmethod
+    def _reporte(cls, f_latex, x0, x1, res):
+        """Procedimiento paginado (las iteraciones se formatean al pedir cada página)."""
+        cabecera = f"""
+        <h2 style='color:#1565c0; border-bottom:2px solid #1565c0; padding-bottom:10px'>
+            Procedimiento: Método de la Secante
+        </h2>
+        <p><b>Función:</b> $$f(x) = {f_latex}$$</p>
+        <p><b>Valores iniciales:</b> $x_0 = {x0}, \quad x_1 = {x1}$</p>
+        <p><b>Fórmula Recurrente:</b> 
+           $$x_{{n+1}} = x_n - \\frac{{f(x_n)(x_n - x_{{n-1}})}}{{f(x_n) - f(x_{{n-1}})}}$$
+        </p>
+        <hr>
+        """
+
+        partes = []
+        if res.motivo == VALOR_NAN:
+            partes.append("<div style='background:#ffebee; color:#c62828; padding:15px;'>⚠️ Error: Valor indefinido (NaN).</div>")
+        elif res.motivo == DIVISION_CERO:
+            partes.append("<div style='background:#ffebee; color:#c62828; padding:15px;'>⚠️ División por cero (f(xn) ≈ f(xn-1)).</div>")
+
+        if res.convergio:
+            partes.append(f"""
+            <div style='background:#e8f5e9; color:#2e7d32; padding:20px;
+                        border-radius:8px; text-align:center;'>
+               <h3>✅ Raíz Aproximada: {res.raiz:.6f}</h3>
+            </div>
+            """)
+        elif res.motivo == CANCELADO:
+            partes.append("<div style='color:#d32f2f; text-align:center;'>⏹ Cálculo detenido por el usuario.</div>")
+        else:
+            partes.append("<div style='color:#d32f2f; text-align:center;'>⚠️ No convergió o límite de iteraciones alcanzado.</div>")
+
+        return Reporte(res.historial, cls._paso_html, cabecera, "".join(partes))
+
+    def _mostrar_resultado(self, w, res, reporte):
+        if w is not self.trabajador:
+            return
+        self.modelo.mostrar(res.historial)
+
+        self.lbl_raiz.setText(f"{res.raiz:.6f}")
+        self.lbl_iter.setText(str(res.iteraciones))
+
+        if res.convergio:
+            # Graficar punto final
+            self.graficar()
+            self.ax.plot(res.raiz, 0, 'o', color='#d32f2f', markersize=6, 
+                         markeredgecolor='white', markeredgewidth=1.1, zorder=10)
+            self.canvas.draw()
+
+        self.puente_reporte.mostrar(reporte)
+        self.tabs.setCurrentIndex(2)
 
+    def buscar_todas(self):
+        buscar_todas_en_vista(self)
 
     def limpiar(self):
+        if self.trabajador is not None:
+            self.trabajador.cancelar()
+            self._fin_trabajador(self.trabajador)
         self.inp_f.clear()
         self.ix0.setText("0.0")
         self.ix1.setText("1.0")
-        self.tab.setRowCount(0)
-        self.web.setHtml("")
+        self.modelo.limpiar()
+        self.puente_reporte.limpiar()
         self.lbl_raiz.setText("--")
         self.lbl_iter.setText("--")
         self.graficar()
@@ -718,13 +616,13 @@ class VentanaSecante(QWidget):
         if not pd:
             QMessageBox.warning(self, "X", "Pandas no instalado")
             return
-        if self.tab.rowCount() == 0:
+        if self.modelo.rowCount() == 0:
             return
         path, _ = QFileDialog.getSaveFileName(self, "Guardar", "secante.xlsx", "Excel (*.xlsx)")
         if path:
             # Columnas corregidas para exportación
             cols = ["Iter", "x(n-1)", "xn", "f(xn)", "x(n+1)", "Err"]
-            d = [[self.tab.item(r, c).text() for c in range(6)] for r in range(self.tab.rowCount())]
+            d = self.modelo.filas_texto()
             pd.DataFrame(d, columns=cols).to_excel(path, index=False)
             QMessageBox.information(self, "Ok", "Exportado correctamente")
 
@@ -7,7 +7,29 @@ from PyQt6.QtWidgets import (
     QComboBox, QTableWidget, QTableWidgetItem, QTextEdit
 )
 from PyQt6.QtWidgets import QSizePolicy, QSplitter
-from PyQt6.QtWebEngineWidgets import QWebEngineView
+from render_mathjax import VistaMathJax
+
+
+# Estilos del procedimiento (tarjetas + MathJax)
+ESTILOS_PROCEDIMIENTO = """
+    body {
+        background-color:#F0F4F8;
+        font-family:'Segoe UI',sans-serif;
+        padding:10px;
+    }
+    .card {
+        background:#FFFFFF;
+        border-radius:12px;
+        padding:16px 20px;
+        box-shadow:0 2px 6px rgba(0,0,0,0.15);
+        margin-bottom:10px;
+    }
+    pre {
+        font-family:Consolas,'Courier New',monospace;
+        font-size:13px;
+        white-space:pre-wrap;
+    }
+"""
 
 def multiplicar_matriz_por_escalar(M, k):
     """
@@ -294,7 +316,7 @@ class VentanaMultiplicacionEscalar(QWidget):
             "color:transparent; background:transparent; border:none;"
         )
 
-        self.procedimiento_web = QWebEngineView()
+        self.procedimiento_web = VistaMathJax(ESTILOS_PROCEDIMIENTO)
 
         splitter = QSplitter(Qt.Orientation.Vertical)
         splitter.addWidget(self.procedimiento_text)
@@ -322,41 +344,7 @@ class VentanaMultiplicacionEscalar(QWidget):
     #   HTML + MathJax
     # =====================================================
     def _set_html_content(self, body_html: str) -> None:
-        full_html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8"/>
-            <style>
-                body {{
-                    background-color:#F0F4F8;
-                    font-family:'Segoe UI',sans-serif;
-                    padding:10px;
-                }}
-                .card {{
-                    background:#FFFFFF;
-                    border-radius:12px;
-                    padding:16px 20px;
-                    box-shadow:0 2px 6px rgba(0,0,0,0.15);
-                    margin-bottom:10px;
-                }}
-                pre {{
-                    font-family:Consolas,'Courier New',monospace;
-                    font-size:13px;
-                    white-space:pre-wrap;
-                }}
-            </style>
-            <script src="https://polyfill.io/v3/polyfill.min.js?features=es6"></script>
-            <script id="MathJax-script" async
-                src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js">
-            </script>
-        </head>
-        <body>
-            {body_html}
-        </body>
-        </html>
-        """
-        self.procedimiento_web.setHtml(full_html)
+        self.procedimiento_web.mostrar(body_html)
 
     # =====================================================
     #   Helpers tablas
@@ -0,0 +1,345 @@
+from collections import OrderedDict
+from fractions import Fraction
+from math import gcd, lcm, prod
+from operator import mul
+
+import numpy as np
+
+import metricas
+
+# =============================================================================
+#  ÁLGEBRA LINEAL EXACTA SIN FRACCIONES (Bareiss)
+# =============================================================================
+#
+# Eliminar con listas de Fraction cuesta un máximo común divisor por cada
+# operación y, en matrices enteras de tamaño moderado, numeradores y
+# denominadores crecen sin control. Aquí se trabaja con enteros de Python:
+#
+#   - FactorizacionExacta es una PLU con el algoritmo de Bareiss: cada
+#     combinación de filas se divide (de forma exacta) entre el pivote
+#     anterior, así que los números intermedios son menores de la matriz y
+#     su tamaño queda acotado. factorizar() la guarda por el contenido de
+#     la matriz, así que determinante, inversa, rango y sistemas sobre la
+#     misma A (Gauss, Inversa, Leontief, Cramer...) factorizan una sola vez.
+#   - EliminacionExacta guarda cada fila como un vector de enteros primitivo
+#     por un factor Fraction, para los procedimientos paso a paso de
+#     Matrices (Gauss, Gauss-Jordan, inversa): las mismas combinaciones
+#     cruzadas de Bareiss, pero como esos pasos normalizan filas a mitad de
+#     camino, se divide por el contenido de la fila (siempre múltiplo del
+#     divisor de Bareiss).
+#
+# producto() escala las filas de A y las columnas de B a enteros y
+# multiplica enteros (int64 de NumPy cuando no puede desbordar).
+#
+# Fraction solo aparece al final, o para mostrar un paso. Este módulo no
+# depende de PyQt6.
+
+INT64_MAX = 2 ** 63 - 1
+
+
+def a_enteros(M):
+    """
+    (F, L) con F[i] = M[i] * L[i] enteros y L[i] el mcm de los
+    denominadores de la fila i. Acepta int, Fraction, str...
+    """
+    F, L = [], []
+    for fila in M:
+        fila = [x if isinstance(x, Fraction) else Fraction(x) for x in fila]
+        m = lcm(*(x.denominator for x in fila))
+        F.append([x.numerator * (m // x.denominator) for x in fila])
+        L.append(m)
+    return F, L
+
+
+def producto(A, B):
+    """A·B exacto como lista de listas de Fraction."""
+    k = len(B)
+    if any(len(fila) != k for fila in A):
+        raise ValueError(" Número de columnas de A debe ser igual a número de filas de B.")
+    FA, LA = a_enteros(A)
+    FB, LB = a_enteros(list(zip(*B)))      # columnas de B
+    cota = (max((abs(x) for fila in FA for x in fila), default=0)
+            * max((abs(x) for col in FB for x in col), default=0) * k)
+    if cota <= INT64_MAX:
+        # Ningún producto ni suma parcial se sale de int64
+        C = (np.array(FA, dtype=np.int64).reshape(len(FA), k)
+             @ np.array(FB, dtype=np.int64).reshape(len(FB), k).T).tolist()
+    else:
+        C = [[sum(map(mul, fa, fb)) for fb in FB] for fa in FA]
+    return [[Fraction(c, la * lb) for c, lb in zip(fila, LB)] for fila, la in zip(C, LA)]
+
+
+def _cuadrada(M):
+    n = len(M)
+    if n == 0:
+        raise ValueError("La matriz está vacía.")
+    if any(len(fila) != n for fila in M):
+        raise ValueError("La matriz no es cuadrada.")
+    return n
+
+
+# =============================================================================
+#  FACTORIZACIÓN PLU SIN FRACCIONES (Bareiss) Y SU CACHÉ
+# =============================================================================
+
+MAX_FACTORIZACIONES = 8
+
+
+class FactorizacionExacta:
+    """
+    Eliminación de Bareiss de M = diag(1/L)·F guardada para reutilizarla:
+    determinante, rango, inversa y sistemas con cualquier cantidad de
+    lados derechos salen de la misma factorización.
+
+    En F quedan, por fila, los multiplicadores de cada paso (columnas
+    pivote anteriores, como L en PLU) y la fila de U (el resto); perm es
+    el orden final de las filas y d los pivotes de Bareiss (d[0] = 1,
+    d[-1] = det(P·F) si M es invertible).
+
+    al_paso, si se da, se llama como al_paso(self, sel) después de cada
+    paso (sel: fila que se intercambió con la del pivote); sirve para
+    mostrar el procedimiento sin duplicar la eliminación.
+    """
+
+    def __init__(self, M, al_paso=None):
+        F, self.L = a_enteros(M)
+        self.F = F
+        self.n = len(F)
+        self.m = len(F[0]) if F else 0
+        self.perm = list(range(self.n))
+        self.signo = 1
+        self.pivotes = []
+        self.d = [1]
+        fila = 0
+        for col in range(self.m):
+            if fila == self.n:
+                break
+            sel = next((r for r in range(fila, self.n) if F[r][col]), None)
+            if sel is None:
+                continue
+            if sel != fila:
+                F[fila], F[sel] = F[sel], F[fila]
+                self.perm[fila], self.perm[sel] = self.perm[sel], self.perm[fila]
+                self.signo = -self.signo
+            fk = F[fila]
+            p, previo = fk[col], self.d[-1]
+            for i in range(fila + 1, self.n):
+                fi = F[i]
+                a = fi[col]
+                # fi[:col + 1] se conserva: fi[col] es el multiplicador de este paso
+                F[i] = fi[:col + 1] + [(p * x - a * y) // previo
+                                       for x, y in zip(fi[col + 1:], fk[col + 1:])]
+            self.pivotes.append(col)
+            self.d.append(p)
+            if al_paso is not None:
+                al_paso(self, sel)
+            fila += 1
+        self.rango = len(self.pivotes)
+        self.clave = None
+        self._inversa = None
+
+    @property
+    def invertible(self) -> bool:
+        return self.n == self.m and self.rango == self.n
+
+    def determinante(self) -> Fraction:
+        if self.n == 0 or self.n != self.m:
+            raise ValueError("La matriz no es cuadrada.")
+        if not self.invertible:
+            return Fraction(0)
+        return Fraction(self.signo * self.d[-1], prod(self.L))
+
+    def resolver(self, B):
+        """
+        X con M·X = B (B de n filas, cualquier cantidad de columnas),
+        como lista de listas de Fraction. ValueError si M es singular.
+        """
+        if not self.invertible:
+            raise ValueError("La matriz no es invertible (det = 0).")
+        n = self.n
+        q = len(B[0]) if B else 0
+        # M·X = B  <=>  F·X = diag(L)·B; cada columna se lleva a enteros (÷ s[j])
+        columnas, s = a_enteros([[self.L[i] * B[i][j] for i in range(n)] for j in range(q)])
+        Y = [[columnas[j][self.perm[i]] for j in range(q)] for i in range(n)]
+
+        # Los mismos pasos de Bareiss sobre los lados derechos
+        for k in range(n):
+            p, previo = self.d[k + 1], self.d[k]
+            yk = Y[k]
+            for i in range(k + 1, n):
+                a = self.F[i][k]
+                Y[i] = [(p * y - a * z) // previo for y, z in zip(Y[i], yk)]
+
+        # Sustitución hacia atrás sin fracciones: X_k = det·x_k es entero (Cramer)
+        det = self.d[-1]
+        X = [None] * n
+        for k in reversed(range(n)):
+            fk = self.F[k]
+            acc = [det * y for y in Y[k]]
+            for j in range(k + 1, n):
+                u = fk[j]
+                if u:
+                    acc = [a - u * x for a, x in zip(acc, X[j])]
+            X[k] = [a // fk[k] for a in acc]
+        return [[Fraction(X[i][j], det * s[j]) for j in range(q)] for i in range(n)]
+
+    def inversa(self):
+        """M⁻¹ como lista de listas de Fraction. ValueError si M es singular."""
+        if self._inversa is None:
+            self._inversa = self.resolver([[int(i == j) for j in range(self.n)] for i in range(self.n)])
+        return [list(fila) for fila in self._inversa]
+
+
+_factorizaciones = OrderedDict()    # clave -> FactorizacionExacta (LRU)
+
+
+def clave_matriz(M):
+    """Clave de caché: el contenido de M (se compara por hash y por igualdad)."""
+    return tuple(tuple(x if isinstance(x, Fraction) else Fraction(x) for x in fila) for fila in M)
+
+
+def factorizar(M) -> FactorizacionExacta:
+    """Factorización de M, reutilizada si ya se hizo para el mismo contenido."""
+    k = clave_matriz(M)
+    f = _factorizaciones.get(k)
+    if f is not None:
+        _factorizaciones.move_to_end(k)
+        metricas.contar("plu: reutilizadas")
+        return f
+    with metricas.medir("plu: factorizar"):
+        f = FactorizacionExacta(M)
+    f.clave = k
+    _factorizaciones[k] = f
+    while len(_factorizaciones) > MAX_FACTORIZACIONES:
+        _factorizaciones.popitem(last=False)
+    return f
+
+
+def olvidar(clave=None):
+    """Saca una factorización de la caché (todas si clave es None)."""
+    if clave is None:
+        _factorizaciones.clear()
+    else:
+        _factorizaciones.pop(clave, None)
+
+
+def determinante(M) -> Fraction:
+    """det(M) exacto en O(n³) operaciones enteras."""
+    _cuadrada(M)
+    return factorizar(M).determinante()
+
+
+def inversa(M):
+    """M⁻¹ como lista de listas de Fraction. ValueError si M es singular."""
+    _cuadrada(M)
+    return factorizar(M).inversa()
+
+
+def escalonada_reducida(M):
+    """(forma escalonada reducida en Fraction, columnas pivote), sin pasos."""
+    E = EliminacionExacta(M)
+    n = len(E.filas)
+    m = len(E.filas[0]) if n else 0
+    pivotes = []
+    fila = 0
+    for col in range(m):
+        if fila == n:
+            break
+        sel = next((r for r in range(fila, n) if not E.es_cero(r, col)), None)
+        if sel is None:
+            continue
+        if sel != fila:
+            E.intercambiar(fila, sel)
+        E.normalizar(fila, col)
+        for r in range(n):
+            if r != fila and not E.es_cero(r, col):
+                E.eliminar(r, fila, col)
+        pivotes.append(col)
+        fila += 1
+    return E.fracciones(), pivotes
+
+
+# =============================================================================
+#  ELIMINACIÓN PASO A PASO
+# =============================================================================
+
+class EliminacionExacta:
+    """
+    Matriz para los procedimientos paso a paso: la fila i vale
+    filas[i] * escalas[i], con filas[i] enteros sin factor común.
+    Los valores en Fraction se arman solo al mostrarlos (y se guardan
+    hasta que la fila cambia).
+    """
+
+    def __init__(self, M):
+        self.filas, L = a_enteros(M)
+        self.escalas = [Fraction(1, m) for m in L]
+        self._fracciones = [None] * len(self.filas)
+        self._textos = [None] * len(self.filas)
+        for i in range(len(self.filas)):
+            self._reducir(i)
+
+    def _reducir(self, i):
+        fila = self.filas[i]
+        g = gcd(*fila)
+        if g > 1:
+            self.filas[i] = [x // g for x in fila]
+            self.escalas[i] *= g
+        self._fracciones[i] = self._textos[i] = None
+
+    # --- Consulta ---
+    def es_cero(self, i, j) -> bool:
+        return self.filas[i][j] == 0
+
+    def valor(self, i, j) -> Fraction:
+        return self.filas[i][j] * self.escalas[i]
+
+    def fila(self, i):
+        """Fila i como lista de Fraction (no modificar: se reutiliza)."""
+        if self._fracciones[i] is None:
+            num, den = self.escalas[i].numerator, self.escalas[i].denominator
+            if den == 1:
+                self._fracciones[i] = [Fraction(x * num) for x in self.filas[i]]
+            else:
+                self._fracciones[i] = [Fraction(x * num, den) for x in self.filas[i]]
+        return self._fracciones[i]
+
+    def fracciones(self):
+        """Copia de la matriz como lista de listas de Fraction."""
+        return [list(self.fila(i)) for i in range(len(self.filas))]
+
+    def textos(self, formato):
+        """
+        [formato(fila de Fraction)] por fila; solo se vuelven a formatear
+        las filas que cambiaron desde la llamada anterior (mismo formato).
+        """
+        for i, t in enumerate(self._textos):
+            if t is None:
+                self._textos[i] = formato(self.fila(i))
+        return list(self._textos)
+
+    # --- Operaciones elementales ---
+    def intercambiar(self, i, j):
+        for lista in (self.filas, self.escalas, self._fracciones, self._textos):
+            lista[i], lista[j] = lista[j], lista[i]
+
+    def normalizar(self, i, j) -> Fraction:
+        """Divide la fila i para que (i, j) valga 1; devuelve el valor anterior."""
+        anterior = self.valor(i, j)
+        self.escalas[i] = Fraction(1, self.filas[i][j])
+        self._fracciones[i] = self._textos[i] = None
+        return anterior
+
+    def eliminar(self, r, p, j) -> Fraction:
+        """
+        F_r → F_r − factor·F_p con el factor que anula (r, j);
+        devuelve el factor.
+        """
+        u, v = self.filas[r], self.filas[p]
+        a, b = u[j], v[j]
+        factor = (a * self.escalas[r]) / (b * self.escalas[p])
+        # escala_r·u − factor·escala_p·v = (escala_r / b)·(b·u − a·v)
+        self.filas[r] = [b * x - a * y for x, y in zip(u, v)]
+        self.escalas[r] /= b
+        self._reducir(r)
+        return factor
@@ -0,0 +1,123 @@
+import numpy as np
+
+# =============================================================================
+#  ÁLGEBRA LINEAL EN PUNTO FLOTANTE (modo rápido de Matrices)
+# =============================================================================
+#
+# Cuando no hace falta el resultado en fracciones, las operaciones de
+# Matrices se hacen con NumPy en float64: un producto 200×200 pasa de un
+# triple bucle de Fraction a unos milisegundos.
+#
+# Las operaciones que dependen de decisiones numéricas (inversa, Leontief,
+# Gauss, Gauss-Jordan) devuelven además el número de condición; si pasa de
+# COND_MAX el resultado en decimales no es confiable y Matrices puede
+# repetirlo con aritmética exacta (algebra_exacta). Este módulo no depende
+# de PyQt6.
+
+COND_MAX = 1e8
+TOLERANCIA = 1e-10    # relativa al mayor |a_ij|: por debajo se toma como 0
+
+
+def mal_condicionada(cond: float) -> bool:
+    return not np.isfinite(cond) or cond > COND_MAX
+
+
+def _cuadrada(A):
+    if A.ndim != 2 or A.shape[0] == 0:
+        raise ValueError("La matriz A está vacía.")
+    if A.shape[0] != A.shape[1]:
+        raise ValueError("La matriz no es cuadrada; no tiene inversa.")
+
+
+def _misma_forma(A, B):
+    if A.shape != B.shape:
+        raise ValueError("A y B deben tener las mismas dimensiones.")
+
+
+# =============================================================================
+#  OPERACIONES DIRECTAS
+# =============================================================================
+
+def suma(A, B):
+    _misma_forma(A, B)
+    return A + B
+
+
+def resta(A, B):
+    _misma_forma(A, B)
+    return A - B
+
+
+def producto(A, B):
+    if A.shape[1] != B.shape[0]:
+        raise ValueError(" Número de columnas de A debe ser igual a número de filas de B.")
+    return A @ B
+
+
+def traspuesta(A):
+    return A.T.copy()
+
+
+# =============================================================================
+#  OPERACIONES CON CONDICIÓN
+# =============================================================================
+
+def inversa(A):
+    """
+    (A⁻¹, cond₁) con cond₁ = ‖A‖₁·‖A⁻¹‖₁.
+    ValueError si la factorización encuentra un pivote exactamente nulo.
+    """
+    _cuadrada(A)
+    try:
+        inv = np.linalg.inv(A)
+    except np.linalg.LinAlgError:
+        raise ValueError("La matriz no es invertible (det = 0).")
+    cond = np.linalg.norm(A, 1) * np.linalg.norm(inv, 1)
+    return inv, float(cond)
+
+
+def leontief(A, d):
+    """(x, (I − A)⁻¹, cond) para x = (I − A)⁻¹·d."""
+    n = A.shape[0]
+    if d.shape[0] != n:
+        raise ValueError("El vector de demanda (Matriz B) debe tener el mismo número de filas que A.")
+    if d.shape[1] != 1:
+        raise ValueError("La Matriz B debe ser un vector columna (n x 1) para la demanda final.")
+    try:
+        inv, cond = inversa(np.eye(n) - A)
+    except ValueError:
+        raise ValueError("La matriz (I - A) es singular (determinante 0). El sistema no tiene solución única.")
+    return inv @ d, inv, cond
+
+
+def escalonada(M, reducida=False):
+    """
+    Gauss (o Gauss-Jordan con reducida=True) con pivoteo parcial.
+    Devuelve (R, pivotes, cond) con cond el número de condición de la
+    parte de coeficientes (todas las columnas menos la última).
+    """
+    M = np.asarray(M, dtype=float)
+    R = M.copy()
+    n, m = R.shape
+    tol = TOLERANCIA * max(1.0, float(np.abs(R).max(initial=0.0)))
+    pivotes = []
+    fila = 0
+    for col in range(m):
+        if fila == n:
+            break
+        k = fila + int(np.argmax(np.abs(R[fila:, col])))
+        if abs(R[k, col]) <= tol:
+            R[fila:, col] = 0.0
+            continue
+        if k != fila:
+            R[[fila, k]] = R[[k, fila]]
+        R[fila] /= R[fila, col]
+        R[fila + 1:] -= np.outer(R[fila + 1:, col], R[fila])
+        if reducida:
+            R[:fila] -= np.outer(R[:fila, col], R[fila])
+        pivotes.append(col)
+        fila += 1
+    R[np.abs(R) <= tol] = 0.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cond = float(np.linalg.cond(M[:, :-1])) if m > 1 else 1.0
+    return R, pivotes, cond
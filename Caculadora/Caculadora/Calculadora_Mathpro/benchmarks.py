@@ -0,0 +1,390 @@
+"""
+Benchmarks de los núcleos de cálculo (sin interfaz).
+
+Mide cada kernel a varios tamaños y lo compara con la línea base guardada
+en benchmarks_base.json; termina con código 1 si alguno empeora más de la
+tolerancia.
+
+    python benchmarks.py                   # todo, comparado con la base
+    python benchmarks.py --rapido -k gauss # solo tamaños chicos / un grupo
+    python benchmarks.py --guardar         # actualizar la base con esta máquina
+
+La base es de la máquina donde se generó: en otra, los tiempos absolutos
+no son comparables (se avisa) y conviene regenerarla antes de comparar.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import timeit
+from fractions import Fraction
+
+DIR_MODULO = os.path.dirname(os.path.abspath(__file__))
+BASE_DEFECTO = os.path.join(DIR_MODULO, "benchmarks_base.json")
+# El doble de lento que la base = regresión. En una máquina compartida el
+# mismo código varía de una corrida a otra hasta ~1.8× en los kernels de
+# microsegundos; con menos, la comparación daba falsas regresiones.
+TOLERANCIA_DEFECTO = 1.0
+REPETICIONES = 5              # tandas por kernel; se usa la mediana
+LENTO = 1.0                   # s por llamada: con una sola muestra basta
+
+CASOS = []   # (grupo, tamaños, tamaños en modo rápido, preparar(n) -> función sin argumentos)
+
+
+def caso(grupo, tamanos, rapidos=None):
+    """Registra preparar(n): arma los datos fuera de la medición y devuelve lo que se mide."""
+    def registrar(preparar):
+        CASOS.append((grupo, tuple(tamanos), tuple(rapidos or tamanos), preparar))
+        return preparar
+    return registrar
+
+
+def _sin_ventana(cls):
+    """Instancia sin __init__: los kernels solo usan métodos auxiliares puros, no widgets."""
+    return cls.__new__(cls)
+
+
+def _sin_cache(fn):
+    """Vacía la caché de factorizaciones antes de cada llamada: se mide el cálculo."""
+    from algebra_exacta import olvidar
+
+    def medir():
+        olvidar()
+        return fn()
+    return medir
+
+
+def _matriz(n, columnas=None, semilla=0):
+    """Enteros pequeños con diagonal dominante (invertible), como Fraction."""
+    r = random.Random(semilla * 1000 + n)
+    columnas = columnas or n
+    M = [[Fraction(r.randint(-9, 9)) for _ in range(columnas)] for _ in range(n)]
+    for i in range(n):
+        M[i][i] += 10 * n
+    return M
+
+
+# =============================================================================
+#  EXPRESIONES Y GRÁFICAS
+# =============================================================================
+
+EXPRESIONES = {
+    "polinomio": "x^3-0.5",
+    "trig_exp": "sin(x)*e^(-x/5)",
+    "raiz_log": "sqrt(x^2+1)/ln(x+2)",
+    "polo": "1/(x-0.7)",
+}
+
+
+@caso("evaluar", EXPRESIONES)
+def _evaluar(nombre):
+    from motor_expresiones import evaluar
+    expr = EXPRESIONES[nombre]
+    xs = [0.1 + k * 0.01 for k in range(1000)]
+
+    def medir():
+        for x in xs:
+            evaluar(expr, x)
+    return medir
+
+
+@caso("evaluar_vector_2000", EXPRESIONES)
+def _evaluar_vector(nombre):
+    import numpy as np
+    from motor_expresiones import evaluar_vector
+    expr = EXPRESIONES[nombre]
+    xs = np.linspace(-10, 10, 2000)
+    return lambda: evaluar_vector(expr, xs)
+
+
+@caso("muestreo_adaptativo", EXPRESIONES)
+def _muestreo(nombre):
+    from muestreo_adaptativo import muestrear_adaptativo
+    expr = EXPRESIONES[nombre]
+    return lambda: muestrear_adaptativo(expr, (-10, 10), (-5, 5))
+
+
+# =============================================================================
+#  RAÍCES
+# =============================================================================
+
+RAICES = {
+    "biseccion": ("biseccion", ("x^3-0.5", 0.0, 1.0, 1e-10, 1000)),
+    "falsa_posicion": ("falsa_posicion", ("x^3-0.5", 0.0, 1.0, 1e-10, 1000)),
+    "newton_raphson": ("newton_raphson", ("x^3-0.5", 1.0, 1e-10, 1000)),
+    "secante": ("secante", ("x^3-0.5", 0.0, 1.0, 1e-10, 1000)),
+    # Sin convergencia: recorre las 10⁴ iteraciones (costo por iteración)
+    "biseccion_10k": ("biseccion", ("1/(x-0.7)", 0.0, 1.0, 0.0, 10000)),
+}
+
+
+@caso("raices", RAICES)
+def _raices(nombre):
+    from solucionadores import METODOS
+    metodo, args = RAICES[nombre]
+    return lambda: METODOS[metodo](*args)
+
+
+# =============================================================================
+#  MATRICES Y DETERMINANTES
+# =============================================================================
+
+def _ventana_matrices():
+    from Matrices import VentanaMatrices
+    return _sin_ventana(VentanaMatrices)
+
+
+@caso("gauss_detallado", (3, 5, 10, 25, 50), (3, 10, 25))
+def _gauss(n):
+    v = _ventana_matrices()
+    M = _matriz(n, n + 1)
+    return lambda: v._gauss_detallado(M)
+
+
+@caso("back_gauss", (3, 5, 10, 25, 50), (3, 10, 25))
+def _back_gauss(n):
+    v = _ventana_matrices()
+    _, A, pivotes = v._gauss_detallado(_matriz(n, n + 1))
+    return lambda: v._back_gauss(A, pivotes)
+
+
+@caso("inversa", (3, 5, 10, 25, 50), (3, 10, 25))
+def _inversa(n):
+    v = _ventana_matrices()
+    M = _matriz(n)
+    return _sin_cache(lambda: v._inversa(M))
+
+
+@caso("producto_exacto", (10, 50, 100), (10, 50))
+def _producto(n):
+    from algebra_exacta import producto
+    A = _matriz(n)
+    B = [[x / 7 for x in fila] for fila in _matriz(n, semilla=1)]
+    return lambda: producto(A, B)
+
+
+@caso("modelo_leontief", (3, 10, 25), (3, 10))
+def _leontief(n):
+    v = _ventana_matrices()
+    r = random.Random(n)
+    A = [[Fraction(r.randint(0, 9), 100 * n) for _ in range(n)] for _ in range(n)]
+    d = [[Fraction(r.randint(1, 100))] for _ in range(n)]
+    return _sin_cache(lambda: v._modelo_leontief(A, d))
+
+
+@caso("ecuaciones_a_matriz", (10, 50, 100), (10, 50))
+def _ecuaciones(n):
+    v = _ventana_matrices()
+    r = random.Random(n)
+    lineas = []
+    for _ in range(n):
+        terminos = " ".join(f"{'+' if c >= 0 else '-'} {abs(c)}x{j + 1}"
+                            for j, c in enumerate(r.randint(-9, 9) for _ in range(n)))
+        lineas.append(f"{terminos} = {r.randint(-50, 50)}")
+    texto = "\n".join(lineas)
+    return lambda: v._ecuaciones_a_matriz(texto)
+
+
+def _ventana_determinantes():
+    from Determinantes import VentanaDeterminantes
+    return _sin_ventana(VentanaDeterminantes)
+
+
+@caso("determinante_bareiss_latex", (3, 8, 50, 100), (3, 8))
+def _bareiss(n):
+    v = _ventana_determinantes()
+    M = _matriz(n)
+    return _sin_cache(lambda: v.determinante_bareiss_latex(M))
+
+
+@caso("determinante_cofactores_latex", (3, 5, 7, 8, 9, 12), (3, 5, 7))
+def _cofactores(n):
+    v = _ventana_determinantes()
+    M = _matriz(n)
+    return lambda: v.determinante_cofactores_latex(M)
+
+
+@caso("cramer_latex", (3, 5, 7), (3, 5))
+def _cramer(n):
+    v = _ventana_determinantes()
+    A = _matriz(n)
+    B = [[Fraction(k + 1)] for k in range(n)]
+    return _sin_cache(lambda: v.cramer_latex(A, B))
+
+
+@caso("rapido_producto", (200, 500), (200,))
+def _rapido_producto(n):
+    import numpy as np
+    import algebra_rapida
+    A = np.array(_matriz(n), dtype=float)
+    B = np.array(_matriz(n, semilla=1), dtype=float)
+    return lambda: algebra_rapida.producto(A, B)
+
+
+@caso("rapido_inversa", (200, 500), (200,))
+def _rapido_inversa(n):
+    import numpy as np
+    import algebra_rapida
+    A = np.array(_matriz(n), dtype=float)
+    return lambda: algebra_rapida.inversa(A)
+
+
+@caso("rapido_gauss_jordan", (50, 200), (50,))
+def _rapido_gauss_jordan(n):
+    import numpy as np
+    import algebra_rapida
+    M = np.array(_matriz(n, n + 1), dtype=float)
+    return lambda: algebra_rapida.escalonada(M, reducida=True)
+
+
+# =============================================================================
+#  LÓGICA Y DERIVADAS
+# =============================================================================
+
+@caso("tabla_verdad", (4, 8, 12, 16, 20), (4, 8, 12))
+def _tabla_verdad(n):
+    from Logica_simbolica_inferencial import MotorLogico
+    variables = [f"p{i}" for i in range(1, n + 1)]
+    premisas = ["p1 → p2", " ∧ ".join(variables[1:]) + " → p1"]
+    conclusion = "p1 ↔ p2"
+    py_prems = [MotorLogico.traducir_a_python(p) for p in premisas]
+    py_conc = MotorLogico.traducir_a_python(conclusion)
+    # El núcleo de VentanaLogica.resolver, sin armar el HTML
+    return lambda: MotorLogico.tabla_verdad(variables, py_prems, py_conc)
+
+
+@caso("derivada_pasos", (2, 5, 10), (2, 5))
+def _derivada(profundidad):
+    import sympy as sp
+    from derivadas import DerivadaPasoAPaso
+    x = sp.Symbol("x")
+    f = x
+    for k in range(profundidad):
+        f = sp.sin(f + x ** 2) * sp.exp(x / (k + 1)) + sp.log(x + k + 1)
+    return lambda: DerivadaPasoAPaso.generar_pasos(f, x)
+
+
+# =============================================================================
+#  EJECUCIÓN
+# =============================================================================
+
+def medir(fn):
+    """Segundos por llamada: la mediana de REPETICIONES tandas (una si es lento)."""
+    t = timeit.Timer(fn)
+    numero, total = t.autorange()
+    if total / numero >= LENTO:
+        return total / numero
+    return statistics.median(t.repeat(repeat=REPETICIONES, number=numero)) / numero
+
+
+def ejecutar(filtros=(), rapido=False):
+    """{nombre: s por llamada}; los grupos que no se pueden importar se omiten."""
+    resultados, omitidos = {}, {}
+    for grupo, tamanos, rapidos, preparar in CASOS:
+        if filtros and not any(f in grupo for f in filtros):
+            continue
+        for n in (rapidos if rapido else tamanos):
+            nombre = f"{grupo}[{n}]"
+            try:
+                fn = preparar(n)
+            except ImportError as e:
+                omitidos[grupo] = str(e)
+                break
+            resultados[nombre] = medir(fn)
+            print(f"{nombre:45s} {resultados[nombre] * 1000:12.3f} ms", file=sys.stderr)
+    return resultados, omitidos
+
+
+def remedir(nombres):
+    """Vuelve a medir los kernels indicados (para confirmar una regresión)."""
+    resultados = {}
+    for grupo, tamanos, rapidos, preparar in CASOS:
+        for n in dict.fromkeys(tamanos + rapidos):
+            nombre = f"{grupo}[{n}]"
+            if nombre in nombres:
+                resultados[nombre] = medir(preparar(n))
+    return resultados
+
+
+def maquina():
+    return {"python": platform.python_version(), "sistema": platform.platform(),
+            "procesador": platform.processor() or platform.machine()}
+
+
+def leer_base(ruta):
+    try:
+        with open(ruta, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"maquina": None, "resultados": {}}
+
+
+def comparar(resultados, base, tolerancia):
+    """Imprime la tabla contra la base y devuelve los nombres que empeoraron."""
+    regresiones = []
+    print(f"{'kernel':45s} {'base ms':>12s} {'ahora ms':>12s} {'razón':>7s}")
+    for nombre, s in resultados.items():
+        b = base["resultados"].get(nombre)
+        if b is None:
+            print(f"{nombre:45s} {'—':>12s} {s * 1000:12.3f} {'nuevo':>7s}")
+            continue
+        razon = s / b
+        marca = ""
+        if razon > 1 + tolerancia:
+            marca = "  REGRESIÓN"
+            regresiones.append(nombre)
+        elif razon < 1 / (1 + tolerancia):
+            marca = "  mejora"
+        print(f"{nombre:45s} {b * 1000:12.3f} {s * 1000:12.3f} {razon:7.2f}{marca}")
+    return regresiones
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Benchmarks de los kernels de MathPro.")
+    p.add_argument("-k", dest="filtros", action="append", default=[],
+                   help="solo grupos que contengan este texto (se puede repetir)")
+    p.add_argument("--rapido", action="store_true", help="solo los tamaños chicos")
+    p.add_argument("--base", default=BASE_DEFECTO, help="archivo de línea base (JSON)")
+    p.add_argument("--guardar", action="store_true",
+                   help="escribir estos resultados en la base en vez de comparar")
+    p.add_argument("--tolerancia", type=float, default=TOLERANCIA_DEFECTO,
+                   help="fracción más lenta que se acepta (1.0 = el doble)")
+    args = p.parse_args(argv)
+
+    inicio = time.perf_counter()
+    resultados, omitidos = ejecutar(args.filtros, args.rapido)
+    for grupo, motivo in omitidos.items():
+        print(f"omitido {grupo}: {motivo}", file=sys.stderr)
+
+    base = leer_base(args.base)
+    if args.guardar:
+        base["maquina"] = maquina()
+        base["resultados"].update(resultados)
+        with open(args.base, "w", encoding="utf-8") as f:
+            json.dump(base, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        print(f"{len(resultados)} resultados guardados en {args.base}")
+        return 0
+
+    if base["maquina"] and base["maquina"] != maquina():
+        print("aviso: la base se generó en otra máquina/Python; los tiempos no son comparables",
+              file=sys.stderr)
+    # Un kernel lento solo cuenta si vuelve a salir lento al medirlo otra vez:
+    # se queda el mejor de los dos tiempos
+    sospechosos = [nombre for nombre, s in resultados.items()
+                   if nombre in base["resultados"]
+                   and s > base["resultados"][nombre] * (1 + args.tolerancia)]
+    for nombre, s in remedir(sospechosos).items():
+        resultados[nombre] = min(resultados[nombre], s)
+    regresiones = comparar(resultados, base, args.tolerancia)
+    print(f"{len(resultados)} kernels en {time.perf_counter() - inicio:.0f} s, "
+          f"{len(regresiones)} regresiones (tolerancia {args.tolerancia:.0%})")
+    return 1 if regresiones else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+import hashlib
+import os
+import re
+import stat
+from collections import OrderedDict
+from html import unescape
+
+# =============================================================================
+#  CACHÉ DE FÓRMULAS YA COMPUESTAS (LaTeX -> SVG)
+# =============================================================================
+#
+# Las mismas fórmulas se componen una y otra vez: el encabezado de cada
+# reporte de raíces, las matrices de Determinantes, los pasos de Gauss en
+# Matrices... MathJax solo se ejecuta en la página, así que la primera vez
+# la página devuelve el SVG de cada fórmula (render_mathjax) y aquí se guarda
+# por su texto LaTeX. Antes de enviar HTML a una vista, sustituir() reemplaza
+# las fórmulas conocidas por su SVG y MathJax ya no tiene que tocarlas.
+#
+# En memoria es un LRU acotado por tamaño; opcionalmente también se guarda
+# en disco, acotada igual, para que sobreviva entre sesiones. La carpeta es
+# del usuario (~/.cache/mathpro/latex, o %LOCALAPPDATA%\mathpro\latex en Windows) y se
+# crea con permisos 0o700: el SVG leído de ahí se inserta tal cual en la
+# página, así que no puede estar en un sitio que otro usuario pueda escribir.
+# Este módulo no depende de PyQt6.
+
+# Se cambia cuando cambia la salida de MathJax (versión o configuración):
+# las entradas anteriores del disco dejan de coincidir.
+VERSION_RENDER = "mathjax3-svg-sin-fontcache"
+
+
+def _dir_cache_usuario() -> str:
+    """Carpeta de caché del usuario, como QStandardPaths.CacheLocation."""
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "mathpro", "latex")
+
+
+DIR_CACHE = os.environ.get("MATHPRO_CACHE_LATEX", _dir_cache_usuario())
+
+MAX_BYTES_MEMORIA = 32 * 1024 * 1024
+MAX_BYTES_DISCO = 128 * 1024 * 1024
+
+# Delimitadores por defecto de MathJax 3: $$..$$ y \[..\] en bloque, \(..\) en línea.
+# Una fórmula no cruza etiquetas HTML (MathJax tampoco la buscaría así).
+_FORMULA = re.compile(r"\$\$([^<]+?)\$\$|\\\[([^<]+?)\\\]|\\\(([^<]+?)\\\)")
+
+
+def clave(latex: str, bloque: bool) -> str:
+    """Dirección de la fórmula: sha256 del texto LaTeX, el modo y VERSION_RENDER."""
+    texto = f"{VERSION_RENDER}\0{'B' if bloque else 'L'}\0{latex.strip()}"
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+
+class CacheLatex:
+    """
+    LaTeX -> SVG con expulsión LRU por bytes.
+    directorio=None la deja solo en memoria.
+    """
+
+    def __init__(self, max_bytes=MAX_BYTES_MEMORIA, directorio=None,
+                 max_bytes_disco=MAX_BYTES_DISCO):
+        self.max_bytes = max_bytes
+        self.directorio = directorio
+        self.max_bytes_disco = max_bytes_disco
+        self._svgs = OrderedDict()
+        self._bytes = 0
+        self._bytes_disco = None    # se mide la primera vez que se usa el disco
+        self._disco_listo = False
+        self.aciertos = 0
+        self.aciertos_disco = 0
+        self.fallos = 0
+        self.expulsiones = 0
+        self.expulsiones_disco = 0
+
+    # --- Consulta ---
+    def obtener(self, latex: str, bloque: bool = True):
+        """SVG guardado para la fórmula, o None (cuenta como fallo)."""
+        k = clave(latex, bloque)
+        svg = self._svgs.get(k)
+        if svg is not None:
+            self._svgs.move_to_end(k)
+            self.aciertos += 1
+            return svg
+        svg = self._leer_disco(k)
+        if svg is not None:
+            self.aciertos_disco += 1
+            self._poner(k, svg)
+            return svg
+        self.fallos += 1
+        return None
+
+    def sustituir(self, html: str) -> str:
+        """html con las fórmulas ya conocidas reemplazadas por su SVG."""
+        def reemplazo(m):
+            latex = m.group(1) or m.group(2)
+            bloque = latex is not None
+            if not bloque:
+                latex = m.group(3)
+            svg = self.obtener(unescape(latex), bloque)
+            return m.group(0) if svg is None else svg
+        return _FORMULA.sub(reemplazo, html)
+
+    # --- Alta ---
+    def guardar(self, latex: str, bloque: bool, svg: str):
+        k = clave(latex, bloque)
+        if k in self._svgs:
+            self._svgs.move_to_end(k)
+            return
+        self._poner(k, svg)
+        self._escribir_disco(k, svg)
+
+    def _poner(self, k, svg):
+        if len(svg) > self.max_bytes:
+            return
+        self._svgs[k] = svg
+        self._bytes += len(svg)
+        while self._bytes > self.max_bytes:
+            _, viejo = self._svgs.popitem(last=False)
+            self._bytes -= len(viejo)
+            self.expulsiones += 1
+
+    def limpiar(self):
+        """Vacía la memoria (el disco se conserva) y reinicia las estadísticas."""
+        self._svgs.clear()
+        self._bytes = 0
+        self.aciertos = self.aciertos_disco = self.fallos = 0
+        self.expulsiones = self.expulsiones_disco = 0
+
+    # --- Disco ---
+    def _ruta(self, k):
+        return os.path.join(self.directorio, k[:2], k + ".svg")
+
+    def _preparar_disco(self) -> bool:
+        """
+        Crea el directorio (0o700) la primera vez. Si ya existe y es de otro
+        usuario, la caché se queda en memoria; si es propio, se cierra a 0o700.
+        """
+        if self._disco_listo or not self.directorio:
+            return bool(self.directorio)
+        try:
+            os.makedirs(self.directorio, mode=0o700, exist_ok=True)
+            st = os.stat(self.directorio)
+            if os.name != "nt":
+                if st.st_uid != os.getuid():
+                    raise PermissionError(self.directorio)
+                if stat.S_IMODE(st.st_mode) & 0o077:
+                    os.chmod(self.directorio, 0o700)
+        except OSError:
+            self.directorio = None
+            return False
+        self._disco_listo = True
+        return True
+
+    def _leer_disco(self, k):
+        if not self._preparar_disco():
+            return None
+        ruta = self._ruta(k)
+        try:
+            with open(ruta, encoding="utf-8") as f:
+                svg = f.read()
+            os.utime(ruta)   # la fecha de modificación hace de "último uso"
+            return svg
+        except OSError:
+            return None
+
+    def _escribir_disco(self, k, svg):
+        if not self._preparar_disco():
+            return
+        ruta = self._ruta(k)
+        try:
+            os.makedirs(os.path.dirname(ruta), mode=0o700, exist_ok=True)
+            temporal = f"{ruta}.{os.getpid()}.tmp"
+            with open(temporal, "w", encoding="utf-8") as f:
+                f.write(svg)
+            os.replace(temporal, ruta)
+        except OSError:
+            return   # sin disco la caché sigue funcionando en memoria
+        if self._bytes_disco is None:
+            self._bytes_disco = sum(t for _, _, t in self._archivos_disco())
+        else:
+            self._bytes_disco += len(svg.encode("utf-8"))
+        if self._bytes_disco > self.max_bytes_disco:
+            self._podar_disco()
+
+    def _archivos_disco(self):
+        """(fecha, ruta, tamaño) de cada SVG guardado en el directorio."""
+        archivos = []
+        for raiz, _, nombres in os.walk(self.directorio):
+            for nombre in nombres:
+                if nombre.endswith(".svg"):
+                    ruta = os.path.join(raiz, nombre)
+                    try:
+                        st = os.stat(ruta)
+                    except OSError:
+                        continue
+                    archivos.append((st.st_mtime, ruta, st.st_size))
+        return archivos
+
+    def _podar_disco(self):
+        """Borra los menos usados hasta quedar en el 80 % del límite."""
+        archivos = sorted(self._archivos_disco())
+        total = sum(t for _, _, t in archivos)
+        objetivo = self.max_bytes_disco * 0.8
+        for _, ruta, tam in archivos:
+            if total <= objetivo:
+                break
+            try:
+                os.remove(ruta)
+            except OSError:
+                continue
+            total -= tam
+            self.expulsiones_disco += 1
+        self._bytes_disco = total
+
+    # --- Estadísticas ---
+    @property
+    def tasa_aciertos(self) -> float:
+        consultas = self.aciertos + self.aciertos_disco + self.fallos
+        return (self.aciertos + self.aciertos_disco) / consultas if consultas else 0.0
+
+    def estadisticas(self) -> dict:
+        return {
+            "entradas": len(self._svgs),
+            "bytes": self._bytes,
+            "aciertos": self.aciertos,
+            "aciertos_disco": self.aciertos_disco,
+            "fallos": self.fallos,
+            "expulsiones": self.expulsiones,
+            "expulsiones_disco": self.expulsiones_disco,
+            "tasa_aciertos": self.tasa_aciertos,
+        }
+
+
+# Caché compartida por todas las vistas (MATHPRO_CACHE_LATEX="" la deja solo en memoria)
+CACHE = CacheLatex(directorio=DIR_CACHE or None)
@@ -2,6 +2,14 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+from matplotlib.ticker import AutoMinorLocator, MaxNLocator, NullLocator
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QGuiApplication
+from PyQt6.QtWidgets import QMessageBox
+
+from escaner_raices import buscar_ceros, es_nula
+from motor_expresiones import compilar
+from muestreo_adaptativo import muestrear_adaptativo, nivel_con_histeresis, CACHE_MUESTRAS
 
 class GeoGebraCanvas(FigureCanvasQTAgg):
     def __init__(self, parent=None):
@@ -19,8 +27,11 @@ class GeoGebraCanvas(FigureCanvasQTAgg):
         self.ax.clear()
         self._config()
 
-        xs = np.linspace(a, b, 600)
-        ys = np.array([f(x) for x in xs], dtype=float)
+        # f puede ser el texto del usuario: se comparte la compilación cacheada
+        if isinstance(f, str):
+            f = compilar(f)
+
+        xs, ys = muestrear_adaptativo(f, (a, b))
 
         self.ax.plot(xs, ys, color="#2563eb", linewidth=2)
 
@@ -33,3 +44,253 @@ class GeoGebraCanvas(FigureCanvasQTAgg):
 
         self.draw_idle()
 
+
+# Máximo de intervalos entre marcas principales por eje: a la vista inicial
+# (±9 × ±6) el paso es 1, y al alejar el zoom crece (2, 5, 10, ...) en vez de
+# generar miles de marcas y líneas de grilla. Mientras se arrastra, menos.
+MARCAS_MAX = 20
+MARCAS_ARRASTRE = 10
+
+
+def cuadricula_acotada(ax):
+    """Marcas principales de paso 1-2-5 (a lo sumo MARCAS_MAX) y una menor entre cada par."""
+    for eje in (ax.xaxis, ax.yaxis):
+        eje.set_major_locator(MaxNLocator(nbins=MARCAS_MAX, steps=[1, 2, 5, 10]))
+        eje.set_minor_locator(AutoMinorLocator(2))
+
+
+class ArrastreLigero:
+    """
+    Mientras se arrastra con pan/zoom de la barra de herramientas, la grilla
+    se dibuja sin marcas menores y con a lo sumo MARCAS_ARRASTRE principales:
+    las etiquetas y líneas de grilla son la mayor parte de cada cuadro. Al
+    soltar se restaura cuadricula_acotada y se redibuja una vez.
+    """
+
+    def __init__(self, ax, canvas):
+        self.ax = ax
+        self.canvas = canvas
+        self.activo = False
+        canvas.mpl_connect("button_press_event", self._presionar)
+        canvas.mpl_connect("button_release_event", self._soltar)
+
+    def _presionar(self, evento):
+        toolbar = getattr(self.canvas, "toolbar", None)
+        if toolbar is None or not str(toolbar.mode) or evento.inaxes is not self.ax:
+            return
+        self.activo = True
+        for eje in (self.ax.xaxis, self.ax.yaxis):
+            eje.set_major_locator(MaxNLocator(nbins=MARCAS_ARRASTRE, steps=[1, 2, 5, 10]))
+            eje.set_minor_locator(NullLocator())
+
+    def _soltar(self, _evento):
+        if not self.activo:
+            return
+        self.activo = False
+        cuadricula_acotada(self.ax)
+        self.canvas.draw_idle()
+
+
+def puntos_criticos(xs, ys):
+    """Máximos y mínimos aproximados: donde la derivada numérica cambia de signo."""
+    if xs.size < 3:
+        return np.empty((0, 2))
+    with np.errstate(all="ignore"):
+        dy = np.gradient(ys, xs)
+        critical = np.where(np.diff(np.sign(dy)) != 0)[0]
+    pts = np.column_stack((xs[critical], ys[critical]))
+    return pts[np.isfinite(pts).all(axis=1)]
+
+
+class CurvaIncremental:
+    """
+    Curva principal (Line2D) y puntos críticos de una gráfica, actualizados en
+    sitio con set_data / set_offsets. Las muestras salen de CACHE_MUESTRAS, así
+    que al desplazar o hacer zoom solo se evalúan las tejas nuevas.
+    Los cambios de vista se agrupan en un refresco cada INTERVALO_MS.
+    """
+    INTERVALO_MS = 16
+
+    def __init__(self, ax, canvas):
+        self.ax = ax
+        self.canvas = canvas
+        self.expr = ""
+        self.nivel = None
+        self.linea = None
+        self.puntos = None
+
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.INTERVALO_MS)
+        self._timer.timeout.connect(self._refrescar_vista)
+
+        ax.callbacks.connect("xlim_changed", self._vista_cambio)
+        ax.callbacks.connect("ylim_changed", self._vista_cambio)
+
+    def es_propio(self, artista) -> bool:
+        return artista is self.linea or artista is self.puntos
+
+    def _asegurar_artistas(self):
+        # ax.clear() se lleva los artistas: se recrean una sola vez
+        if self.linea is None or self.linea.axes is None:
+            (self.linea,) = self.ax.plot(
+                [], [], color="#007a78", linewidth=1.1, solid_capstyle="round", zorder=4
+            )
+        if self.puntos is None or self.puntos.axes is None:
+            self.puntos = self.ax.scatter(
+                [], [], color="#555555", s=25, zorder=4, edgecolors="white", linewidths=1.1
+            )
+
+    def actualizar(self, expr: str):
+        """Cambia la expresión y recalcula los datos (el dibujo lo hace quien llama)."""
+        self.expr = expr
+        self._asegurar_artistas()
+        self._calcular()
+
+    def _calcular(self):
+        if not self.expr:
+            self.linea.set_data([], [])
+            self.puntos.set_offsets(np.empty((0, 2)))
+            return
+        xlim = self.ax.get_xlim()
+        ylim = self.ax.get_ylim()
+        self.nivel = nivel_con_histeresis(self.nivel, abs(xlim[1] - xlim[0]))
+        xs, ys, self.nivel = CACHE_MUESTRAS.muestras(self.expr, xlim, ylim, self.nivel)
+        self.linea.set_data(xs, ys)
+        self.puntos.set_offsets(puntos_criticos(xs, ys))
+
+    def _vista_cambio(self, _ax):
+        # Throttle: como mucho un refresco por intervalo mientras se arrastra
+        if self.expr and not self._timer.isActive():
+            self._timer.start()
+
+    def _refrescar_vista(self):
+        self._asegurar_artistas()
+        self._calcular()
+        self.canvas.draw_idle()
+
+
+class CapaCursor:
+    """
+    Línea vertical de selección (hover) dibujada con blitting.
+    El fondo estático (grid, curva, marcas) se copia una vez tras cada dibujo
+    completo; al mover el mouse solo se restaura ese fondo y se pinta la línea.
+    Los movimientos se agrupan a la frecuencia de refresco de la pantalla;
+    color puede ser una función color(x), que solo se evalúa para el
+    movimiento que llega a pintarse.
+    """
+
+    def __init__(self, ax, canvas):
+        self.ax = ax
+        self.canvas = canvas
+        self.linea = ax.axvline(0, linestyle="--", linewidth=2, visible=False, animated=True)
+        self._fondo = None
+        self._pendiente = None
+
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._aplicar)
+
+        canvas.mpl_connect("draw_event", self._guardar_fondo)
+
+    def es_propio(self, artista) -> bool:
+        return artista is self.linea
+
+    def _intervalo_ms(self) -> int:
+        pantalla = self.canvas.screen() or QGuiApplication.primaryScreen()
+        hz = pantalla.refreshRate() if pantalla else 0
+        return max(1, int(1000 / hz)) if hz > 0 else 16
+
+    def _guardar_fondo(self, _evento):
+        # Se llama al terminar cada draw(): el fondo queda sin la línea (animated)
+        self._fondo = self.canvas.copy_from_bbox(self.ax.bbox)
+        if self.linea.get_visible():
+            self.ax.draw_artist(self.linea)
+
+    def mover(self, x, color):
+        self._pendiente = (x, color)
+        if not self._timer.isActive():
+            self._timer.start(self._intervalo_ms())
+
+    def _aplicar(self):
+        if self._pendiente is None:
+            return
+        x, color = self._pendiente
+        self._pendiente = None
+        if callable(color):
+            color = color(x)
+        self.linea.set_xdata([x, x])
+        self.linea.set_color(color)
+        self.linea.set_visible(True)
+        self._blit()
+
+    def ocultar(self):
+        self._pendiente = None
+        self._timer.stop()
+        if self.linea.get_visible():
+            self.linea.set_visible(False)
+            self._blit()
+
+    def _blit(self):
+        if self._fondo is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._fondo)
+        if self.linea.get_visible():
+            self.ax.draw_artist(self.linea)
+        self.canvas.blit(self.ax.bbox)
+
+
+# Raíces y tramos nulos marcados por "Todas las raíces"
+COLOR_RAICES = "#6a1b9a"
+RAICES_LISTADAS = 30
+
+
+def buscar_todas_en_vista(ventana):
+    """
+    Botón "Todas las raíces" de los métodos de raíces: escanea el rango
+    visible, marca raíces y tramos donde f ≡ 0 y los lista en un diálogo.
+    ventana tiene inp_f, ax, canvas, graficar(), lbl_raiz y lbl_iter.
+    """
+    txt = ventana.inp_f.text()
+    if not txt:
+        return
+    xlim = ventana.ax.get_xlim()
+    raices, intervalos = buscar_ceros(txt, xlim)
+
+    ventana.graficar()
+    ax = ventana.ax
+    if raices.size:
+        ax.scatter(raices, np.zeros_like(raices), color=COLOR_RAICES, s=45, zorder=7,
+                   edgecolors="white", linewidths=1.2)
+    if len(intervalos):
+        ax.hlines(np.zeros(len(intervalos)), intervalos[:, 0], intervalos[:, 1],
+                  color=COLOR_RAICES, linewidth=5, alpha=0.6, zorder=6)
+    ventana.canvas.draw()
+    ventana.lbl_iter.setText("--")
+
+    titulo = "Raíces en la vista"
+    if es_nula(intervalos, xlim):
+        ventana.lbl_raiz.setText("f ≡ 0")
+        QMessageBox.information(ventana, titulo,
+                                "f(x) = 0 en todo el rango visible: todo x es raíz "
+                                "(caso degenerado).")
+        return
+
+    total = raices.size + len(intervalos)
+    partes = []
+    if raices.size:
+        partes.append(f"{raices[0]:.6f}" if total == 1 else f"{raices.size} raíces")
+    if len(intervalos):
+        partes.append("1 tramo" if len(intervalos) == 1 else f"{len(intervalos)} tramos")
+    ventana.lbl_raiz.setText(", ".join(partes) or "0 raíces")
+    if total == 0:
+        QMessageBox.information(ventana, titulo, "No se encontraron raíces en el rango visible.")
+        return
+    lineas = [f"x{i + 1} = {r:.8f}" for i, r in enumerate(raices[:RAICES_LISTADAS])]
+    if raices.size > RAICES_LISTADAS:
+        lineas.append(f"... y {raices.size - RAICES_LISTADAS} más")
+    lineas += [f"f(x) = 0 en [{a:.6g}, {b:.6g}]" for a, b in intervalos[:RAICES_LISTADAS]]
+    if len(intervalos) > RAICES_LISTADAS:
+        lineas.append(f"... y {len(intervalos) - RAICES_LISTADAS} tramos más")
+    QMessageBox.information(ventana, titulo, "\n".join(lineas))
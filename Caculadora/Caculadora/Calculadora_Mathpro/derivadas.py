@@ -25,7 +25,7 @@ from PyQt6.QtMultimedia import QMediaPlayer
 from PyQt6.QtMultimediaWidgets import QVideoWidget
 from PyQt6.QtCore import Qt, QRunnable, QThreadPool, pyqtSignal, QObject, QUrl, QStandardPaths, QTimer
 from PyQt6.QtGui import QFont, QColor, QIcon, QCursor
-from PyQt6.QtWebEngineWidgets import QWebEngineView 
+from render_mathjax import VistaMathJax
 
 # =============================================================================
 #  2. PARSER MATEMÁTICO
@@ -33,36 +33,12 @@ from PyQt6.QtWebEngineWidgets import QWebEngineView
 SUP_MAP = str.maketrans("0123456789-", "⁰¹²³⁴⁵⁶⁷⁸⁹⁻")
 DIGIT_TO_SUP = str.maketrans("0123456789-", "⁰¹²³⁴⁵⁶⁷⁸⁹⁻")
 
-def normalizar_expresion(expr: str) -> str:
-    s = expr.strip().lower()
-    if not s: return s
-    
-    # 1. Mapeo visual
-    s = s.replace("∛", "cbrt").replace("√", "sqrt")
-    s = s.replace("π", "pi").replace("e", "E")
-    
-    # 2. Traducción
-    trans = {
-        "sen": "sin", "tg": "tan", "ctg": "cot", "csc": "csc", 
-        "sec": "sec", "ln": "log", "raiz": "sqrt"
-    }
-    for k, v in trans.items(): s = re.sub(rf"\b{k}\b", v, s)
-    
-    # 3. Superíndices
-    patt = r"(?P<base>(?:\d+|\w+|[\)\]])+)(?P<sup>[⁰¹²³⁴⁵⁶⁷⁸⁹⁻]+)"
-    def repl(m):
-        sup_normal = m.group('sup').translate(str.maketrans("⁰¹²³⁴⁵⁶⁷⁸⁹⁻", "0123456789-"))
-        return f"{m.group('base')}**({sup_normal})"
-    s = re.sub(patt, repl, s)
-    s = s.replace("^", "**")
-    
-    # 4. Multiplicación implícita
-    s = re.sub(r'(\d)([a-z(])', r'\1*\2', s)
-    s = re.sub(r'(\))([a-z0-9(])', r'\1*\2', s)
-    s = re.sub(r'([x-z])(\()', r'\1*\2', s)
-    s = re.sub(r'([x-z])(sin|cos|tan|log|sqrt|cbrt|exp)', r'\1*\2', s)
+from motor_expresiones import a_sympy, texto_sympy
 
-    return s
+def normalizar_expresion(expr: str) -> str:
+    """Texto listo para sympify (lo usa el render de Manim en otro hilo)."""
+    if not expr.strip(): return ""
+    return texto_sympy(expr)
 
 # =============================================================================
 #  3. INPUT INTELIGENTE
@@ -149,6 +125,9 @@ QProgressBar { border: none; background-color: #E0E0E0; height: 4px; border-radi
 QProgressBar::chunk { background-color: #1E88E5; border-radius: 2px; }
 """
 
+# Estilos de las vistas MathJax (vista previa y procedimiento)
+ESTILOS_MATHJAX = "body{margin:0;padding:10px;font-family:'Segoe UI';}"
+
 # ====================================================================
 #  5. MOTOR DE DERIVACIÓN PASO A PASO
 # ====================================================================
@@ -420,7 +399,7 @@ class ManimDerivadaApp(QMainWindow):
 
         l_lay.addStretch()
         l_lay.addWidget(QLabel("Previsualización LaTeX:", objectName="Subtitle"))
-        self.preview_web = QWebEngineView(); self.preview_web.setFixedHeight(100)
+        self.preview_web = VistaMathJax(ESTILOS_MATHJAX); self.preview_web.setFixedHeight(100)
         self.preview_web.setStyleSheet("background:white; border:1px solid #CFD8DC; border-radius:8px;")
         self.preview_web.page().setBackgroundColor(Qt.GlobalColor.white)
         l_lay.addWidget(self.preview_web)
@@ -440,7 +419,7 @@ class ManimDerivadaApp(QMainWindow):
         self.tabs.addTab(tab_video, "🎬 Animación")
 
         tab_proc = QWidget(); pl = QVBoxLayout(tab_proc); pl.setContentsMargins(0,0,0,0)
-        self.steps_web = QWebEngineView(); self.steps_web.setStyleSheet("background:white;")
+        self.steps_web = VistaMathJax(ESTILOS_MATHJAX); self.steps_web.setStyleSheet("background:white;")
         self.steps_web.page().setBackgroundColor(Qt.GlobalColor.white)
         pl.addWidget(self.steps_web)
         self.tabs.addTab(tab_proc, "📝 Procedimiento Paso a Paso")
@@ -457,8 +436,7 @@ class ManimDerivadaApp(QMainWindow):
             self._set_html(self.preview_web, "<div style='color:#aaa; text-align:center; padding-top:30px;'>Esperando función...</div>")
             return
         try:
-            norm = normalizar_expresion(txt)
-            f = sp.sympify(norm)
+            f = a_sympy(txt)
             lat = sp.latex(f)
             html = f"<div style='text-align:center; padding-top:25px; font-size:1.3em; color:#1565C0;'>$$ f({var}) = {lat} $$</div>"
             self._set_html(self.preview_web, html)
@@ -466,16 +444,15 @@ class ManimDerivadaApp(QMainWindow):
             self._set_html(self.preview_web, "<div style='color:red; text-align:center; padding-top:30px;'>Error de sintaxis</div>")
 
     def _set_html(self, view, content):
-        full = f"<html><head><script src='https://polyfill.io/v3/polyfill.min.js?features=es6'></script><script id='MathJax-script' async src='https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js'></script><style>body{{margin:0;padding:10px;font-family:'Segoe UI';}}</style></head><body>{content}</body></html>"
-        view.setHtml(full)
+        view.mostrar(content)
 
     def run_process(self):
         txt = self.input_f.text(); var = self.input_var.text(); ord_ = self.slider.value()
         if not txt or not var: return
 
-        norm = normalizar_expresion(txt)
         try:
-            f = sp.sympify(norm); x = sp.Symbol(var)
+            norm = normalizar_expresion(txt)
+            f = a_sympy(txt); x = sp.Symbol(var)
             
             pasos = DerivadaPasoAPaso.generar_pasos(f, x)
             html_proc = f"<h3>Procedimiento Detallado (Orden 1)</h3>"
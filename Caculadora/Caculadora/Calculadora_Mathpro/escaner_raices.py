@@ -0,0 +1,142 @@
+import numpy as np
+
+from motor_expresiones import evaluar_vector
+
+# =============================================================================
+#  ESCÁNER DE RAÍCES (todas las raíces visibles, sin bucle por raíz)
+# =============================================================================
+#
+# 1. Una sola evaluación vectorizada sobre una malla del rango visible.
+#    Los puntos de la malla donde f vale exactamente 0 son raíces; si hay
+#    varios seguidos (f ≡ 0 en un tramo, p. ej. floor(x) en [0, 1)), el
+#    tramo se informa como un intervalo, no como un punto por celda.
+# 2. Candidatos: cambios de signo (raíces simples o polos) y mínimos locales
+#    de |f| casi nulos (raíces dobles, que no cambian de signo).
+# 3. Refinamiento simultáneo: bisección vectorizada para los cambios de signo
+#    y Newton vectorizado (derivada por diferencias centrales) para los mínimos.
+# 4. Se descartan polos y candidatos que no convergen, y se eliminan duplicados.
+
+PUNTOS_ESCANEO = 4001
+UMBRAL_MINIMO = 1e-2     # |f| relativo a la escala para considerar un mínimo como candidato
+TOL_RESIDUO = 1e-9       # |f(x)| aceptable (relativo a la escala) para raíces dobles
+
+
+def _bisecciones(expr, a, b, fa, tol, max_iter):
+    """Bisección sobre todos los intervalos a la vez."""
+    for _ in range(max_iter):
+        c = 0.5 * (a + b)
+        if np.all(np.abs(b - a) <= tol * (1.0 + np.abs(c))):
+            break
+        fc = evaluar_vector(expr, c)
+        mismo = np.sign(fc) == np.sign(fa)
+        a = np.where(mismo, c, a)
+        fa = np.where(mismo, fc, fa)
+        b = np.where(mismo, b, c)
+    return 0.5 * (a + b)
+
+
+def _newtons(expr, x, tol, max_iter):
+    """Newton sobre todos los candidatos a la vez (derivada numérica)."""
+    activo = np.ones(x.shape, dtype=bool)
+    with np.errstate(all="ignore"):
+        for _ in range(max_iter):
+            if not activo.any():
+                break
+            h = 1e-7 * (1.0 + np.abs(x))
+            fx = evaluar_vector(expr, x)
+            d = (evaluar_vector(expr, x + h) - evaluar_vector(expr, x - h)) / (2.0 * h)
+            paso = np.where(activo & (d != 0) & np.isfinite(d), fx / d, 0.0)
+            paso = np.where(np.isfinite(paso), paso, 0.0)
+            x = x - paso
+            activo &= np.abs(paso) > tol * (1.0 + np.abs(x))
+    return x
+
+
+def _tramos_nulos(xs, nulo):
+    """
+    Agrupa los puntos de la malla con f == 0 en corridas consecutivas.
+    Devuelve (aislados, intervalos): las x de las corridas de un solo punto
+    y un arreglo (k, 2) con [inicio, fin] de las de dos o más.
+    """
+    borde = np.diff(np.concatenate(([0], nulo.astype(np.int8), [0])))
+    inicio = np.flatnonzero(borde == 1)
+    fin = np.flatnonzero(borde == -1) - 1
+    solo = inicio == fin
+    intervalos = np.column_stack((xs[inicio[~solo]], xs[fin[~solo]]))
+    return xs[inicio[solo]], intervalos
+
+
+def buscar_raices(expr, xlim, puntos=PUNTOS_ESCANEO, tol=1e-12, max_iter=80):
+    """
+    Devuelve un arreglo ordenado con las raíces de expr dentro de xlim.
+    expr puede ser el texto del usuario o una función vectorizable.
+    Los tramos donde f ≡ 0 no se incluyen: ver buscar_ceros.
+    """
+    return buscar_ceros(expr, xlim, puntos, tol, max_iter)[0]
+
+
+def es_nula(intervalos, xlim) -> bool:
+    """True si un solo tramo nulo cubre todo xlim (f ≡ 0 en la vista)."""
+    return (len(intervalos) == 1 and intervalos[0, 0] <= min(xlim)
+            and intervalos[0, 1] >= max(xlim))
+
+
+def buscar_ceros(expr, xlim, puntos=PUNTOS_ESCANEO, tol=1e-12, max_iter=80):
+    """
+    Como buscar_raices, pero devuelve (raices, intervalos): intervalos es un
+    arreglo (k, 2) con los tramos [a, b] de la malla donde f vale 0.
+    """
+    x0, x1 = float(min(xlim)), float(max(xlim))
+    xs = np.linspace(x0, x1, int(puntos))
+    ys = evaluar_vector(expr, xs)
+    fin = np.isfinite(ys)
+
+    with np.errstate(invalid="ignore"):
+        absy = np.abs(ys)
+        escala = float(np.nanpercentile(absy, 95)) if fin.any() else 1.0
+    escala = escala if escala > 0 else 1.0
+
+    # --- Ceros exactos sobre la malla (corridas -> intervalos) ---
+    exactas, intervalos = _tramos_nulos(xs, fin & (ys == 0))
+
+    # --- Cambios de signo -> bisección ---
+    ambos = fin[:-1] & fin[1:]
+    with np.errstate(invalid="ignore"):
+        cambio = np.flatnonzero(ambos & (ys[:-1] * ys[1:] < 0))
+    if cambio.size:
+        r = _bisecciones(expr, xs[cambio], xs[cambio + 1], ys[cambio], tol, max_iter)
+        fr = np.abs(evaluar_vector(expr, r))
+        # Polos (tan, 1/x) y saltos (floor) también cambian de signo, pero |f|
+        # no se acerca a cero al refinar
+        extremos = np.minimum(absy[cambio], absy[cambio + 1])
+        convergio = (fr < 1e-3 * extremos) | (fr <= TOL_RESIDUO * max(escala, 1.0))
+        simples = r[np.isfinite(fr) & convergio]
+    else:
+        simples = np.empty(0)
+
+    # --- Mínimos de |f| casi nulos sin cambio de signo -> Newton ---
+    i = np.arange(1, xs.size - 1)
+    with np.errstate(invalid="ignore"):
+        minimo = (
+            fin[i - 1] & fin[i] & fin[i + 1]
+            & (absy[i] <= absy[i - 1]) & (absy[i] < absy[i + 1])
+            & (ys[i - 1] * ys[i] > 0) & (ys[i] * ys[i + 1] > 0)
+            & (absy[i] < UMBRAL_MINIMO * escala)
+        )
+    cand = i[minimo]
+    if cand.size:
+        r = _newtons(expr, xs[cand], tol, max_iter)
+        fr = np.abs(evaluar_vector(expr, r))
+        paso = xs[1] - xs[0]
+        cerca = np.abs(r - xs[cand]) <= 2 * paso
+        dobles = r[cerca & np.isfinite(fr) & (fr <= TOL_RESIDUO * max(escala, 1.0))]
+    else:
+        dobles = np.empty(0)
+
+    raices = np.sort(np.concatenate((exactas, simples, dobles)))
+    raices = raices[(raices >= x0) & (raices <= x1)]
+    if raices.size > 1:
+        # Duplicados (misma raíz por dos caminos o en el borde de una celda)
+        distinta = np.diff(raices) > 1e-9 * (1.0 + np.abs(raices[1:]))
+        raices = raices[np.concatenate(([True], distinta))]
+    return raices, intervalos
@@ -0,0 +1,131 @@
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+from functools import wraps
+
+# =============================================================================
+#  MÉTRICAS DE CÁLCULO Y RENDER (opcionales)
+# =============================================================================
+#
+# Contadores y tiempos de los caminos calientes: evaluación de f(x), bucle de
+# cada método, armado del HTML, envío a la vista web, composición de MathJax,
+# pasos de Gauss, llamadas recursivas de cofactores... Sirven para saber si
+# un cálculo lento es matemática, armado de texto o la vista web.
+#
+# Están apagadas por defecto (medir() devuelve un contexto vacío y
+# instrumentar() la función tal cual). Se encienden con MATHPRO_METRICAS=1 o
+# desde la página de diagnóstico del menú (Ctrl+Shift+D), que también las
+# exporta a JSON. Este módulo no depende de PyQt6.
+
+activo = os.environ.get("MATHPRO_METRICAS") == "1"
+
+_lock = threading.Lock()
+_tiempos = {}      # nombre -> [llamadas, total s, máximo s]
+_contadores = {}   # nombre -> n
+_NULO = nullcontext()
+
+
+def activar(si: bool = True):
+    global activo
+    activo = si
+
+
+def reiniciar():
+    with _lock:
+        _tiempos.clear()
+        _contadores.clear()
+
+
+def sumar(nombre: str, segundos: float, llamadas: int = 1):
+    """Agrega `llamadas` ejecuciones que tardaron `segundos` en total."""
+    if not activo:
+        return
+    with _lock:
+        m = _tiempos.get(nombre)
+        if m is None:
+            _tiempos[nombre] = [llamadas, segundos, segundos / llamadas if llamadas else 0.0]
+        else:
+            m[0] += llamadas
+            m[1] += segundos
+            if llamadas and segundos / llamadas > m[2]:
+                m[2] = segundos / llamadas
+
+
+def contar(nombre: str, n: int = 1):
+    if activo:
+        with _lock:
+            _contadores[nombre] = _contadores.get(nombre, 0) + n
+
+
+class _Medicion:
+    __slots__ = ("nombre", "inicio")
+
+    def __init__(self, nombre):
+        self.nombre = nombre
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        sumar(self.nombre, time.perf_counter() - self.inicio)
+        return False
+
+
+def medir(nombre: str):
+    """with medir("..."): suma el tiempo del bloque (nada si están apagadas)."""
+    return _Medicion(nombre) if activo else _NULO
+
+
+def medido(nombre: str):
+    """Decorador: mide cada llamada (se decide al llamar, no al decorar)."""
+    def decorador(fn):
+        @wraps(fn)
+        def envoltura(*args, **kwargs):
+            if not activo:
+                return fn(*args, **kwargs)
+            with _Medicion(nombre):
+                return fn(*args, **kwargs)
+        return envoltura
+    return decorador
+
+
+def instrumentar(nombre: str, fn):
+    """fn envuelta para medir cada llamada, o fn sin cambios si están apagadas."""
+    if not activo:
+        return fn
+    reloj = time.perf_counter
+
+    def envoltura(*args):
+        t = reloj()
+        try:
+            return fn(*args)
+        finally:
+            sumar(nombre, reloj() - t)
+    return envoltura
+
+
+def datos() -> dict:
+    with _lock:
+        tiempos = {
+            nombre: {
+                "llamadas": n,
+                "total_ms": total * 1000,
+                "media_ms": total * 1000 / n if n else 0.0,
+                "max_ms": maximo * 1000,
+            }
+            for nombre, (n, total, maximo) in sorted(_tiempos.items())
+        }
+        return {"tiempos": tiempos, "contadores": dict(sorted(_contadores.items()))}
+
+
+def exportar(ruta: str, extra: dict = None):
+    """Guarda datos() (más `extra`, p. ej. estadísticas de cachés) como JSON."""
+    contenido = dict(datos(), generado=time.strftime("%Y-%m-%d %H:%M:%S"))
+    if extra:
+        contenido.update(extra)
+    with open(ruta, "w", encoding="utf-8") as f:
+        json.dump(contenido, f, indent=2, ensure_ascii=False)
+    return ruta
@@ -0,0 +1,80 @@
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+# =============================================================================
+#  MODELO DE LA TABLA DE ITERACIONES (Bisección, Newton, Secante, Falsa Posición)
+# =============================================================================
+#
+# La tabla lee directamente las columnas array('d') del Historial de
+# solucionadores: no hay un QTableWidgetItem por celda y el texto se formatea
+# solo para las filas visibles, cuando la vista lo pide en data(). Agregar
+# filas mientras el worker calcula es un beginInsertRows/endInsertRows, así
+# que un millón de iteraciones se muestran al instante.
+
+
+class ModeloIteraciones(QAbstractTableModel):
+    """Columnas: las COLUMNAS del tipo de registro del historial, en orden."""
+
+    def __init__(self, encabezados, parent=None):
+        super().__init__(parent)
+        self.encabezados = list(encabezados)
+        self._historial = None
+        self._columnas = ()
+        self._filas = 0
+
+    # --- Datos ---
+    def mostrar(self, historial, n=None):
+        """
+        Muestra las primeras n filas del historial (todas si n es None).
+        Con el mismo historial solo se agregan las filas nuevas.
+        """
+        n = len(historial) if n is None else n
+        if historial is not self._historial:
+            self.beginResetModel()
+            self._historial = historial
+            self._columnas = tuple(historial.columna(c) for c in historial.tipo.COLUMNAS)
+            self._filas = n
+            self.endResetModel()
+        elif n > self._filas:
+            self.beginInsertRows(QModelIndex(), self._filas, n - 1)
+            self._filas = n
+            self.endInsertRows()
+
+    def limpiar(self):
+        self.beginResetModel()
+        self._historial = None
+        self._columnas = ()
+        self._filas = 0
+        self.endResetModel()
+
+    @staticmethod
+    def _texto(j, val):
+        return f"{val:.6f}" if j > 0 else str(int(val))
+
+    def filas_texto(self):
+        """Todas las filas con el mismo formato de la tabla (para exportar)."""
+        return [[self._texto(j, col[r]) for j, col in enumerate(self._columnas)]
+                for r in range(self._filas)]
+
+    # --- Interfaz de QAbstractTableModel ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._filas
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.encabezados)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not self._columnas:
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            j = index.column()
+            return self._texto(j, self._columnas[j][index.row()])
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def headerData(self, seccion, orientacion, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientacion == Qt.Orientation.Horizontal:
+            return self.encabezados[seccion]
+        return str(seccion + 1)
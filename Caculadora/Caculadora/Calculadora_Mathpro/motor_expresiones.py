@@ -0,0 +1,634 @@
+import re
+import ast
+import math
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+
+from metricas import medir
+
+# =============================================================================
+#  MOTOR DE EXPRESIONES COMPARTIDO (Bisección, Newton, Secante, Falsa Posición)
+# =============================================================================
+
+CHAR_MAP = {
+    '0': '⁰', '1': '¹', '2': '²', '3': '³', '4': '⁴',
+    '5': '⁵', '6': '⁶', '7': '⁷', '8': '⁸', '9': '⁹',
+    '+': '⁺', '-': '⁻', '/': '⁄', '=': '⁼',
+    '(': '⁽', ')': '⁾',
+
+    # Variables y letras para funciones (ln, sen, cos, tan, log, exp, pi)
+    'a': 'ᵃ', 'b': 'ᵇ', 'c': 'ᶜ', 'd': 'ᵈ', 'e': 'ᵉ',
+    'f': 'ᶠ', 'g': 'ᵍ', 'h': 'ʰ', 'i': 'ⁱ', 'j': 'ʲ',
+    'k': 'ᵏ', 'l': 'ˡ', 'm': 'ᵐ', 'n': 'ⁿ', 'o': 'ᵒ',
+    'p': 'ᵖ', 'r': 'ʳ', 's': 'ˢ', 't': 'ᵗ', 'u': 'ᵘ',
+    'v': 'ᵛ', 'w': 'ʷ', 'x': 'ˣ', 'y': 'ʸ', 'z': 'ᶻ',
+
+    'π': 'pi'
+}
+
+REVERSE_MAP = {v: k for k, v in CHAR_MAP.items()}
+# Solo superíndices de un carácter: 'pi' (entrada de π en modo exponente) no debe
+# convertir las letras p/i sueltas de "sin", "exp" o "pi" en exponentes.
+SUP_CHARS = "".join(v for v in CHAR_MAP.values() if len(v) == 1)
+
+
+def _transform_sup_de_python(sup_norm: str) -> str:
+    """
+    Interpreta el texto del exponente ya 'normalizado' desde superíndices.
+    Soporta las variantes:
+      - "-1/2"   -> -1/2        (signo fuera)
+      - "1-/2"   -> (-1)/2      (signo dentro)
+      - "-1-/2"  -> -(-1/2)     (dos signos)
+      - con paréntesis: "-(-1/2)" se deja tal cual
+    """
+    sup_norm = sup_norm.strip()
+
+    # Si tiene paréntesis, dejamos que SymPy lo entienda tal cual
+    if "(" in sup_norm or ")" in sup_norm:
+        return sup_norm
+
+    if "/" not in sup_norm:
+        return sup_norm
+
+    num, den = sup_norm.split("/", 1)
+    num = num.strip()
+    den = den.strip()
+
+    leading = num.startswith("-")
+    trailing = num.endswith("-")
+    core = num.strip("-").strip()
+
+    if leading and trailing:
+        return f"-(-{core})/{den}"
+    elif leading:
+        return f"-({core})/{den}"
+    elif trailing:
+        return f"(-{core})/{den}"
+    else:
+        return f"{core}/{den}"
+
+
+def normalizar_python(expr: str) -> str:
+    """Convierte entrada visual (con superíndices unicode) a sintaxis Python ejecutable."""
+    s = expr.strip().lower()
+    if not s:
+        return ""
+
+    # Reemplazos básicos
+    s = s.replace("π", "pi").replace("∛", "cbrt").replace("√", "sqrt")
+
+    # Reemplazar 'e' por 'e_val' solo si es una palabra aislada
+    s = re.sub(r'\be\b', 'e_val', s)
+
+    # Manejo de superíndices (x² -> x**(2), x⁻¹⁄² -> x**(-1/2), x⁻¹⁻⁄² -> x**(-(-1/2)))
+    pattern = f"(?P<base>[a-zA-Z0-9_\\)\\]])(?P<sup>[{re.escape(SUP_CHARS)}]+)"
+
+    def repl(m):
+        base = m.group('base')
+        sup_raw = m.group('sup')
+        sup_norm = "".join(REVERSE_MAP.get(ch, ch) for ch in sup_raw)
+        sup_expr = _transform_sup_de_python(sup_norm)
+        return f"{base}**({sup_expr})"
+
+    s = re.sub(pattern, repl, s)
+
+    # Variable pegada a una función: xsen(x) -> x*sen(x)
+    s = re.sub(r'(?<![a-z_])([x-z])(?=(?:sen|sin|cos|tan|tg|ctg|cot|sec|csc|ln|log|sqrt|raiz|cbrt|exp)\()',
+               r'\1*', s)
+
+    # funciones trig / log en español
+    replacements = {
+        r"\bsen\b": "sin",
+        r"\bln\b": "log",
+        r"\btg\b": "tan",
+        r"\bctg\b": "cot",
+        r"\braiz\b": "sqrt",
+    }
+    for esp, eng in replacements.items():
+        s = re.sub(esp, eng, s)
+
+    # Multiplicación implícita: 2x -> 2*x, (x+1)2 -> (x+1)*2, x(x+1) -> x*(x+1)
+    s = re.sub(r'(\d)([a-z\(])', r'\1*\2', s)
+    s = re.sub(r'(\))([a-z0-9\(])', r'\1*\2', s)
+    s = re.sub(r'(?<![a-z_])([x-z])(\()', r'\1*\2', s)
+
+    return s.replace("^", "**").replace("⁄", "/")
+
+
+# =============================================================================
+#  CONTEXTOS DE EVALUACIÓN (se construyen UNA vez por proceso)
+# =============================================================================
+#
+# NumPy se importa solo cuando hace falta (evaluación vectorizada o funciones
+# que math no trae): importar el motor para resolver en lote no debe pagar
+# los ~100 ms de `import numpy`.
+
+def _cbrt_real(t):
+    return math.copysign(abs(t) ** (1.0 / 3.0), t)
+
+
+# Funciones extra que NumPy no trae con el nombre que usa el usuario
+def _extra_numpy(np):
+    return {
+        "cot": lambda t: 1.0 / np.tan(t),
+        "sec": lambda t: 1.0 / np.cos(t),
+        "csc": lambda t: 1.0 / np.sin(t),
+    }
+
+
+# Versiones de math (mucho más rápidas con un solo float que las ufuncs de NumPy)
+_EXTRA_ESCALAR = {
+    "sin": math.sin, "cos": math.cos, "tan": math.tan,
+    "asin": math.asin, "acos": math.acos, "atan": math.atan,
+    "arcsin": math.asin, "arccos": math.acos, "arctan": math.atan,
+    "sinh": math.sinh, "cosh": math.cosh, "tanh": math.tanh,
+    "exp": math.exp, "log": math.log, "log10": math.log10, "log2": math.log2,
+    "sqrt": math.sqrt, "cbrt": _cbrt_real, "fabs": math.fabs,
+    "floor": math.floor, "ceil": math.ceil,
+    "cot": lambda t: 1.0 / math.tan(t),
+    "sec": lambda t: 1.0 / math.cos(t),
+    "csc": lambda t: 1.0 / math.sin(t),
+}
+
+_BUILTINS_PERMITIDOS = {"abs": abs, "min": min, "max": max, "round": round, "pow": pow}
+
+# Contexto escalar sin NumPy: cubre casi todo lo que se escribe en los métodos
+_CONTEXTO_MATH = dict(
+    _EXTRA_ESCALAR,
+    e_val=math.e, e=math.e, pi=math.pi, inf=math.inf, nan=math.nan,
+    __builtins__=_BUILTINS_PERMITIDOS,
+)
+_NOMBRES_MATH = frozenset(_CONTEXTO_MATH) | frozenset(_BUILTINS_PERMITIDOS) | {"x"}
+
+_contextos = {}
+_lock_contextos = threading.Lock()
+
+
+def _construir_contexto():
+    import numpy as np
+    ctx = {k: v for k, v in np.__dict__.items() if callable(v) or isinstance(v, float)}
+    ctx.update(_extra_numpy(np))
+    ctx.update({"e_val": np.e, "pi": np.pi, "log": np.log})
+    # 'x' vive en el diccionario local de cada evaluación, nunca aquí
+    ctx.pop("x", None)
+    ctx["__builtins__"] = _BUILTINS_PERMITIDOS
+    return ctx
+
+
+def _contexto(nombre: str) -> dict:
+    """'vector' (ufuncs de NumPy) o 'escalar' (NumPy con math encima), perezosos."""
+    ctx = _contextos.get(nombre)
+    if ctx is None:
+        with _lock_contextos:
+            if not _contextos:
+                base = _construir_contexto()
+                _contextos["escalar"] = dict(base, **_EXTRA_ESCALAR)
+                _contextos["mat"] = MappingProxyType(base)
+                _contextos["vector"] = base
+            ctx = _contextos[nombre]
+    return ctx
+
+
+def contexto_mat():
+    """Contexto (solo lectura) para evaluar expresiones numéricas."""
+    return _contexto("mat")
+
+
+# =============================================================================
+#  ÁRBOL SINTÁCTICO: VALIDACIÓN, SYMPY Y LATEX
+# =============================================================================
+
+_NODOS_PERMITIDOS = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load, ast.Constant,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod, ast.UAdd, ast.USub,
+)
+
+_CONSTANTES_E = ("e_val", "e")
+
+
+def _parsear(normalizada: str) -> ast.Expression:
+    """Parsea la expresión y rechaza cualquier cosa que no sea aritmética + funciones."""
+    arbol = ast.parse(normalizada, mode="eval")
+    for nodo in ast.walk(arbol):
+        if not isinstance(nodo, _NODOS_PERMITIDOS):
+            raise ValueError(f"Sintaxis no permitida: {type(nodo).__name__}")
+        if isinstance(nodo, ast.Name) and nodo.id.startswith("_"):
+            raise ValueError(f"Nombre no permitido: {nodo.id}")
+        if isinstance(nodo, ast.Constant) and not isinstance(nodo.value, (int, float)):
+            raise ValueError(f"Constante no permitida: {nodo.value!r}")
+        if isinstance(nodo, ast.Call) and (not isinstance(nodo.func, ast.Name) or nodo.keywords):
+            raise ValueError("Llamada a función no permitida")
+    return arbol
+
+
+def _funciones_sympy(sp):
+    return {
+        "sin": sp.sin, "cos": sp.cos, "tan": sp.tan,
+        "cot": sp.cot, "sec": sp.sec, "csc": sp.csc,
+        "asin": sp.asin, "acos": sp.acos, "atan": sp.atan,
+        "arcsin": sp.asin, "arccos": sp.acos, "arctan": sp.atan,
+        "sinh": sp.sinh, "cosh": sp.cosh, "tanh": sp.tanh,
+        "exp": sp.exp, "log": sp.log, "sqrt": sp.sqrt, "cbrt": sp.cbrt,
+        "log10": lambda t: sp.log(t, 10), "log2": lambda t: sp.log(t, 2),
+        "abs": sp.Abs, "fabs": sp.Abs, "floor": sp.floor, "ceil": sp.ceiling,
+    }
+
+
+def _a_sympy(nodo, sp, funciones):
+    """Convierte el AST validado en una expresión de SymPy."""
+    if isinstance(nodo, ast.Expression):
+        return _a_sympy(nodo.body, sp, funciones)
+    if isinstance(nodo, ast.Constant):
+        v = nodo.value
+        return sp.Integer(v) if isinstance(v, int) else sp.Float(repr(v))
+    if isinstance(nodo, ast.Name):
+        if nodo.id in _CONSTANTES_E:
+            return sp.E
+        if nodo.id == "pi":
+            return sp.pi
+        return sp.Symbol(nodo.id)
+    if isinstance(nodo, ast.UnaryOp):
+        v = _a_sympy(nodo.operand, sp, funciones)
+        return -v if isinstance(nodo.op, ast.USub) else v
+    if isinstance(nodo, ast.BinOp):
+        a = _a_sympy(nodo.left, sp, funciones)
+        b = _a_sympy(nodo.right, sp, funciones)
+        op = nodo.op
+        if isinstance(op, ast.Add): return a + b
+        if isinstance(op, ast.Sub): return a - b
+        if isinstance(op, ast.Mult): return a * b
+        if isinstance(op, ast.Div): return a / b
+        if isinstance(op, ast.Pow): return a ** b
+        return sp.Mod(a, b)
+    if isinstance(nodo, ast.Call):
+        nombre = nodo.func.id
+        args = [_a_sympy(a, sp, funciones) for a in nodo.args]
+        f = funciones.get(nombre) or getattr(sp, nombre, None)
+        if not callable(f):
+            f = sp.Function(nombre)
+        return f(*args)
+    raise ValueError(f"Nodo no soportado: {type(nodo).__name__}")
+
+
+_LATEX_FUNCIONES = {
+    "sin": "\\sin", "cos": "\\cos", "tan": "\\tan",
+    "cot": "\\cot", "sec": "\\sec", "csc": "\\csc",
+    "asin": "\\arcsin", "acos": "\\arccos", "atan": "\\arctan",
+    "arcsin": "\\arcsin", "arccos": "\\arccos", "arctan": "\\arctan",
+    "sinh": "\\sinh", "cosh": "\\cosh", "tanh": "\\tanh",
+    "log": "\\ln", "log10": "\\log_{10}", "log2": "\\log_{2}",
+}
+
+# Precedencias para decidir dónde hacen falta paréntesis
+_P_SUMA, _P_PRODUCTO, _P_UNARIO, _P_POTENCIA, _P_ATOMO = 1, 2, 3, 4, 5
+
+
+def _precedencia(nodo):
+    if isinstance(nodo, ast.BinOp):
+        if isinstance(nodo.op, (ast.Add, ast.Sub)):
+            return _P_SUMA
+        if isinstance(nodo.op, ast.Pow):
+            return _P_POTENCIA
+        if isinstance(nodo.op, ast.Div):
+            return _P_ATOMO  # \frac ya agrupa
+        return _P_PRODUCTO
+    if isinstance(nodo, ast.UnaryOp):
+        return _P_UNARIO
+    if isinstance(nodo, ast.Constant) and nodo.value < 0:
+        return _P_UNARIO
+    return _P_ATOMO
+
+
+def _parentesis(nodo, minimo):
+    tex = _a_latex(nodo)
+    if _precedencia(nodo) < minimo:
+        return f"\\left({tex}\\right)"
+    return tex
+
+
+def _a_latex(nodo):
+    """LaTeX directo desde el AST, respetando el orden en que el usuario escribió."""
+    if isinstance(nodo, ast.Expression):
+        return _a_latex(nodo.body)
+    if isinstance(nodo, ast.Constant):
+        return repr(nodo.value)
+    if isinstance(nodo, ast.Name):
+        if nodo.id in _CONSTANTES_E:
+            return "e"
+        if nodo.id == "pi":
+            return "\\pi"
+        return nodo.id
+    if isinstance(nodo, ast.UnaryOp):
+        signo = "-" if isinstance(nodo.op, ast.USub) else "+"
+        return f"{signo}{_parentesis(nodo.operand, _P_UNARIO)}"
+    if isinstance(nodo, ast.BinOp):
+        op = nodo.op
+        if isinstance(op, ast.Add):
+            return f"{_a_latex(nodo.left)} + {_parentesis(nodo.right, _P_PRODUCTO)}"
+        if isinstance(op, ast.Sub):
+            return f"{_a_latex(nodo.left)} - {_parentesis(nodo.right, _P_PRODUCTO)}"
+        if isinstance(op, ast.Div):
+            num = nodo.left
+            if isinstance(num, ast.UnaryOp) and isinstance(num.op, ast.USub):
+                return f"-\\frac{{{_a_latex(num.operand)}}}{{{_a_latex(nodo.right)}}}"
+            return f"\\frac{{{_a_latex(num)}}}{{{_a_latex(nodo.right)}}}"
+        if isinstance(op, ast.Pow):
+            return f"{_parentesis(nodo.left, _P_ATOMO)}^{{{_a_latex(nodo.right)}}}"
+        izq = _parentesis(nodo.left, _P_PRODUCTO)
+        der = _parentesis(nodo.right, _P_POTENCIA)
+        if isinstance(op, ast.Mod):
+            return f"{izq} \\bmod {der}"
+        # 2x, 3\sin(x): el coeficiente numérico se yuxtapone
+        if isinstance(nodo.left, ast.Constant) and not isinstance(nodo.right, ast.Constant) \
+                and not der.startswith("-"):
+            return f"{izq}{der}"
+        return f"{izq} \\cdot {der}"
+    if isinstance(nodo, ast.Call):
+        nombre = nodo.func.id
+        args = [_a_latex(a) for a in nodo.args]
+        arg = ", ".join(args)
+        if nombre == "sqrt":
+            return f"\\sqrt{{{arg}}}"
+        if nombre == "cbrt":
+            return f"\\sqrt[3]{{{arg}}}"
+        if nombre == "exp" and len(args) == 1:
+            return f"e^{{{arg}}}"
+        if nombre in ("abs", "fabs"):
+            return f"\\left|{arg}\\right|"
+        if nombre == "log" and len(args) == 2:
+            return f"\\log_{{{args[1]}}}\\left({args[0]}\\right)"
+        cabeza = _LATEX_FUNCIONES.get(nombre, f"\\operatorname{{{nombre}}}")
+        return f"{cabeza}\\left({arg}\\right)"
+    raise ValueError(f"Nodo no soportado: {type(nodo).__name__}")
+
+
+def _latex_regex(expr_visual: str) -> str:
+    """
+    Vista previa tolerante para texto incompleto (p. ej. mientras se escribe "sen(x").
+    Soporta:
+      x⁻¹⁄²    -> x^{-\\frac{1}{2}}
+      x¹⁻⁄²    -> x^{\\frac{-1}{2}}
+      x⁻¹⁻⁄²   -> x^{-\\frac{-1}{2}}
+      x⁻(⁻¹⁄²) -> x^{-( -1/2 )} -> x^{-\\left(\\frac{-1}{2}\\right)}
+    """
+    tex = expr_visual
+    tex = tex.replace("sen", "\\sin").replace("cos", "\\cos").replace("tan", "\\tan")
+    tex = tex.replace("ln", "\\ln").replace("log", "\\ln")
+    tex = tex.replace("sqrt", "\\sqrt").replace("pi", "\\pi")
+
+    pattern = f"([{re.escape(SUP_CHARS)}]+)"
+
+    def repl_latex(m):
+        # Convertimos superíndices unicode a texto "normal"
+        norm_txt = "".join(REVERSE_MAP.get(c, c) for c in m.group(1)).strip()
+
+        # Caso: exponente con paréntesis, lo pasa por el motor para LaTeX bonito
+        if "(" in norm_txt and ")" in norm_txt:
+            try:
+                return f"^{{ {_a_latex(_parsear(norm_txt))} }}"
+            except Exception:
+                return f"^{{ {norm_txt} }}"
+
+        # Caso: fracción tipo (combinaciones con signos)
+        if "/" in norm_txt:
+            num, den = norm_txt.split("/", 1)
+            num = num.strip()
+            den = den.strip()
+
+            leading = num.startswith("-")
+            trailing = num.endswith("-")
+            core = num.strip("-").strip()
+
+            if leading and not trailing:
+                return f"^{{ -\\frac{{{core}}}{{{den}}} }}"
+            if trailing and not leading:
+                return f"^{{ \\frac{{-{core}}}{{{den}}} }}"
+            if leading and trailing:
+                return f"^{{ -\\frac{{-{core}}}{{{den}}} }}"
+            return f"^{{ \\frac{{{num}}}{{{den}}} }}"
+
+        # resto de exponentes normales
+        return f"^{{{norm_txt}}}"
+
+    tex = re.sub(pattern, repl_latex, tex)
+    tex = tex.replace("*", " \\cdot ").replace("exp", "\\exp")
+    return tex
+
+
+# =============================================================================
+#  EXPRESIÓN COMPILADA + CACHÉ LRU
+# =============================================================================
+
+class ExpresionCompilada:
+    """
+    Resultado de un único parseo del texto del usuario.
+    De ese mismo AST salen:
+      - el callable escalar (expr(x) -> float, NaN si no se puede evaluar),
+      - el callable vectorizado (expr.vectorizado(xs) -> ndarray),
+      - la expresión de SymPy (expr.sympy, perezosa),
+      - la vista previa LaTeX (expr.latex, perezosa).
+    Si el texto no es válido, `error` guarda el motivo y todo devuelve NaN.
+    """
+    __slots__ = ("texto", "normalizada", "arbol", "codigo", "error", "_sympy", "_latex",
+                 "_solo_math")
+
+    def __init__(self, texto: str):
+        self.texto = texto
+        self.normalizada = normalizar_python(texto)
+        self.arbol = None
+        self.codigo = None
+        self.error = None
+        self._sympy = None
+        self._latex = None
+        self._solo_math = False
+        try:
+            self.arbol = _parsear(self.normalizada)
+            self.codigo = compile(self.arbol, "<expresion>", "eval")
+            self._solo_math = _NOMBRES_MATH.issuperset(self.codigo.co_names)
+        except Exception as e:
+            self.error = str(e) or type(e).__name__
+
+    @property
+    def valida(self) -> bool:
+        return self.codigo is not None
+
+    def __call__(self, x_val):
+        if self.codigo is None:
+            return math.nan
+        ctx = _CONTEXTO_MATH if self._solo_math else _contexto("escalar")
+        try:
+            return float(eval(self.codigo, ctx, {"x": x_val}))
+        except Exception:
+            return math.nan
+
+    def vectorizado(self, xs):
+        """Evalúa la expresión sobre todo el arreglo xs en una sola llamada."""
+        import numpy as np
+        xs = np.asarray(xs, dtype=float)
+        if self.codigo is None:
+            return np.full(xs.shape, np.nan)
+        if "x" not in self.codigo.co_names:
+            # Expresión constante (p. ej. "5"): se evalúa una vez y se replica
+            return np.full(xs.shape, self(0.0))
+        return _evaluar_arreglo(
+            lambda arr: eval(self.codigo, _contexto("vector"), {"x": arr}), self, xs
+        )
+
+    @property
+    def sympy(self):
+        """Expresión de SymPy construida desde el mismo AST (lanza ValueError si no es válida)."""
+        if self._sympy is None:
+            if self.arbol is None:
+                raise ValueError(f"Expresión inválida: {self.error}")
+            import sympy as sp
+            self._sympy = _a_sympy(self.arbol, sp, _funciones_sympy(sp))
+        return self._sympy
+
+    @property
+    def latex(self) -> str:
+        """Vista previa LaTeX; si el texto aún está incompleto se usa la versión tolerante."""
+        if self._latex is None:
+            if not self.texto.strip():
+                self._latex = ""
+            elif self.arbol is not None:
+                self._latex = _a_latex(self.arbol)
+            else:
+                self._latex = _latex_regex(self.texto)
+        return self._latex
+
+
+def _a_reales(ys, forma):
+    """Convierte el resultado a float64: complejos y ±inf pasan a NaN."""
+    import numpy as np
+    ys = np.asarray(ys)
+    if ys.shape != forma:
+        # Reducciones como max(x, 0) no son elemento a elemento
+        raise ValueError("la expresión no difunde sobre x")
+    if np.iscomplexobj(ys):
+        ys = np.where(np.abs(ys.imag) < 1e-12, ys.real, np.nan)
+    ys = np.array(ys, dtype=float)
+    ys[~np.isfinite(ys)] = np.nan
+    return ys
+
+
+def _evaluar_arreglo(f_vector, f_escalar, xs):
+    """
+    Intenta la ruta vectorizada; si la expresión no difunde sobre arreglos
+    (max, condicionales, etc.) cae a evaluación punto a punto.
+    Nunca lanza: los errores de dominio quedan como NaN.
+    """
+    import numpy as np
+    try:
+        with np.errstate(all="ignore"):
+            return _a_reales(f_vector(xs), xs.shape)
+    except Exception:
+        pass
+
+    ys = np.empty(xs.shape, dtype=float)
+    with np.errstate(all="ignore"):
+        for i, x in enumerate(xs.flat):
+            try:
+                ys.flat[i] = float(f_escalar(x))
+            except Exception:
+                ys.flat[i] = np.nan
+    ys[~np.isfinite(ys)] = np.nan
+    return ys
+
+
+class CacheEvaluadores:
+    """
+    Caché LRU acotada: texto del usuario -> ExpresionCompilada.
+    También guarda las expresiones inválidas, para no re-parsearlas en cada tecla.
+    Lleva contadores de aciertos/fallos para medir el ahorro.
+    """
+
+    def __init__(self, capacidad: int = 256):
+        self.capacidad = capacidad
+        self.aciertos = 0
+        self.fallos = 0
+        self._datos = OrderedDict()
+        self._lock = threading.Lock()
+
+    def obtener(self, texto: str) -> ExpresionCompilada:
+        with self._lock:
+            ev = self._datos.get(texto)
+            if ev is not None:
+                self._datos.move_to_end(texto)
+                self.aciertos += 1
+                return ev
+            self.fallos += 1
+
+        # Compilamos fuera del lock (normalizar + parsear + compile es lo caro)
+        ev = ExpresionCompilada(texto)
+
+        with self._lock:
+            self._datos[texto] = ev
+            self._datos.move_to_end(texto)
+            while len(self._datos) > self.capacidad:
+                self._datos.popitem(last=False)
+        return ev
+
+    def estadisticas(self) -> dict:
+        with self._lock:
+            total = self.aciertos + self.fallos
+            return {
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "tasa_aciertos": (self.aciertos / total) if total else 0.0,
+                "tamano": len(self._datos),
+                "capacidad": self.capacidad,
+            }
+
+    def limpiar(self):
+        with self._lock:
+            self._datos.clear()
+            self.aciertos = 0
+            self.fallos = 0
+
+
+CACHE_EXPRESIONES = CacheEvaluadores()
+
+
+def compilar(expr: str) -> ExpresionCompilada:
+    """Compilación compartida (una por texto) para todos los métodos y gráficas."""
+    return CACHE_EXPRESIONES.obtener(expr)
+
+
+def evaluar(expr, x_val):
+    """Evalúa una expresión matemática en un punto x (usa la caché compartida)."""
+    with medir("evaluar"):
+        return CACHE_EXPRESIONES.obtener(expr)(x_val)
+
+
+def evaluar_vector(expr, xs):
+    """
+    Evalúa sobre un arreglo completo de x.
+    expr puede ser el texto del usuario (usa la caché), una ExpresionCompilada
+    o cualquier función f(x).
+    """
+    with medir("evaluar_vector"):
+        if isinstance(expr, str):
+            expr = CACHE_EXPRESIONES.obtener(expr)
+        if isinstance(expr, ExpresionCompilada):
+            return expr.vectorizado(xs)
+        import numpy as np
+        xs = np.asarray(xs, dtype=float)
+        return _evaluar_arreglo(expr, expr, xs)
+
+
+def a_sympy(expr: str):
+    """Expresión de SymPy para derivar / mostrar (lanza ValueError si es inválida)."""
+    return CACHE_EXPRESIONES.obtener(expr).sympy
+
+
+def texto_sympy(expr: str) -> str:
+    """Texto que sympify() entiende (p. ej. para pasarlo a otro proceso)."""
+    return str(a_sympy(expr))
+
+
+def generar_latex_previsualizacion(expr_visual: str) -> str:
+    """LaTeX para la vista previa del campo de entrada."""
+    if not expr_visual:
+        return ""
+    return CACHE_EXPRESIONES.obtener(expr_visual).latex
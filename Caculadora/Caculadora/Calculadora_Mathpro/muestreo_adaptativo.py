@@ -0,0 +1,266 @@
+import math
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from motor_expresiones import evaluar_vector
+
+# =============================================================================
+#  MUESTREO ADAPTATIVO DE CURVAS (Bisección, Newton, Secante, Falsa Posición)
+# =============================================================================
+#
+# En vez de 2000 puntos fijos, se parte de una malla gruesa y se subdivide
+# nivel a nivel solo donde hace falta: curvatura alta, cambios de signo o
+# saltos grandes. Cada nivel es UNA evaluación vectorizada de los puntos medios.
+# Al final, los saltos que no se resolvieron ni al ancho mínimo se cortan con
+# NaN para que las asíntotas no se dibujen como rectas verticales.
+
+PRESUPUESTO_EVALUACIONES = 4000   # tope de evaluaciones de f por curva
+PUNTOS_INICIALES = 257
+NIVEL_MAXIMO = 14                 # ancho mínimo = paso inicial / 2**NIVEL_MAXIMO
+
+ANGULO_MAXIMO = 0.08              # radianes de giro entre segmentos (en pantalla)
+SALTO_MAXIMO = 0.02               # salto vertical relativo a la altura visible
+SALTO_DISCONTINUIDAD = 0.05       # salto que sobrevive al ancho mínimo -> corte
+SEGMENTO_MINIMO = 1e-3            # segmentos más cortos ya no se refinan por curvatura
+RESOLUCION_SIGNO = 1.0 / 2000     # los cambios de signo se afinan al menos a esto
+
+
+def _escala_y(ys, ylim):
+    if ylim is not None and ylim[1] > ylim[0]:
+        return float(ylim[1] - ylim[0])
+    finitos = ys[np.isfinite(ys)]
+    if finitos.size < 2:
+        return 1.0
+    p5, p95 = np.percentile(finitos, [5, 95])
+    return float(p95 - p5) or 1.0
+
+
+def _puntajes(xs, ys, escala_x, escala_y, ancho_min, banda):
+    """Prioridad de refinamiento de cada intervalo [xs[i], xs[i+1]] (0 = no refinar)."""
+    dx = np.diff(xs)
+    dy = np.diff(ys)
+    fin = np.isfinite(ys)
+    ambos = fin[:-1] & fin[1:]
+
+    puntaje = np.zeros(dx.shape)
+
+    # Frontera de dominio (un extremo NaN y el otro no)
+    puntaje[fin[:-1] ^ fin[1:]] = 1.0
+
+    with np.errstate(all="ignore"):
+        u = dx / escala_x
+        v = np.where(ambos, dy / escala_y, 0.0)
+
+        # Saltos verticales grandes: pendiente fuerte o posible polo
+        salto = np.abs(v)
+        puntaje = np.maximum(puntaje, np.where(salto > SALTO_MAXIMO, salto, 0.0))
+
+        # Cambio de signo: raíz o polo, se afina hasta la resolución mínima
+        signo = ambos & (ys[:-1] * ys[1:] < 0) & (u > RESOLUCION_SIGNO)
+        puntaje[signo] = np.maximum(puntaje[signo], 0.5)
+
+        # Curvatura: ángulo entre segmentos consecutivos medido en pantalla
+        largo = np.hypot(u, v)
+        cos_giro = (u[:-1] * u[1:] + v[:-1] * v[1:]) / (largo[:-1] * largo[1:])
+        giro = np.arccos(np.clip(cos_giro, -1.0, 1.0))
+        giro = np.where(ambos[:-1] & ambos[1:] & np.isfinite(giro), giro, 0.0)
+        giro[(largo[:-1] < SEGMENTO_MINIMO) & (largo[1:] < SEGMENTO_MINIMO)] = 0.0
+        curvo = giro > ANGULO_MAXIMO
+        puntaje[:-1][curvo] = np.maximum(puntaje[:-1][curvo], giro[curvo])
+        puntaje[1:][curvo] = np.maximum(puntaje[1:][curvo], giro[curvo])
+
+    if banda is not None:
+        # Tramos completamente fuera de la ventana (mismo lado) no se ven
+        with np.errstate(invalid="ignore"):
+            arriba = (ys[:-1] > banda[1]) & (ys[1:] > banda[1])
+            abajo = (ys[:-1] < banda[0]) & (ys[1:] < banda[0])
+        puntaje[arriba | abajo] = 0.0
+
+    puntaje[dx <= ancho_min] = 0.0
+    return puntaje
+
+
+def _cortar_discontinuidades(xs, ys, escala_y, ancho_min):
+    """Inserta NaN en los saltos que no se cierran al refinar (asíntotas, escalones)."""
+    dx = np.diff(xs)
+    with np.errstate(all="ignore"):
+        salto = np.abs(np.diff(ys)) / escala_y
+        polo = (ys[:-1] * ys[1:] < 0) & (salto > 1.0)
+    corte = np.where(((salto > SALTO_DISCONTINUIDAD) & (dx <= 2 * ancho_min)) | polo)[0]
+    if corte.size == 0:
+        return xs, ys
+    xm = 0.5 * (xs[corte] + xs[corte + 1])
+    return np.insert(xs, corte + 1, xm), np.insert(ys, corte + 1, np.nan)
+
+
+def muestrear_adaptativo(expr, xlim, ylim=None, presupuesto=PRESUPUESTO_EVALUACIONES,
+                         puntos_iniciales=PUNTOS_INICIALES, nivel_maximo=NIVEL_MAXIMO,
+                         escala_y=None):
+    """
+    Muestrea expr (texto del usuario o función vectorizable) en xlim.
+    ylim solo se usa como escala de pantalla para decidir dónde refinar
+    (escala_y la fija directamente, sin recortar lo que quede fuera de la vista).
+    Devuelve (xs, ys) listos para ax.plot / Line2D.set_data.
+    """
+    x0, x1 = float(xlim[0]), float(xlim[1])
+    n = max(3, min(int(puntos_iniciales), int(presupuesto)))
+    xs = np.linspace(x0, x1, n)
+    ys = evaluar_vector(expr, xs)
+    usados = n
+
+    escala_x = (x1 - x0) or 1.0
+    if escala_y is None:
+        escala_y = _escala_y(ys, ylim)
+    ancho_min = escala_x / (n - 1) / (2 ** nivel_maximo)
+    banda = None
+    if ylim is not None:
+        margen = 0.25 * escala_y
+        banda = (float(ylim[0]) - margen, float(ylim[1]) + margen)
+
+    for _ in range(4 * nivel_maximo):
+        restantes = presupuesto - usados
+        if restantes <= 0:
+            break
+        puntaje = _puntajes(xs, ys, escala_x, escala_y, ancho_min, banda)
+        idx = np.flatnonzero(puntaje)
+        if idx.size == 0:
+            break
+        if idx.size > restantes:
+            # Sin presupuesto para todo: primero lo más urgente
+            idx = idx[np.argsort(-puntaje[idx], kind="stable")[:restantes]]
+            idx.sort()
+
+        xm = 0.5 * (xs[idx] + xs[idx + 1])
+        ym = evaluar_vector(expr, xm)
+        xs = np.insert(xs, idx + 1, xm)
+        ys = np.insert(ys, idx + 1, ym)
+        usados += idx.size
+
+    return _cortar_discontinuidades(xs, ys, escala_y, ancho_min)
+
+
+# =============================================================================
+#  CACHÉ DE MUESTRAS POR TEJAS (pan / zoom incremental)
+# =============================================================================
+#
+# El eje x se parte en tejas de ancho 2**nivel. Cada teja se muestrea una vez
+# por expresión y se guarda: al desplazar la vista solo se calculan las tejas
+# que entran, y al hacer zoom se sigue usando el mismo nivel mientras la vista
+# abarque entre 2 y 8 tejas (o se unen las dos tejas hijas ya calculadas).
+
+TEJAS_POR_VISTA = 4
+TEJAS_MIN, TEJAS_MAX = 2, 8
+PUNTOS_INICIALES_TEJA = 65
+CAPACIDAD_TEJAS = 512
+
+
+def nivel_para(ancho: float) -> int:
+    """Nivel de teja que deja ~TEJAS_POR_VISTA tejas dentro de un ancho visible."""
+    return int(math.floor(math.log2(max(ancho, 1e-12) / TEJAS_POR_VISTA)))
+
+
+def nivel_con_histeresis(nivel_actual, ancho: float) -> int:
+    """Conserva el nivel actual mientras la vista abarque entre TEJAS_MIN y TEJAS_MAX tejas."""
+    if nivel_actual is not None:
+        tejas = ancho / (2.0 ** nivel_actual)
+        if TEJAS_MIN <= tejas <= TEJAS_MAX:
+            return nivel_actual
+    return nivel_para(ancho)
+
+
+class CacheMuestras:
+    """
+    Caché LRU de tejas: (expresión, nivel, índice, nivel_y) -> (xs, ys).
+    nivel_y = log2 redondeado de la altura visible, porque el refinamiento
+    depende de la escala vertical.
+    """
+
+    def __init__(self, capacidad: int = CAPACIDAD_TEJAS):
+        self.capacidad = capacidad
+        self.aciertos = 0
+        self.fallos = 0
+        self._datos = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _guardar(self, clave, teja):
+        with self._lock:
+            self._datos[clave] = teja
+            self._datos.move_to_end(clave)
+            while len(self._datos) > self.capacidad:
+                self._datos.popitem(last=False)
+
+    def _buscar(self, clave):
+        with self._lock:
+            teja = self._datos.get(clave)
+            if teja is not None:
+                self._datos.move_to_end(clave)
+            return teja
+
+    def teja(self, expr, nivel: int, k: int, nivel_y: int, presupuesto: int):
+        clave = (expr, nivel, k, nivel_y)
+        teja = self._buscar(clave)
+        if teja is not None:
+            self.aciertos += 1
+            return teja
+        self.fallos += 1
+
+        # Zoom out: si las dos mitades ya están, se unen sin evaluar nada
+        izq = self._buscar((expr, nivel - 1, 2 * k, nivel_y))
+        der = self._buscar((expr, nivel - 1, 2 * k + 1, nivel_y))
+        if izq is not None and der is not None:
+            teja = (np.concatenate((izq[0], der[0][1:])), np.concatenate((izq[1], der[1][1:])))
+        else:
+            ancho = 2.0 ** nivel
+            teja = muestrear_adaptativo(
+                expr, (k * ancho, (k + 1) * ancho), presupuesto=presupuesto,
+                puntos_iniciales=PUNTOS_INICIALES_TEJA, escala_y=2.0 ** nivel_y,
+            )
+        teja[0].setflags(write=False)
+        teja[1].setflags(write=False)
+        self._guardar(clave, teja)
+        return teja
+
+    def muestras(self, expr, xlim, ylim, nivel=None, presupuesto=PRESUPUESTO_EVALUACIONES):
+        """
+        Muestras que cubren xlim, armadas con tejas del nivel dado
+        (o del que corresponda al ancho). Devuelve (xs, ys, nivel).
+        """
+        # Con ejes invertidos (xlim[0] > xlim[1]) las tejas se recorren igual
+        x0, x1 = float(min(xlim)), float(max(xlim))
+        if nivel is None:
+            nivel = nivel_para(x1 - x0)
+        ancho = 2.0 ** nivel
+        nivel_y = int(round(math.log2(max(abs(float(ylim[1] - ylim[0])), 1e-12))))
+        por_teja = max(2 * PUNTOS_INICIALES_TEJA, presupuesto // TEJAS_POR_VISTA)
+
+        xs_partes, ys_partes = [], []
+        for k in range(int(math.floor(x0 / ancho)), int(math.floor(x1 / ancho)) + 1):
+            xs_t, ys_t = self.teja(expr, nivel, k, nivel_y, por_teja)
+            if xs_partes:
+                # El borde izquierdo repite el derecho de la teja anterior
+                xs_t, ys_t = xs_t[1:], ys_t[1:]
+            xs_partes.append(xs_t)
+            ys_partes.append(ys_t)
+        return np.concatenate(xs_partes), np.concatenate(ys_partes), nivel
+
+    def estadisticas(self) -> dict:
+        with self._lock:
+            total = self.aciertos + self.fallos
+            return {
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "tasa_aciertos": (self.aciertos / total) if total else 0.0,
+                "tamano": len(self._datos),
+                "capacidad": self.capacidad,
+            }
+
+    def limpiar(self):
+        with self._lock:
+            self._datos.clear()
+            self.aciertos = 0
+            self.fallos = 0
+
+
+CACHE_MUESTRAS = CacheMuestras()
@@ -0,0 +1,187 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import nullcontext
+from functools import wraps
+
+# =============================================================================
+#  PERFIL DE ARRANQUE (traza para chrome://tracing o Perfetto)
+# =============================================================================
+#
+# Con MATHPRO_PERFIL=traza.json, Main.py anota cuánto tarda cada import de
+# safe_import, MainWindow.__init__, las páginas del menú, el primer
+# QWebEngineView y el primer pintado de la ventana, y escribe la traza al
+# pintar. Sin la variable, tramo() no hace nada.
+#
+# Como prueba sin interfaz (falla si el arranque pasa del umbral):
+#
+#     python perfil_arranque.py --max-ms 3000 -n 3 -o traza.json
+
+ORIGEN = time.perf_counter()
+RUTA = os.environ.get("MATHPRO_PERFIL") or None
+activo = RUTA is not None
+
+PRIMER_PINTADO = "primer pintado"
+
+_eventos = []
+_NULO = nullcontext()
+
+
+def _us(t):
+    return round((t - ORIGEN) * 1e6, 1)
+
+
+def habilitar(ruta=None):
+    """Empieza a registrar (si no lo estaba ya); ruta es el archivo de guardar()."""
+    global activo, RUTA
+    activo = True
+    if ruta:
+        RUTA = ruta
+
+
+class _Tramo:
+    __slots__ = ("nombre", "cat", "inicio")
+
+    def __init__(self, nombre, cat):
+        self.nombre, self.cat = nombre, cat
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        fin = time.perf_counter()
+        _eventos.append({
+            "name": self.nombre, "cat": self.cat, "ph": "X",
+            "ts": _us(self.inicio), "dur": round((fin - self.inicio) * 1e6, 1),
+            "pid": os.getpid(), "tid": threading.get_ident(),
+        })
+        return False
+
+
+def tramo(nombre, cat="arranque"):
+    """with tramo("..."): mide el bloque (no hace nada si el perfil está apagado)."""
+    return _Tramo(nombre, cat) if activo else _NULO
+
+
+def tramo_medido(nombre, cat="arranque"):
+    """
+    Decorador: mide cada llamada de la función como un tramo de la traza.
+    (No confundir con metricas.medido, que acumula tiempos para el panel.)
+    """
+    def decorador(fn):
+        @wraps(fn)
+        def envoltura(*args, **kwargs):
+            with tramo(nombre, cat):
+                return fn(*args, **kwargs)
+        return envoltura
+    return decorador
+
+
+def marca(nombre, cat="arranque"):
+    """Evento instantáneo (p. ej. el primer pintado)."""
+    if activo:
+        _eventos.append({"name": nombre, "cat": cat, "ph": "i", "s": "g",
+                         "ts": _us(time.perf_counter()),
+                         "pid": os.getpid(), "tid": threading.get_ident()})
+
+
+def traza() -> dict:
+    nombres = [{"name": "thread_name", "ph": "M", "pid": os.getpid(),
+                "tid": threading.main_thread().ident, "args": {"name": "principal"}}]
+    return {"traceEvents": nombres + list(_eventos), "displayTimeUnit": "ms"}
+
+
+def guardar(ruta=None):
+    ruta = ruta or RUTA
+    with open(ruta, "w", encoding="utf-8") as f:
+        json.dump(traza(), f)
+    return ruta
+
+
+def al_primer_pintado(ventana, salir=False):
+    """
+    Marca el primer pintado de `ventana` y guarda la traza.
+    Con salir=True cierra la aplicación después (modo prueba).
+    """
+    if not activo:
+        return
+    from PyQt6.QtCore import QEvent, QObject, QTimer
+    from PyQt6.QtWidgets import QApplication
+
+    class _Filtro(QObject):
+        def eventFilter(self, obj, ev):
+            if ev.type() == QEvent.Type.Paint:
+                obj.removeEventFilter(self)
+                marca(PRIMER_PINTADO)
+                # Después del pintado, no dentro de él
+                QTimer.singleShot(0, terminar)
+            return False
+
+    def terminar():
+        guardar()
+        if salir:
+            QApplication.instance().quit()
+
+    ventana._filtro_perfil = _Filtro(ventana)
+    ventana.installEventFilter(ventana._filtro_perfil)
+
+
+# =============================================================================
+#  PRUEBA DE ARRANQUE SIN INTERFAZ
+# =============================================================================
+
+def medir_una_vez(ruta):
+    """Lanza Main.py en un proceso nuevo (plataforma offscreen) hasta el primer pintado."""
+    entorno = dict(os.environ, MATHPRO_PERFIL=ruta, MATHPRO_PERFIL_SALIR="1",
+                   MATHPRO_PRECARGA="0")
+    entorno.setdefault("QT_QPA_PLATFORM", "offscreen")
+    inicio = time.perf_counter()
+    subprocess.run([sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Main.py")],
+                   env=entorno, check=True, timeout=300)
+    total = (time.perf_counter() - inicio) * 1000
+    with open(ruta, encoding="utf-8") as f:
+        eventos = json.load(f)["traceEvents"]
+    pintado = next(e["ts"] for e in eventos if e["name"] == PRIMER_PINTADO) / 1000
+    return pintado, total, eventos
+
+
+def main(argv=None):
+    import argparse
+    p = argparse.ArgumentParser(description="Mide el arranque de MathPro hasta el primer pintado.")
+    p.add_argument("--max-ms", type=float, default=3000,
+                   help="umbral para el primer pintado (mediana), en ms")
+    p.add_argument("-n", "--repeticiones", type=int, default=3)
+    p.add_argument("-o", "--salida", help="guardar la traza de la última ejecución")
+    args = p.parse_args(argv)
+
+    pintados, totales = [], []
+    with tempfile.TemporaryDirectory() as tmp:
+        for k in range(max(1, args.repeticiones)):
+            pintado, total, eventos = medir_una_vez(os.path.join(tmp, f"traza{k}.json"))
+            pintados.append(pintado)
+            totales.append(total)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": eventos, "displayTimeUnit": "ms"}, f)
+
+    # Tramos más largos de la última ejecución
+    tramos = sorted((e for e in eventos if e.get("ph") == "X"), key=lambda e: -e["dur"])
+    for e in tramos[:10]:
+        print(f"{e['dur'] / 1000:9.1f} ms  {e['name']}")
+    mediana = statistics.median(pintados)
+    print(f"primer pintado: mediana {mediana:.0f} ms (proceso completo {statistics.median(totales):.0f} ms), "
+          f"umbral {args.max_ms:.0f} ms")
+    if mediana > args.max_ms:
+        print("ARRANQUE MÁS LENTO QUE EL UMBRAL", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,305 @@
+import json
+import os
+from functools import lru_cache
+from html import escape
+
+from PyQt6.QtCore import QFile, QIODevice, QObject, QTimer, QUrl, pyqtSlot
+from PyQt6.QtWebChannel import QWebChannel
+from PyQt6.QtWebEngineWidgets import QWebEngineView
+
+from cache_latex import CACHE
+import metricas
+from perfil_arranque import tramo
+
+# =============================================================================
+#  RENDER LATEX CON MATHJAX (página persistente por vista)
+# =============================================================================
+#
+# Antes cada cálculo hacía setHtml de un documento completo que volvía a
+# descargar e iniciar MathJax desde el CDN (y sin internet no se veía nada).
+# Ahora cada VistaMathJax carga UNA vez una página base con MathJax y el
+# contenido nuevo se envía con runJavaScript: solo se reemplaza el fragmento
+# y MathJax compone únicamente los bloques que entran en pantalla.
+#
+# MathJax se busca primero en ./mathjax (o en la carpeta de MATHPRO_MATHJAX);
+# si no está, se usa el CDN. La copia local no viene en el repositorio (ver
+# "MathJax sin conexión" en el README): sin ella y sin internet, la página
+# muestra un aviso y las fórmulas quedan como texto LaTeX.
+#
+# La salida es SVG autocontenido (sin caché de glifos compartida) para que
+# cada fórmula compuesta se pueda guardar en cache_latex y volver a insertar
+# tal cual en cualquier vista sin pasar por MathJax.
+
+DIR_MODULO = os.path.dirname(os.path.abspath(__file__))
+DIR_MATHJAX = os.environ.get("MATHPRO_MATHJAX") or os.path.join(DIR_MODULO, "mathjax")
+ARCHIVO_MATHJAX = "tex-mml-svg.js"
+URL_CDN = "https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-svg.js"
+
+
+def ruta_mathjax_local():
+    """tex-mml-svg.js del paquete local (carpeta es5 de mathjax@3 o su contenido), o None."""
+    for sub in ("es5", ""):
+        ruta = os.path.join(DIR_MATHJAX, sub, ARCHIVO_MATHJAX)
+        if os.path.isfile(ruta):
+            return ruta
+    return None
+
+
+@lru_cache(maxsize=1)
+def _qwebchannel_js() -> str:
+    """qwebchannel.js de los recursos de Qt (se incrusta en la página base)."""
+    f = QFile(":/qtwebchannel/qwebchannel.js")
+    if not f.open(QIODevice.OpenModeFlag.ReadOnly):
+        return ""
+    try:
+        return bytes(f.readAll()).decode("utf-8")
+    finally:
+        f.close()
+
+
+# --- JS de la página base: window.MathPro ---
+#
+# mostrar(html)           reemplaza el contenido
+# agregar(html, destino)  agrega un bloque al final de destino (id o elemento)
+# conObjetos(fn)          fn(objetos del QWebChannel) cuando el canal esté listo
+#
+# Se componen por separado los hijos de cada contenedor; un hijo con el
+# atributo data-bloques se recorre a su vez (sus hijos son los bloques).
+# Cada fórmula compuesta se envía a Python (objeto 'latex') para la caché,
+# junto con lo que tardó MathJax (para metricas).
+_MOTOR_JS = """
+(function () {
+  var contenido = document.getElementById('contenido');
+  var pendientes = [], cola = Promise.resolve();
+  var objetos = null, esperando = [];
+
+  function listo() { return window.MathJax && MathJax.typesetPromise; }
+  function componer() {
+    if (!pendientes.length || !listo()) return;
+    var lote = pendientes.splice(0), t0 = 0;
+    cola = cola.then(function () { t0 = performance.now(); return MathJax.typesetPromise(lote); })
+               .then(function () { informar(lote, performance.now() - t0); })
+               .catch(function (e) { console.log(e); });
+  }
+  function informar(lote, ms) {
+    var nuevas = [];
+    MathJax.startup.document.getMathItemsWithin(lote).forEach(function (m) {
+      if (m.typesetRoot && !m.informada) {
+        m.informada = true;
+        nuevas.push([m.math, m.display, m.typesetRoot.outerHTML]);
+      }
+    });
+    window.MathPro.conObjetos(function (o) {
+      if (!o.latex) return;
+      o.latex.compuesto(ms, nuevas.length);
+      if (nuevas.length) o.latex.guardar(JSON.stringify(nuevas));
+    });
+  }
+
+  var vista = new IntersectionObserver(function (entradas) {
+    entradas.forEach(function (e) {
+      if (e.isIntersecting) {
+        vista.unobserve(e.target);
+        pendientes.push(e.target);
+      }
+    });
+    componer();
+  }, {rootMargin: '300px 0px'});
+
+  function observar(el) {
+    // Texto suelto (p. ej. "$$ f(x) $$" directo en el contenedor): todo junto
+    for (var n = el.firstChild; n; n = n.nextSibling) {
+      if (n.nodeType === 3 && n.textContent.trim()) { vista.observe(el); return; }
+    }
+    for (var i = 0; i < el.children.length; i++) {
+      var hijo = el.children[i];
+      if (hijo.hasAttribute('data-bloques')) observar(hijo);
+      else vista.observe(hijo);
+    }
+  }
+
+  window.MathPro = {
+    mostrar: function (html) {
+      vista.disconnect();
+      pendientes = [];
+      if (listo() && MathJax.typesetClear) MathJax.typesetClear([contenido]);
+      contenido.innerHTML = html;
+      window.scrollTo(0, 0);
+      observar(contenido);
+    },
+    agregar: function (html, destino) {
+      var padre = typeof destino === 'string' ? document.getElementById(destino)
+                                              : (destino || contenido);
+      var bloque = document.createElement('div');
+      bloque.innerHTML = html;
+      padre.appendChild(bloque);
+      observar(bloque);
+      return bloque;
+    },
+    conObjetos: function (fn) {
+      if (objetos) fn(objetos); else esperando.push(fn);
+    },
+    mathjaxListo: componer
+  };
+
+  if (window.qt && window.QWebChannel) {
+    new QWebChannel(qt.webChannelTransport, function (canal) {
+      objetos = canal.objects;
+      esperando.splice(0).forEach(function (fn) { fn(objetos); });
+    });
+  }
+})();
+"""
+
+# Aviso visible cuando MathJax no se pudo cargar (sin copia local ni CDN) o
+# no terminó de cargar en ESPERA_MATHJAX_MS
+ESPERA_MATHJAX_MS = 20000
+_AVISO_JS = """
+function mathjaxNoDisponible() {
+  function poner() {
+    if (document.getElementById('sin-mathjax')) return;
+    var aviso = document.createElement('div');
+    aviso.id = 'sin-mathjax';
+    aviso.style.cssText = 'background:#fff3cd;color:#664d03;border:1px solid #ffe69c;' +
+      'border-radius:8px;padding:10px 14px;margin-bottom:10px;font-family:sans-serif;';
+    aviso.textContent = 'MathJax no disponible: sin conexión y sin copia local, las ' +
+      'fórmulas se muestran como LaTeX. Ver "MathJax sin conexión" en el README.';
+    document.body.insertBefore(aviso, document.body.firstChild);
+  }
+  if (document.body) poner(); else document.addEventListener('DOMContentLoaded', poner);
+}
+setTimeout(function () {
+  if (!(window.MathJax && MathJax.typesetPromise)) mathjaxNoDisponible();
+}, %d);
+""" % ESPERA_MATHJAX_MS
+
+_CONFIG_MATHJAX = """
+window.MathJax = {
+  svg: {fontCache: 'none'},
+  startup: {
+    typeset: false,
+    pageReady: function () {
+      return MathJax.startup.defaultPageReady().then(function () {
+        if (window.MathPro) MathPro.mathjaxListo();
+      });
+    }
+  }
+};
+"""
+
+
+def pagina_base(estilos: str = "", canal: bool = False) -> str:
+    """Documento que se carga una sola vez en cada VistaMathJax."""
+    local = ruta_mathjax_local()
+    src = QUrl.fromLocalFile(local).toString() if local else URL_CDN
+    # Si el paquete local falla al cargar, se intenta con el CDN; si el CDN
+    # también falla, se muestra el aviso
+    respaldo = ("var s=document.createElement('script');s.async=true;"
+                "s.onerror=mathjaxNoDisponible;"
+                f"s.src='{URL_CDN}';document.head.appendChild(s);")
+    partes = [
+        "<!DOCTYPE html><html><head><meta charset='utf-8'>",
+        "<style>", estilos, "</style>",
+        "<script>", _AVISO_JS, _CONFIG_MATHJAX, "</script>",
+        f"<script id='MathJax-script' async src=\"{escape(src)}\"",
+        f" onerror=\"{respaldo if local else 'mathjaxNoDisponible()'}\"></script>",
+        "</head><body><div id='contenido'></div>",
+    ]
+    if canal:
+        partes += ["<script>", _qwebchannel_js(), "</script>"]
+    partes += ["<script>", _MOTOR_JS, "</script></body></html>"]
+    return "".join(partes)
+
+
+class PuenteCacheLatex(QObject):
+    """
+    Recibe de la página las fórmulas recién compuestas y las guarda en la
+    caché; también el tiempo de cada composición de MathJax (metricas).
+    """
+
+    def __init__(self, cache, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+
+    @pyqtSlot(str)
+    def guardar(self, lote_json):
+        for latex, bloque, svg in json.loads(lote_json):
+            self.cache.guardar(latex, bool(bloque), svg)
+
+    @pyqtSlot(float, int)
+    def compuesto(self, ms, formulas):
+        metricas.sumar("mathjax: composición", ms / 1000)
+        metricas.contar("mathjax: fórmulas compuestas", formulas)
+
+
+class VistaMathJax(QWebEngineView):
+    """
+    QWebEngineView con la página base (estilos + MathJax) cargada una vez.
+    mostrar(html) reemplaza el contenido y agregar(html) lo extiende, sin
+    volver a cargar la página. Lo que se pida antes de que termine la carga
+    se envía al terminar. Las fórmulas que ya están en `cache` llegan
+    como SVG y MathJax solo compone las nuevas.
+    """
+
+    def __init__(self, estilos: str = "", parent=None, cache=CACHE):
+        with tramo("QWebEngineView()", "web"):
+            super().__init__(parent)
+        self.estilos = estilos
+        self.cache = cache
+        self._lista = False
+        self._cargada = False
+        self._pendientes = []
+        self._ultimo = None     # último mostrar(), por si hay que recargar la base
+        self._canal = None
+        self.loadFinished.connect(self._al_cargar)
+        if cache is not None:
+            self.registrar("latex", PuenteCacheLatex(cache, self))
+        # Se carga al volver al bucle de eventos: da tiempo a registrar objetos
+        QTimer.singleShot(0, self._cargar)
+
+    def registrar(self, nombre: str, objeto):
+        """Expone objeto a la página como MathPro.conObjetos(o => o[nombre])."""
+        if self._canal is None:
+            self._canal = QWebChannel(self)
+            self.page().setWebChannel(self._canal)
+        self._canal.registerObject(nombre, objeto)
+        if self._cargada:
+            # El cliente JS solo ve los objetos registrados al iniciar
+            if self._lista:
+                self._pendientes = [self._ultimo] if self._ultimo else []
+            self._cargar()
+
+    def _cargar(self):
+        self._cargada = True
+        self._lista = False
+        self.setHtml(pagina_base(self.estilos, self._canal is not None),
+                     QUrl.fromLocalFile(DIR_MODULO + os.sep))
+
+    def _al_cargar(self, ok):
+        self._lista = True
+        pendientes, self._pendientes = self._pendientes, []
+        for js in pendientes:
+            self.page().runJavaScript(js)
+
+    def _ejecutar(self, js: str):
+        if self._lista:
+            self.page().runJavaScript(js)
+        else:
+            self._pendientes.append(js)
+
+    @metricas.medido("vista: enviar html")
+    def mostrar(self, html: str, guion: str = ""):
+        """Reemplaza el contenido; guion (JS) se ejecuta después, en la misma llamada."""
+        if self.cache is not None:
+            html = self.cache.sustituir(html)
+        js = f"MathPro.mostrar({json.dumps(html)});{guion}"
+        self._ultimo = js
+        if not self._lista:
+            self._pendientes = []   # lo anterior ya no se vería
+        self._ejecutar(js)
+
+    @metricas.medido("vista: enviar html")
+    def agregar(self, html: str, destino: str = None):
+        if self.cache is not None:
+            html = self.cache.sustituir(html)
+        self._ejecutar(f"MathPro.agregar({json.dumps(html)}, {json.dumps(destino)});")
@@ -0,0 +1,144 @@
+import json
+
+from PyQt6.QtCore import QObject, pyqtSlot
+
+from metricas import medido
+
+# =============================================================================
+#  REPORTE PASO A PASO PAGINADO (Bisección, Newton, Secante, Falsa Posición)
+# =============================================================================
+#
+# El procedimiento no se arma como un solo documento con todas las
+# iteraciones. La vista (VistaMathJax de render_mathjax) recibe solo la
+# cabecera, la primera página de pasos y el cuadro final; el resto de páginas
+# se pide a Python (QWebChannel) cuando el usuario se acerca al final de lo
+# cargado, y se formatea en ese momento desde el Historial. MathJax compone
+# cada bloque cuando entra en pantalla. Así la primera pantalla tarda lo mismo
+# con 10 iteraciones que con un millón.
+
+FILAS_POR_PAGINA = 50
+
+_GUION_PAGINAS = """
+(function (cfg) {
+  var pasos = document.getElementById('pasos');
+  var mas = document.getElementById('mas');
+  if (!mas) return;
+  var siguiente = 1, pidiendo = false, puente = null;
+
+  function texto() {
+    var hasta = Math.min(siguiente * cfg.porPagina, cfg.total);
+    return 'Iteraciones 1–' + hasta + ' de ' + cfg.total + ' · desplázate para ver más';
+  }
+  function cerca() {
+    return mas.getBoundingClientRect().top < window.innerHeight + 800;
+  }
+  function pedir() {
+    if (pidiendo || !puente || siguiente >= cfg.paginas) return;
+    pidiendo = true;
+    puente.pagina(cfg.id, siguiente, function (html) {
+      pidiendo = false;
+      if (!html) return;   // reporte reemplazado
+      MathPro.agregar(html, pasos);
+      siguiente++;
+      if (siguiente >= cfg.paginas) {
+        carga.disconnect();
+        mas.remove();
+      } else {
+        mas.textContent = texto();
+        if (cerca()) pedir();
+      }
+    });
+  }
+  var carga = new IntersectionObserver(function (e) {
+    if (e[0].isIntersecting) pedir();
+  }, {rootMargin: '800px 0px'});
+
+  MathPro.conObjetos(function (o) {
+    puente = o.reporte;
+    carga.observe(mas);
+  });
+})(%s);
+"""
+
+
+class Reporte:
+    """
+    Procedimiento de un método sobre su Historial.
+    paso(registro) -> html de una iteración; cabecera y final son html fijo.
+    No formatea nada al crearse: cada página se arma cuando se pide.
+    """
+
+    def __init__(self, historial, paso, cabecera, final, filas_por_pagina=FILAS_POR_PAGINA):
+        self.historial = historial
+        self.paso = paso
+        self.cabecera = cabecera
+        self.final = final
+        self.filas_por_pagina = filas_por_pagina
+
+    @property
+    def paginas(self) -> int:
+        return max(1, -(-len(self.historial) // self.filas_por_pagina))
+
+    @medido("reporte: html de página")
+    def pagina(self, k: int) -> str:
+        inicio = k * self.filas_por_pagina
+        fin = min(inicio + self.filas_por_pagina, len(self.historial))
+        historial, paso = self.historial, self.paso
+        return "".join(paso(historial[j]) for j in range(inicio, fin))
+
+    @medido("reporte: html inicial")
+    def fragmento(self) -> str:
+        """Contenido inicial: cabecera, primera página, aviso de carga y cuadro final."""
+        total = len(self.historial)
+        partes = [
+            "<div id='cabecera' data-bloques>", self.cabecera, "</div>",
+            "<div id='pasos' data-bloques><div data-bloques>", self.pagina(0), "</div></div>",
+        ]
+        if self.paginas > 1:
+            hasta = min(self.filas_por_pagina, total)
+            partes.append("<div id='mas' style='text-align:center; color:#888; padding:15px; "
+                          f"font-size:13px;'>Iteraciones 1–{hasta} de {total} · "
+                          "desplázate para ver más</div>")
+        partes += ["<div id='final' data-bloques>", self.final, "</div>"]
+        return "".join(partes)
+
+    def guion(self, id_reporte: int) -> str:
+        """JS que pide las páginas siguientes (vacío si todo cabe en una)."""
+        if self.paginas == 1:
+            return ""
+        cfg = {"id": id_reporte, "paginas": self.paginas,
+               "porPagina": self.filas_por_pagina, "total": len(self.historial)}
+        return _GUION_PAGINAS % json.dumps(cfg)
+
+
+class PuenteReporte(QObject):
+    """
+    Muestra un Reporte en una VistaMathJax y atiende desde Python los
+    pedidos de páginas (objeto 'reporte' del QWebChannel de la vista).
+    """
+
+    def __init__(self, vista):
+        super().__init__(vista)
+        self.vista = vista
+        self.reporte = None
+        self._id = 0
+        vista.registrar("reporte", self)
+
+    def mostrar(self, reporte: Reporte):
+        self._id += 1
+        self.reporte = reporte
+        self.vista.mostrar(reporte.fragmento(), reporte.guion(self._id))
+
+    def limpiar(self):
+        self._id += 1
+        self.reporte = None
+        self.vista.mostrar("")
+
+    @pyqtSlot(int, int, result=str)
+    def pagina(self, id_reporte, k):
+        # Un contenido anterior todavía puede pedir páginas mientras se reemplaza
+        if self.reporte is None or id_reporte != self._id:
+            return ""
+        html = self.reporte.pagina(k)
+        cache = self.vista.cache
+        return html if cache is None else cache.sustituir(html)
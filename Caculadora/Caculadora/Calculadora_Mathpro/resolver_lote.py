@@ -0,0 +1,170 @@
+"""
+Resolución de raíces en lote desde la línea de comandos (sin interfaz).
+
+Lee un CSV o JSONL con columnas:
+    expresion, metodo, a, b, x0, x1, tol, max_iter   (+ id y derivada opcionales)
+y escribe un JSON por fila (en el mismo orden) a medida que se resuelven.
+
+    python resolver_lote.py ejercicios.csv -o resultados.jsonl -j 8
+
+metodo: biseccion | falsa_posicion | newton_raphson | secante
+  - biseccion / falsa_posicion usan a y b
+  - newton_raphson usa x0 (derivada opcional; si falta se calcula con SymPy)
+  - secante usa x0 y x1
+"""
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from solucionadores import METODOS
+
+TOL_DEFECTO = 0.0001      # mismos valores por defecto que las ventanas
+MAX_ITER_DEFECTO = 100
+
+ALIAS_METODOS = {
+    "biseccion": "biseccion", "bisección": "biseccion",
+    "falsa_posicion": "falsa_posicion", "falsa posicion": "falsa_posicion",
+    "falsa posición": "falsa_posicion", "regula_falsi": "falsa_posicion",
+    "newton": "newton_raphson", "newton_raphson": "newton_raphson",
+    "newton-raphson": "newton_raphson",
+    "secante": "secante",
+}
+
+
+# =============================================================================
+#  LECTURA
+# =============================================================================
+
+def leer_filas(ruta: str, formato: str = None):
+    """Devuelve la lista de filas (dicts) del archivo; '-' lee de la entrada estándar."""
+    if formato is None:
+        formato = "jsonl" if ruta.lower().endswith((".jsonl", ".json", ".ndjson")) else "csv"
+
+    archivo = sys.stdin if ruta == "-" else open(ruta, encoding="utf-8-sig", newline="")
+    try:
+        if formato == "jsonl":
+            return [json.loads(linea) for linea in archivo if linea.strip()]
+        return list(csv.DictReader(archivo))
+    finally:
+        if archivo is not sys.stdin:
+            archivo.close()
+
+
+def _numero(fila, clave, defecto=None):
+    valor = fila.get(clave)
+    if valor is None or (isinstance(valor, str) and not valor.strip()):
+        if defecto is None:
+            raise ValueError(f"falta la columna '{clave}'")
+        return defecto
+    return float(valor)
+
+
+# =============================================================================
+#  RESOLUCIÓN (se ejecuta dentro de cada proceso)
+# =============================================================================
+#
+# Cada proceso conserva su propia caché de expresiones compiladas (y de
+# derivadas), así que las filas repetidas de un mismo ejercicio solo se
+# parsean una vez por proceso.
+
+def resolver_fila(numerada):
+    """(número de fila, fila) -> dict listo para serializar."""
+    n, fila = numerada
+    salida = {"fila": n}
+    try:
+        # Una línea JSONL válida que no es un objeto ([1, 2], "x", 3) es un
+        # error de esa fila, no del lote
+        if not isinstance(fila, dict):
+            raise ValueError(f"la fila no es un objeto JSON: {json.dumps(fila)[:60]}")
+        if fila.get("id") not in (None, ""):
+            salida["id"] = fila["id"]
+
+        expr = (fila.get("expresion") or fila.get("expr") or "").strip()
+        if not expr:
+            raise ValueError("falta la columna 'expresion'")
+        nombre = ALIAS_METODOS.get(str(fila.get("metodo", "")).strip().lower())
+        if nombre is None:
+            raise ValueError(f"método desconocido: {fila.get('metodo')!r}")
+
+        tol = _numero(fila, "tol", TOL_DEFECTO)
+        imax = int(_numero(fila, "max_iter", MAX_ITER_DEFECTO))
+        metodo = METODOS[nombre]
+
+        if nombre in ("biseccion", "falsa_posicion"):
+            res = metodo(expr, _numero(fila, "a"), _numero(fila, "b"), tol, imax)
+        elif nombre == "newton_raphson":
+            derivada = (fila.get("derivada") or "").strip() or None
+            res = metodo(expr, _numero(fila, "x0"), tol, imax, derivada=derivada)
+        else:
+            res = metodo(expr, _numero(fila, "x0"), _numero(fila, "x1"), tol, imax)
+
+        salida.update(res.como_dict())
+        if salida["raiz"] is not None and not math.isfinite(salida["raiz"]):
+            salida["raiz"] = None
+    except Exception as e:
+        salida["error"] = str(e) or type(e).__name__
+    return salida
+
+
+# =============================================================================
+#  LÍNEA DE COMANDOS
+# =============================================================================
+
+def _argumentos(argv=None):
+    p = argparse.ArgumentParser(
+        description="Resuelve en lote ejercicios de raíces (CSV o JSONL) y escribe JSONL.")
+    p.add_argument("entrada", help="archivo .csv o .jsonl ('-' para la entrada estándar)")
+    p.add_argument("-o", "--salida", default="-", help="archivo JSONL de salida (por defecto, stdout)")
+    p.add_argument("-f", "--formato", choices=("csv", "jsonl"),
+                   help="formato de la entrada (por defecto, según la extensión)")
+    p.add_argument("-j", "--procesos", type=int, default=os.cpu_count() or 1,
+                   help="procesos de trabajo (1 = sin pool)")
+    p.add_argument("--chunksize", type=int, default=0,
+                   help="filas por envío a cada proceso (0 = automático)")
+    return p.parse_args(argv)
+
+
+def main(argv=None):
+    args = _argumentos(argv)
+    filas = list(enumerate(leer_filas(args.entrada, args.formato), start=1))
+    procesos = max(1, min(args.procesos, len(filas) or 1))
+    # Lotes grandes: el costo de enviar cada fila a otro proceso supera al de resolverla
+    chunksize = args.chunksize or max(1, len(filas) // (procesos * 16))
+
+    salida = sys.stdout if args.salida == "-" else open(args.salida, "w", encoding="utf-8")
+    inicio = time.perf_counter()
+    errores = 0
+    pool = None
+    try:
+        if procesos == 1:
+            resultados = map(resolver_fila, filas)
+        else:
+            pool = ProcessPoolExecutor(max_workers=procesos)
+            resultados = pool.map(resolver_fila, filas, chunksize=chunksize)
+
+        # Se escribe en orden a medida que llegan los lotes
+        for r in resultados:
+            errores += "error" in r
+            salida.write(json.dumps(r, ensure_ascii=False) + "\n")
+    finally:
+        if pool is not None:
+            # Si la escritura falla o hay Ctrl+C, los lotes que no empezaron se
+            # cancelan y se espera a los procesos en vez de dejarlos sueltos
+            pool.shutdown(cancel_futures=True)
+        if salida is not sys.stdout:
+            salida.close()
+
+    total = time.perf_counter() - inicio
+    tasa = len(filas) / total if total > 0 else float("inf")
+    print(f"{len(filas)} filas en {total:.2f} s ({tasa:,.0f} resoluciones/s, "
+          f"{procesos} proceso(s), {errores} con error)", file=sys.stderr)
+    return 1 if errores else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
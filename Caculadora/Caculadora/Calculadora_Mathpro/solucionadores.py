@@ -0,0 +1,367 @@
+import math
+from array import array
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Optional
+
+from metricas import instrumentar
+from motor_expresiones import compilar
+
+# =============================================================================
+#  SOLUCIONADORES SIN INTERFAZ (Bisección, Newton, Secante, Falsa Posición)
+# =============================================================================
+#
+# Los mismos bucles que usan las ventanas, pero sin PyQt6 ni matplotlib:
+# cada método devuelve un ResultadoRaiz con el historial de iteraciones y las
+# ventanas solo se encargan de pintarlo (tabla, gráfica y reporte HTML).
+# Así se puede resolver en lote desde un script sin abrir la interfaz.
+#
+# `expr` es el texto del usuario (se compila una vez con la caché del motor)
+# o cualquier función f(x) -> float.
+#
+# Todos aceptan dos ganchos opcionales para ejecutarlos en segundo plano:
+#   al_iterar(historial)  se llama tras cada iteración (la nueva es historial[-1])
+#   cancelar() -> bool    se consulta antes de cada iteración; True detiene el bucle
+
+CERO = 1e-15   # |f(x)| (o denominador) que ya se considera cero
+
+# Motivos de parada cuando el método no converge
+MAX_ITER = "max_iter"
+VALOR_NAN = "nan"
+DERIVADA_CERO = "derivada_cero"
+DIVISION_CERO = "division_cero"
+F_IGUALES = "f_iguales"
+CANCELADO = "cancelado"
+
+
+class ErrorBolzano(ValueError):
+    """f(a) y f(b) tienen el mismo signo: el intervalo no encierra una raíz."""
+
+
+# =============================================================================
+#  REGISTROS DE ITERACIÓN
+# =============================================================================
+#
+# COLUMNAS son los campos que muestra la tabla de cada ventana, en orden.
+
+@dataclass
+class IteracionIntervalo:
+    """Una iteración de bisección o falsa posición (intervalo antes de actualizar)."""
+    i: int
+    a: float
+    b: float
+    fa: float
+    fb: float
+    c: float
+    fc: float
+    error: float
+
+    COLUMNAS = ("i", "a", "b", "c", "fc", "error")
+
+    def fila(self):
+        """Columnas de la tabla: n, a, b, c, f(c), error %."""
+        return tuple(getattr(self, c) for c in self.COLUMNAS)
+
+
+@dataclass
+class IteracionNewton:
+    i: int
+    x: float
+    fx: float
+    dfx: float
+    x_sig: float
+    error: float
+
+    COLUMNAS = ("i", "x", "fx", "dfx", "error")
+
+    def fila(self):
+        """Columnas de la tabla: n, xₙ, f(xₙ), f'(xₙ), error %."""
+        return tuple(getattr(self, c) for c in self.COLUMNAS)
+
+
+@dataclass
+class IteracionSecante:
+    i: int
+    x_ant: float
+    f_ant: float
+    x: float
+    fx: float
+    x_sig: float
+    error: float
+
+    COLUMNAS = ("i", "x_ant", "x", "fx", "x_sig", "error")
+
+    def fila(self):
+        """Columnas de la tabla: n, xₙ₋₁, xₙ, f(xₙ), xₙ₊₁, error %."""
+        return tuple(getattr(self, c) for c in self.COLUMNAS)
+
+
+class Historial:
+    """
+    Iteraciones guardadas por columnas en array('d') (8 bytes por valor) en
+    lugar de un objeto por iteración: un millón de iteraciones de bisección
+    ocupan ~64 MB. historial[k] arma el registro solo cuando se pide.
+    Se puede leer desde otro hilo mientras el método sigue agregando filas.
+    """
+
+    def __init__(self, tipo):
+        self.tipo = tipo
+        self.campos = tuple(f.name for f in fields(tipo))
+        self.columnas = tuple(array("d") for _ in self.campos)
+        self._append = tuple(col.append for col in self.columnas)
+
+    def agregar(self, *valores):
+        for append, v in zip(self._append, valores):
+            append(v)
+
+    def columna(self, campo: str) -> array:
+        return self.columnas[self.campos.index(campo)]
+
+    def __len__(self):
+        # La última columna se llena al final: una fila contada ya está completa
+        return len(self.columnas[-1])
+
+    def __getitem__(self, k):
+        valores = [col[k] for col in self.columnas]
+        valores[0] = int(valores[0])   # el número de iteración
+        return self.tipo(*valores)
+
+    def __iter__(self):
+        for k in range(len(self)):
+            yield self[k]
+
+
+@dataclass
+class ResultadoRaiz:
+    """
+    Resultado de un método. `raiz` es la última aproximación aunque no haya
+    convergido; `motivo` dice por qué se detuvo (None si convergió).
+    a y b son el último intervalo en los métodos cerrados.
+    """
+    metodo: str
+    raiz: Optional[float]
+    convergio: bool
+    historial: Historial
+    motivo: Optional[str] = None
+    a: Optional[float] = None
+    b: Optional[float] = None
+    derivada: Optional[str] = None
+
+    @property
+    def iteraciones(self) -> int:
+        return len(self.historial)
+
+    def como_dict(self) -> dict:
+        """Resumen plano (sin historial) para exportar o serializar."""
+        return {
+            "metodo": self.metodo,
+            "raiz": self.raiz,
+            "convergio": self.convergio,
+            "iteraciones": self.iteraciones,
+            "motivo": self.motivo,
+        }
+
+
+def _funcion(expr):
+    f = compilar(expr) if isinstance(expr, str) else expr
+    return instrumentar("raíces: f(x)", f)
+
+
+@lru_cache(maxsize=256)
+def derivar(expr: str) -> str:
+    """Derivada simbólica de expr respecto a x, como texto evaluable (SymPy perezoso)."""
+    from sympy import Symbol, diff
+    return str(diff(compilar(expr).sympy, Symbol("x")))
+
+
+def _comprobar_bolzano(fa, fb):
+    if fa * fb > 0:
+        raise ErrorBolzano("f(a) y f(b) deben tener signos opuestos para iniciar el método.")
+
+
+# =============================================================================
+#  MÉTODOS CERRADOS
+# =============================================================================
+
+def biseccion(expr, a: float, b: float, tol: float, imax: int,
+              al_iterar=None, cancelar=None) -> ResultadoRaiz:
+    """Bisección; se detiene con |f(c)| < CERO o error porcentual < tol."""
+    f = _funcion(expr)
+    fa, fb = f(a), f(b)
+    _comprobar_bolzano(fa, fb)
+
+    res = ResultadoRaiz("biseccion", None, False, Historial(IteracionIntervalo), motivo=MAX_ITER)
+    agregar = res.historial.agregar
+    c = 0.5 * (a + b)
+    last_c = 0
+    for i in range(1, imax + 1):
+        if cancelar is not None and cancelar():
+            res.motivo = CANCELADO
+            break
+
+        c = (a + b) / 2.0
+        fc = f(c)
+
+        if i > 1 and c != 0:
+            err_p = abs((c - last_c) / c) * 100
+        else:
+            err_p = 100.0
+
+        agregar(i, a, b, fa, fb, c, fc, err_p)
+        if al_iterar is not None:
+            al_iterar(res.historial)
+
+        if abs(fc) < CERO or err_p < tol:
+            res.convergio, res.motivo = True, None
+            break
+
+        if fa * fc < 0:
+            b, fb = c, fc
+        else:
+            a, fa = c, fc
+        last_c = c
+
+    res.raiz, res.a, res.b = c, a, b
+    return res
+
+
+def falsa_posicion(expr, a: float, b: float, tol: float, imax: int,
+                   al_iterar=None, cancelar=None) -> ResultadoRaiz:
+    """Regula falsi; se detiene con |f(c)| < CERO o |b - a| < tol."""
+    f = _funcion(expr)
+    fa, fb = f(a), f(b)
+    _comprobar_bolzano(fa, fb)
+
+    res = ResultadoRaiz("falsa_posicion", None, False, Historial(IteracionIntervalo), motivo=MAX_ITER)
+    agregar = res.historial.agregar
+    c = None
+    for i in range(1, imax + 1):
+        if cancelar is not None and cancelar():
+            res.motivo = CANCELADO
+            break
+        if fa == fb:
+            res.motivo = F_IGUALES
+            break
+
+        c = b - (fb * (a - b)) / (fa - fb)
+        fc = f(c)
+
+        error = abs(b - a)
+        err_p = (error / abs(c)) * 100 if abs(c) > CERO else 100
+
+        agregar(i, a, b, fa, fb, c, fc, err_p)
+        if al_iterar is not None:
+            al_iterar(res.historial)
+
+        if abs(fc) < CERO or error < tol:
+            res.convergio, res.motivo = True, None
+            break
+
+        if fa * fc < 0:
+            b, fb = c, fc
+        else:
+            a, fa = c, fc
+
+    if not res.convergio:
+        # Punto de la recta secante sobre el último intervalo
+        c = b - (fb * (a - b)) / (fa - fb) if fa != fb else (a if c is None else c)
+    res.raiz, res.a, res.b = c, a, b
+    return res
+
+
+# =============================================================================
+#  MÉTODOS ABIERTOS
+# =============================================================================
+
+def newton_raphson(expr, x0: float, tol: float, imax: int, derivada=None,
+                   al_iterar=None, cancelar=None) -> ResultadoRaiz:
+    """
+    Newton-Raphson. `derivada` es el texto (o función) de f'(x); si se omite
+    y expr es texto, se obtiene con SymPy.
+    """
+    if derivada is None:
+        derivada = derivar(expr)
+    f, df = _funcion(expr), _funcion(derivada)
+
+    res = ResultadoRaiz("newton_raphson", None, False, Historial(IteracionNewton), motivo=MAX_ITER,
+                        derivada=derivada if isinstance(derivada, str) else None)
+    agregar = res.historial.agregar
+    x_n = float(x0)
+    for i in range(1, imax + 1):
+        if cancelar is not None and cancelar():
+            res.motivo = CANCELADO
+            break
+
+        fx = f(x_n)
+        dfx = df(x_n)
+
+        if math.isnan(fx) or math.isnan(dfx):
+            res.motivo = VALOR_NAN
+            break
+        if abs(dfx) < CERO:
+            res.motivo = DERIVADA_CERO
+            break
+
+        x_next = x_n - (fx / dfx)
+        err = abs((x_next - x_n) / x_next) * 100 if x_next != 0 else 100
+
+        agregar(i, x_n, fx, dfx, x_next, err)
+        if al_iterar is not None:
+            al_iterar(res.historial)
+        x_n = x_next
+
+        if abs(fx) < CERO or err < tol:
+            res.convergio, res.motivo = True, None
+            break
+
+    res.raiz = x_n
+    return res
+
+
+def secante(expr, x0: float, x1: float, tol: float, imax: int,
+            al_iterar=None, cancelar=None) -> ResultadoRaiz:
+    """Secante a partir de x0 (xₙ₋₁) y x1 (xₙ)."""
+    f = _funcion(expr)
+
+    res = ResultadoRaiz("secante", None, False, Historial(IteracionSecante), motivo=MAX_ITER)
+    agregar = res.historial.agregar
+    x_prev, x_curr = float(x0), float(x1)
+    f_prev = f(x_prev)
+    for i in range(1, imax + 1):
+        if cancelar is not None and cancelar():
+            res.motivo = CANCELADO
+            break
+
+        f_curr = f(x_curr)
+
+        if math.isnan(f_curr) or math.isnan(f_prev):
+            res.motivo = VALOR_NAN
+            break
+
+        denom = f_curr - f_prev
+        if abs(denom) < CERO:
+            res.motivo = DIVISION_CERO
+            break
+
+        x_next = x_curr - (f_curr * (x_curr - x_prev) / denom)
+        err = abs((x_next - x_curr) / x_next) * 100 if x_next != 0 else 100
+
+        agregar(i, x_prev, f_prev, x_curr, f_curr, x_next, err)
+        if al_iterar is not None:
+            al_iterar(res.historial)
+        x_prev, f_prev, x_curr = x_curr, f_curr, x_next
+
+        if abs(f_curr) < CERO or err < tol:
+            res.convergio, res.motivo = True, None
+            break
+
+    res.raiz = x_curr
+    return res
+
+
+METODOS = {
+    "biseccion": biseccion,
+    "falsa_posicion": falsa_posicion,
+    "newton_raphson": newton_raphson,
+    "secante": secante,
+}
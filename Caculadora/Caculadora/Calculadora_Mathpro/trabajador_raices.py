@@ -0,0 +1,78 @@
+import threading
+import time
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from metricas import medir
+
+# =============================================================================
+#  WORKER DE MÉTODOS DE RAÍCES (mismo modelo que ManimRenderer en derivadas.py)
+# =============================================================================
+#
+# El bucle del método corre en un hilo del QThreadPool. Cada ~16 ms (60 Hz)
+# se avisa a la interfaz cuántas filas tiene ya el historial (que se comparte,
+# no se copia), así la tabla crece mientras se calcula sin una señal por
+# iteración. El reporte también se arma aquí: no toca widgets.
+
+
+class WorkerSignals(QObject):
+    finished = pyqtSignal()
+    error = pyqtSignal(object)       # excepción (p. ej. ErrorBolzano)
+    result = pyqtSignal(object)      # (ResultadoRaiz, reporte)
+    filas = pyqtSignal(object, int)  # (Historial, filas completas hasta ahora)
+
+
+class TrabajadorRaiz(QRunnable):
+    """
+    Ejecuta metodo(*args, **kwargs) de solucionadores fuera del hilo de la interfaz.
+    reporte(res) (opcional) se llama en el mismo hilo al terminar.
+    """
+    INTERVALO_LOTE = 1.0 / 60
+
+    def __init__(self, metodo, *args, reporte=None, **kwargs):
+        super().__init__()
+        self.signals = WorkerSignals()
+        self.metodo = metodo
+        self.args = args
+        self.kwargs = kwargs
+        self.reporte = reporte
+        self._cancelado = threading.Event()
+        self._historial = None
+        self._enviadas = 0
+        self._ultimo_envio = 0.0
+
+    def cancelar(self):
+        self._cancelado.set()
+
+    @property
+    def cancelado(self) -> bool:
+        return self._cancelado.is_set()
+
+    def _acumular(self, historial):
+        self._historial = historial
+        ahora = time.perf_counter()
+        if ahora - self._ultimo_envio >= self.INTERVALO_LOTE:
+            self._ultimo_envio = ahora
+            self._enviar()
+
+    def _enviar(self):
+        if self._historial is not None:
+            n = len(self._historial)
+            if n > self._enviadas:
+                self._enviadas = n
+                self.signals.filas.emit(self._historial, n)
+
+    def run(self):
+        try:
+            with medir("raíces: bucle"):
+                res = self.metodo(*self.args, al_iterar=self._acumular,
+                                  cancelar=self._cancelado.is_set, **self.kwargs)
+            self._enviar()
+            with medir("raíces: reporte"):
+                reporte = self.reporte(res) if self.reporte is not None else None
+            self.signals.result.emit((res, reporte))
+        except Exception as e:
+            self.signals.error.emit(e)
+        finally:
+            self.signals.finished.emit()
+